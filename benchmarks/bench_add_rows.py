@@ -0,0 +1,63 @@
+"""Benchmark bulk row ingestion.
+
+Compares adding rows one add_row call at a time, which is what add_rows used
+to do, with a single add_rows call, copying the rows or keeping them, with and
+without validation, and into columnar storage.
+
+Usage: python benchmarks/bench_add_rows.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from collections.abc import Iterable
+
+from prettytable import PrettyTable
+
+FIELDS = ["id", "name", "score", "flag"]
+
+
+def make_rows(rows: int) -> list[tuple]:
+    return [(i, f"row {i}", i * 0.5, i % 2 == 0) for i in range(rows)]
+
+
+def one_at_a_time(rows: list[tuple]) -> None:
+    table = PrettyTable(FIELDS)
+    for row in rows:
+        table.add_row(row)
+
+
+def bulk(rows: Iterable[tuple], storage: str = "rows", **kwargs) -> None:
+    table = PrettyTable(FIELDS, storage=storage)
+    table.add_rows(rows, **kwargs)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = make_rows(count)
+    cases = {
+        "add_row per row": lambda: one_at_a_time(rows),
+        "add_rows": lambda: bulk(rows),
+        "add_rows, validate=False": lambda: bulk(rows, validate=False),
+        "add_rows, copy=False": lambda: bulk(rows, copy=False),
+        "add_rows, generator": lambda: bulk(tuple(row) for row in rows),
+        "add_rows, columnar": lambda: bulk(rows, storage="columnar"),
+    }
+
+    results = PrettyTable(["Benchmark", "Time (s)", "Speedup"])
+    results.align = "r"
+    results.align["Benchmark"] = "l"
+    results.float_format = ".3"
+    baseline = None
+    for name, stmt in cases.items():
+        seconds = min(timeit.repeat(stmt, number=1, repeat=3))
+        if baseline is None:
+            baseline = seconds
+        results.add_row([name, seconds, f"{baseline / seconds:.1f}x"])
+    print(f"{count} rows")
+    print(results)
+
+
+if __name__ == "__main__":
+    main()
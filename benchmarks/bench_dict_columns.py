@@ -0,0 +1,85 @@
+"""Benchmark dictionary-encoded columns.
+
+Builds a table of low-cardinality string columns, like status, region and host,
+whose cells are separate string objects as they would be when read from a file.
+Compares memory use and render time for row storage, for columnar storage with
+those columns kept as plain lists, which is what columnar storage used to do,
+and for columnar storage with them dictionary-encoded.
+
+Usage: python benchmarks/bench_dict_columns.py [rows]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Any, cast
+
+from prettytable import PrettyTable
+from prettytable.prettytable import _ColumnStore, _DictColumn
+
+FIELDS = ["id", "status", "region", "host"]
+
+
+def make_rows(rows: int) -> list[list]:
+    rng = random.Random(0)
+    statuses = ["ok", "warn", "error", "unknown"]
+    regions = [f"region-{n}" for n in range(12)]
+    hosts = [f"host-{n:02}.example.com" for n in range(40)]
+    return [
+        # "".join makes a new string object for every cell
+        [
+            i,
+            "".join(rng.choice(statuses)),
+            "".join(rng.choice(regions)),
+            "".join(rng.choice(hosts)),
+        ]
+        for i in range(rows)
+    ]
+
+
+def build(rows: list[list], storage: str, encode: bool = True) -> PrettyTable:
+    table = PrettyTable(FIELDS, storage=storage)
+    table.add_rows(rows, copy=False)
+    if not encode:
+        # Keep the cells as they were added instead
+        store = cast(_ColumnStore, table._rows)
+        for index, column in enumerate(store.columns):
+            if isinstance(column, _DictColumn):
+                store.columns[index] = [row[index] for row in rows]
+    return table
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    cases: dict[str, dict[str, Any]] = {
+        "rows": {"storage": "rows"},
+        "columnar, lists": {"storage": "columnar", "encode": False},
+        "columnar, encoded": {"storage": "columnar"},
+    }
+
+    results = PrettyTable(
+        ["Storage", "Memory (MB)", "get_string (s)", "get_html_string (s)"]
+    )
+    results.align = "r"
+    results.align["Storage"] = "l"
+    results.float_format = ".3"
+    for name, kwargs in cases.items():
+        # Rows are made afresh inside the measurement, so that what the table
+        # keeps of them is counted
+        tracemalloc.start()
+        table = build(make_rows(count), **kwargs)
+        memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+        text = min(timeit.repeat(table.get_string, number=1, repeat=3))
+        html = min(timeit.repeat(table.get_html_string, number=1, repeat=3))
+        results.add_row([name, memory, text, html])
+        del table
+    print(f"{count} rows")
+    print(results)
+
+
+if __name__ == "__main__":
+    main()
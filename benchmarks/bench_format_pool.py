@@ -0,0 +1,88 @@
+"""Benchmark parallel row formatting with expensive custom_format functions.
+
+Renders the same table with format_workers set to 1, 2, 4, ... up to the
+number of cores (4 at least), on thread and process pools, for a formatter
+that waits (like a lookup over the network) and one that computes (like a
+currency conversion with heavy rounding rules). Rows are split into four
+chunks per worker.
+
+Usage: python benchmarks/bench_format_pool.py [rows]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import timeit
+
+from prettytable import PrettyTable
+
+
+def waiting(field: str, value: int) -> str:
+    time.sleep(0.0002)
+    return f"{value:,}"
+
+
+def computing(field: str, value: int) -> str:
+    total = 0
+    for i in range(2_000):
+        total += (value * i) % 7
+    return f"{value:,} ({total})"
+
+
+def make_table(rows: int) -> PrettyTable:
+    table = PrettyTable(["id", "amount"])
+    table.add_rows([[i, i * 37] for i in range(rows)])
+    return table
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    cores = os.cpu_count() or 1
+    # Threads waiting on I/O can scale past the core count, so go to 4 at least
+    limit = max(cores, 4)
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= limit:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != limit:
+        worker_counts.append(limit)
+
+    table = make_table(rows)
+    results = PrettyTable(["Formatter", "Pool", "Workers", "Time (s)", "Speedup"])
+    results.align = "r"
+    results.align["Formatter"] = results.align["Pool"] = "l"
+    results.float_format = ".3"
+    for formatter in (waiting, computing):
+        table.custom_format["amount"] = formatter
+        for pool in ("thread", "process"):
+            serial = None
+            for workers in worker_counts:
+                seconds = min(
+                    timeit.repeat(
+                        lambda: table.get_string(
+                            format_workers=workers,
+                            format_pool=pool,
+                            format_chunk_size=max(1, rows // (workers * 4)),
+                        ),
+                        number=1,
+                        repeat=3,
+                    )
+                )
+                if serial is None:
+                    serial = seconds
+                results.add_row(
+                    [
+                        formatter.__name__,
+                        pool,
+                        workers,
+                        seconds,
+                        f"{serial / seconds:.1f}x",
+                    ]
+                )
+    print(f"{rows} rows, {cores} cores")
+    print(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark printing the top k rows of a sorted table.
+
+Times get_string(sortby=..., end=k) with the rows picked out by a heap, and
+with every row sorted first, which is what printing a sorted table used to
+do, for tables of several sizes.
+
+Usage: python benchmarks/bench_top_k.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from unittest import mock
+
+import prettytable.prettytable
+from prettytable import PrettyTable
+
+TOP = [10, 100, 1000]
+
+
+def make_table(rows: int) -> PrettyTable:
+    rng = random.Random(0)
+    table = PrettyTable(["id", "name", "score"])
+    table.add_rows(
+        [[i, f"item-{rng.randrange(1000)}", rng.random()] for i in range(rows)]
+    )
+    return table
+
+
+def render(table: PrettyTable, k: int) -> None:
+    table.get_string(sortby="score", reversesort=True, end=k)
+
+
+def best(stmt, repeat: int = 3) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=repeat))
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    results = PrettyTable(["Rows", "k", "Full sort (s)", "Heap (s)", "Speedup"])
+    results.align = "r"
+    results.float_format = ".4"
+    for rows in sizes:
+        table = make_table(rows)
+        for k in TOP:
+            heap = best(lambda: render(table, k))
+            with mock.patch.object(
+                prettytable.prettytable, "_PARTIAL_SORT_RATIO", sys.maxsize
+            ):
+                full = best(lambda: render(table, k))
+            results.add_row([rows, k, full, heap, f"{full / heap:.1f}x"])
+    print(results)
+
+
+if __name__ == "__main__":
+    main()
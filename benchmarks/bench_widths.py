@@ -0,0 +1,64 @@
+"""Benchmark display width measurement on ASCII-heavy tables.
+
+Compares the wcwidth-based measurement every string used to go through with
+the ASCII fast path, for single values, for whole columns, and for a full
+get_string() render.
+
+Usage: python benchmarks/bench_widths.py [rows]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+
+import wcwidth  # type: ignore[import-untyped]
+
+from prettytable import PrettyTable
+from prettytable.prettytable import _re, _str_block_width, _str_block_widths
+
+
+def wcwidth_only(val: str) -> int:
+    return wcwidth.wcswidth(_re.sub("", val))
+
+
+def make_columns(rows: int) -> dict[str, list[str]]:
+    rng = random.Random(0)
+    return {
+        "numeric": [f"{rng.uniform(-1e6, 1e6):.3f}" for _ in range(rows)],
+        "identifiers": [
+            f"host-{rng.randrange(10_000):05d}.eu-west-{rng.randrange(3)}"
+            for _ in range(rows)
+        ],
+    }
+
+
+def best(stmt, number: int = 1, repeat: int = 5) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=repeat))
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    columns = make_columns(rows)
+
+    results = PrettyTable(["Benchmark", "wcwidth (s)", "fast path (s)", "Speedup"])
+    results.align = "r"
+    results.align["Benchmark"] = "l"
+    results.float_format = ".4"
+    for name, values in columns.items():
+        slow = best(lambda: [wcwidth_only(v) for v in values])
+        fast = best(lambda: [_str_block_width(v) for v in values])
+        batch = best(lambda: _str_block_widths(values))
+        results.add_row([f"{name}: per value", slow, fast, f"{slow / fast:.1f}x"])
+        results.add_row([f"{name}: whole column", slow, batch, f"{slow / batch:.1f}x"])
+
+    table = PrettyTable(["id", *columns])
+    table.add_rows([list(row) for row in zip(range(rows), *columns.values())])
+    render = best(table.get_string, repeat=3)
+    results.add_row([f"get_string(), {rows} rows", "", render, ""])
+    print(results)
+
+
+if __name__ == "__main__":
+    main()
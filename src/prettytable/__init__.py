@@ -22,13 +22,16 @@ from .prettytable import (  # noqa: F401
     TableHandler,
     TableStyle,
     VRuleStyle,
+    WidthCache,
     _warn_deprecation,
     from_csv,
+    from_dataframe,
     from_db_cursor,
     from_html,
     from_html_one,
     from_json,
     from_mediawiki,
+    from_numpy,
 )
 
 __all__ = [
@@ -50,13 +53,16 @@ __all__ = [
     "TableHandler",
     "TableStyle",
     "VRuleStyle",
+    "WidthCache",
     "__version__",
     "from_csv",
+    "from_dataframe",
     "from_db_cursor",
     "from_html",
     "from_html_one",
     "from_json",
     "from_mediawiki",
+    "from_numpy",
 ]
 
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from .prettytable import PrettyTable
+from collections.abc import Iterator
+
+from .prettytable import OptionsType, PrettyTable
 
 try:
     from colorama import init
@@ -135,5 +137,11 @@ class ColorTable(PrettyTable):
             + theme.default_color
         )
 
-    def get_string(self, **kwargs) -> str:
-        return super().get_string(**kwargs) + RESET_CODE
+    def _iter_chunks(self, options: OptionsType) -> Iterator[str]:
+        # Hold back one chunk so the reset code can be appended to the last one
+        last = ""
+        for i, chunk in enumerate(super()._iter_chunks(options)):
+            if i:
+                yield last
+            last = chunk
+        yield last + RESET_CODE
@@ -33,19 +33,44 @@
 
 from __future__ import annotations
 
+import heapq
 import io
+import operator
+import pickle
 import re
+import sys
+import threading
 import warnings
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Sequence,
+)
 from enum import IntEnum
-from functools import lru_cache
 from html.parser import HTMLParser
-from typing import TYPE_CHECKING, Any, Final, Literal, TypedDict, cast
+from itertools import chain, compress, count, islice, repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Literal,
+    NamedTuple,
+    TypedDict,
+    cast,
+    overload,
+)
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from sqlite3 import Cursor
 
-    from _typeshed import SupportsRichComparison
+    from _typeshed import SupportsRichComparison, SupportsWrite
     from typing_extensions import Self, TypeAlias
 
 
@@ -94,6 +119,11 @@ RowType: TypeAlias = list[Any]
 AlignType: TypeAlias = Literal["l", "c", "r"]
 VAlignType: TypeAlias = Literal["t", "m", "b"]
 HeaderStyleType: TypeAlias = Literal["cap", "title", "upper", "lower", None]
+WidthCacheScopeType: TypeAlias = Literal["table", "render"]
+FormatPoolType: TypeAlias = Literal["thread", "process"]
+StorageType: TypeAlias = Literal["rows", "columnar", "disk"]
+IndexNumberingType: TypeAlias = Literal["original", "displayed"]
+IndexKindType: TypeAlias = Literal["hash", "sorted"]
 
 
 class OptionsType(TypedDict):
@@ -143,29 +173,1125 @@ class OptionsType(TypedDict):
     valign: dict[str, VAlignType]
     min_width: int | dict[str, int] | None
     max_width: int | dict[str, int] | None
+    fixed_width: int | dict[str, int] | None
+    width_sample: int | None
     none_format: str | dict[str, str | None] | None
     escape_header: bool
     escape_data: bool
     break_on_hyphens: bool
+    width_cache_size: int
+    width_cache_scope: WidthCacheScopeType
+    render_cache: bool
+    format_workers: int
+    format_pool: FormatPoolType
+    format_chunk_size: int
 
 
 _re = re.compile(r"\033\[[0-9;]*m|\033\(B")
 
 
-@lru_cache
 def _get_size(text: str) -> tuple[int, int]:
     lines = text.split("\n")
     height = len(lines)
-    width = max(_str_block_width(line) for line in lines)
+    width = max(_str_block_widths(lines))
     return width, height
 
 
+class _CellFormats(NamedTuple):
+    """The per-field formatting settings of a table, which is all a worker of
+    the formatting pool needs to format its rows"""
+
+    field_names: list[str]
+    int_format: dict[str, str]
+    float_format: dict[str, str]
+    custom_format: dict[str, Callable[[str, Any], str]]
+
+
+def _format_cell(field: str, value: Any, formats: _CellFormats) -> str:
+    if isinstance(value, int) and field in formats.int_format:
+        return (f"%{formats.int_format[field]}d") % value
+    elif isinstance(value, float) and field in formats.float_format:
+        return (f"%{formats.float_format[field]}f") % value
+
+    formatter = formats.custom_format.get(field)
+    if formatter is None:
+        return str(value)
+    return formatter(field, value)
+
+
+def _format_chunk(formats: _CellFormats, rows: Sequence[RowType]) -> list[list[str]]:
+    """Format a chunk of rows.  Module level, so process pools can pickle it."""
+    field_names = formats.field_names
+    return [
+        [_format_cell(field, value, formats) for field, value in zip(field_names, row)]
+        for row in rows
+    ]
+
+
+def _format_column(
+    field: str, values: Sequence[Any], formats: _CellFormats
+) -> Sequence[str]:
+    """Format a whole column, as _format_cell would each of its values."""
+    if isinstance(values, _DictColumn):
+        # Format each distinct value once, keeping the codes
+        formatted = _format_column(field, values.values, formats)
+        return _DictColumn(list(formatted), values.codes)
+    if (
+        field not in formats.int_format
+        and field not in formats.float_format
+        and field not in formats.custom_format
+    ):
+        return list(map(str, values))
+    if isinstance(values, array):
+        # Every value has the array's type, so the format is known up front
+        if values.typecode == "q" and field in formats.int_format:
+            template = f"%{formats.int_format[field]}d"
+            return [template % value for value in values]
+        if values.typecode == "d" and field in formats.float_format:
+            template = f"%{formats.float_format[field]}f"
+            return [template % value for value in values]
+    return [_format_cell(field, value, formats) for value in values]
+
+
+def _accept_all_rows(row: RowType) -> bool:
+    """The default row_filter"""
+    return True
+
+
+def _sort_by_field(row: RowType) -> SupportsRichComparison:
+    """The default sort_key.  Rows sorted with it are only compared by the value
+    of the sortby field, keeping rows with equal values in their order."""
+    return row[0]
+
+
+class _SortOrder(NamedTuple):
+    """The order of the rows sorted for printing, as positions in the table,
+    along with the settings it was sorted with.  With a limit, only that many
+    rows were picked out of the table."""
+
+    settings: tuple[Any, ...]
+    positions: array
+    limit: int | None = None
+
+
+def _renumbered(rows: Iterable[RowType], first: int) -> Iterator[RowType]:
+    """Number the rows from first in their virtual index column, in place"""
+    for number, row in enumerate(rows, first):
+        row[0] = number
+        yield row
+
+
+class _CellLayout(NamedTuple):
+    """A formatted cell split into lines, with the display width of each line"""
+
+    lines: list[str]
+    widths: list[int]
+    width: int
+    height: int
+
+
+def _layout_cell(
+    value: str, none_value: str | None, measure: bool, cache: WidthCache | None
+) -> _CellLayout:
+    if "\n" not in value:
+        if none_value is not None and value == "None":
+            value = none_value
+            if "\n" in value:
+                return _layout_cell(value, None, measure, cache)
+        width = _str_block_width(value, cache) if measure else 0
+        return _CellLayout([value], [width], width, 1)
+    lines = value.split("\n")
+    if none_value is not None and "None" in lines:
+        lines = "\n".join(
+            none_value if line == "None" else line for line in lines
+        ).split("\n")
+    if not measure:
+        return _CellLayout(lines, [0] * len(lines), 0, len(lines))
+    widths = [_str_block_width(line, cache) for line in lines]
+    return _CellLayout(lines, widths, max(widths), len(lines))
+
+
+def _layout_column(
+    values: Sequence[str],
+    none_value: str | None,
+    measure: bool,
+    cache: WidthCache | None,
+    escape: bool = False,
+) -> list[_CellLayout]:
+    if isinstance(values, _DictColumn):
+        # Lay out each distinct value once, and share the layouts
+        layouts = _layout_column(values.values, none_value, measure, cache, escape)
+        return [layouts[code] for code in values.codes]
+    if escape:
+        from html import escape as escape_html
+
+        values = [escape_html(value) for value in values]
+        if none_value is not None:
+            none_value = escape_html(none_value)
+    if none_value is not None:
+        lines = [none_value if value == "None" else value for value in values]
+    else:
+        lines = list(values)
+    if "\n" in "".join(lines):
+        return [_layout_cell(value, none_value, measure, cache) for value in values]
+    # Every cell is a single line, so the column can be measured in one go
+    widths = _str_block_widths(lines, cache) if measure else [0] * len(lines)
+    return [
+        _CellLayout([line], [width], width, 1) for line, width in zip(lines, widths)
+    ]
+
+
+_JUSTIFY: Final = {"l": str.ljust, "r": str.rjust, "c": str.center}
+
+# Options that affect the title, header and horizontal rules
+_FRAGMENT_OPTIONS: Final = (
+    "title",
+    "header",
+    "border",
+    "preserve_internal_border",
+    "hrules",
+    "vrules",
+    "padding_width",
+    "left_padding_width",
+    "right_padding_width",
+    "vertical_char",
+    "horizontal_char",
+    "junction_char",
+    "top_junction_char",
+    "bottom_junction_char",
+    "right_junction_char",
+    "left_junction_char",
+    "top_right_junction_char",
+    "top_left_junction_char",
+    "bottom_right_junction_char",
+    "bottom_left_junction_char",
+)
+# Number of memoized fragments kept per table
+_FRAGMENT_CACHE_SIZE: Final = 64
+# Rows formatted at a time when rows are laid out as they are printed
+_LAYOUT_BATCH_SIZE: Final = 256
+# Rows read at a time from a lazy row source
+_PULL_BATCH_SIZE: Final = 256
+# Bytes of rows kept in memory by storage="disk" unless told otherwise
+_DEFAULT_MEMORY_BUDGET: Final = 256 * 2**20
+# Rows read from disk at a time when iterating over them
+_SPILL_READ_SIZE: Final = 1024
+# Sorted tables printed only as far as end rows pick those out with a heap
+# instead of sorting them all, if the table has this many times as many rows
+_PARTIAL_SORT_RATIO: Final = 32
+# Rows added to a sorted index one at a time, rather than by sorting it again
+_INDEX_INSERT_LIMIT: Final = 64
+
+
+class _RowTemplate:
+    """Layout of a single-line row, compiled once per render from the column
+    widths, alignments, padding and border settings.
+
+    render() turns a row whose cells are all single lines that fit their columns
+    into text with one format call, and returns None for any other row so that
+    the caller can fall back to the general path."""
+
+    def __init__(
+        self,
+        fmt: str,
+        columns: list[tuple[int, int, AlignType]],
+        widths: list[int],
+        justify: Callable[[str, int, AlignType, int], str],
+    ) -> None:
+        self.fmt = fmt
+        self.columns = columns
+        self.widths = widths
+        self.justify = justify
+
+    def render(self, row: list[_CellLayout]) -> str | None:
+        for cell, width in zip(row, self.widths):
+            if cell.height != 1 or cell.width > width:
+                return None
+        bits: list[str] = []
+        for index, width, align in self.columns:
+            cell = row[index]
+            text = cell.lines[0]
+            if cell.width == len(text):
+                bits.append(_JUSTIFY[align](text, width))
+            else:
+                bits.append(self.justify(text, width, align, cell.width))
+        return self.fmt.format(*bits)
+
+
+class _RenderContext:
+    """The state of one plain text render: the options in force and what is
+    worked out from them and the rows, such as the column widths and rules.
+
+    It is passed along instead of being stored on the table, so concurrent
+    renders of the same table with different options don't interfere."""
+
+    def __init__(self, options: OptionsType) -> None:
+        self.options = options
+        self.widths: list[int] = []
+        self.hrule = ""
+        self.style_key: tuple[Any, ...] = ()
+        self.template: _RowTemplate | None = None
+        self.format_pool: Executor | None = None
+
+    def close(self) -> None:
+        """Shut down the pool of workers formatting rows, if there is one"""
+        if self.format_pool is not None:
+            self.format_pool.shutdown()
+            self.format_pool = None
+
+
+class _RenderedTable:
+    """The plain text of a table as last rendered, kept in three parts (title
+    and header, data rows, bottom border) so that rows appended later can be
+    rendered on their own and spliced in before the border.
+
+    key holds everything besides the rows that the text depends on; version and
+    rowcount record the state of the rows it was rendered from. shown is the
+    number of rows printed and last_row the layout of the last of them, which is
+    rendered again with a middle rule instead of the bottom one once more rows
+    follow it.
+
+    Instances are never changed once made, so a render can't see one half
+    updated by another thread."""
+
+    def __init__(
+        self,
+        key: tuple[Any, ...],
+        version: int,
+        rowcount: int,
+        shown: int,
+        last_row: list[_CellLayout] | None,
+        natural_widths: list[int],
+        ctx: _RenderContext,
+        bottom: str,
+        head: list[str],
+        body: list[str],
+        tail: list[str],
+        chunks: list[str],
+    ) -> None:
+        self.key = key
+        self.version = version
+        self.rowcount = rowcount
+        self.shown = shown
+        self.last_row = last_row
+        self.natural_widths = natural_widths
+        self.ctx = ctx
+        self.bottom = bottom
+        self.head = head
+        self.body = body
+        self.tail = tail
+        self.chunks = chunks
+
+
+# Array type codes for columns whose values all have exactly this type
+_TYPECODES: Final = {int: "q", float: "d"}
+# Most distinct values a dictionary-encoded column can hold
+_MAX_DICT_SIZE: Final = 2**16
+
+
+class _DictColumn(Sequence[Any]):
+    """A column of strings (and Nones) kept as an array of small integer codes
+    into a list of its distinct values, for storage="columnar".
+
+    Formatting and laying out the column only has to be done once per distinct
+    value, and each of those is stored once however many cells hold it."""
+
+    def __init__(self, values: list[Any], codes: array) -> None:
+        self.values = values
+        self.codes = codes
+        self._lookup: dict[Any, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.values.__getitem__, self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _DictColumn(self.values[:], self.codes[index])
+        return self.values[self.codes[index]]
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self.codes[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_DictColumn, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def tolist(self) -> list[Any]:
+        return list(self)
+
+    def append(self, value: Any) -> None:
+        self.extend((value,))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add values to the column, or raise TypeError for one that isn't a
+        string or None and OverflowError for too many distinct values.  Either
+        way, the column is left as it was."""
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._lookup = {
+                value: code for code, value in enumerate(self.values)
+            }
+        # Values not in the column yet, only added to it once all are checked
+        added: dict[Any, int] = {}
+        new_codes = []
+        for value in values:
+            code = lookup.get(value) if type(value) is str or value is None else -1
+            if code is None:
+                code = added.get(value)
+                if code is None:
+                    code = added[value] = len(self.values) + len(added)
+            elif code < 0:
+                msg = f"can't dictionary-encode {type(value).__name__} values"
+                raise TypeError(msg)
+            new_codes.append(code)
+        size = len(self.values) + len(added)
+        if size > _MAX_DICT_SIZE:
+            msg = "too many distinct values to dictionary-encode"
+            raise OverflowError(msg)
+        lookup.update(added)
+        self.values.extend(added)
+        if size > 256 and self.codes.typecode == "B":
+            self.codes = array("H", self.codes)
+        self.codes.extend(new_codes)
+
+    @classmethod
+    def encode(cls, values: Iterable[Any]) -> _DictColumn | None:
+        """Return values dictionary-encoded, or None if they can't be"""
+        column = cls([], array("B"))
+        try:
+            column.extend(values)
+        except (TypeError, OverflowError):
+            return None
+        return column
+
+
+def _pack_column(values: Iterable[Any]) -> MutableSequence[Any] | _DictColumn:
+    """Return values as an array if they are all ints or all floats (and fit in
+    one), dictionary-encoded if they are all strings or None, else as a list."""
+    if isinstance(values, array) and values.typecode in _TYPECODES.values():
+        return values[:]
+    values = list(values)
+    if values:
+        kind = type(values[0])
+        typecode = _TYPECODES.get(kind)
+        if typecode is not None and all(type(value) is kind for value in values):
+            try:
+                return array(typecode, values)
+            except OverflowError:
+                pass
+    encoded = _DictColumn.encode(values)
+    if encoded is not None:
+        return encoded
+    return values
+
+
+class _RowSource(NamedTuple):
+    """Rows added with add_rows(lazy=True), not read in yet"""
+
+    rows: Iterator[Sequence[Any]]
+    copy: bool
+    validate: bool
+
+
+class _PullLock:
+    """Held while rows are read in from lazy row sources, so that other threads
+    wait for them instead of finding the sources half read.  owner is the
+    thread holding it, whose own nested reads have nothing left to do.
+
+    Copies and unpickled tables get a new one.  They all compare equal, as the
+    lock is no part of what a table holds."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.owner: int | None = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _PullLock):
+            return True
+        return NotImplemented
+
+    def __reduce__(self) -> tuple[type[_PullLock], tuple[()]]:
+        return _PullLock, ()
+
+
+class _ColumnStore:
+    """Rows kept as one sequence per field, for storage="columnar".
+
+    Columns of ints or floats are packed into arrays for as long as every value
+    in them has exactly that type; a value of another type, or an int too big
+    for 64 bits, turns the column into a list.  Likewise, columns of strings
+    and Nones are dictionary-encoded for as long as they have no more than
+    _MAX_DICT_SIZE distinct values.
+
+    It stands in for the list of row lists otherwise used: its length is the
+    number of rows, and indexing, slicing and iterating give rows as new lists.
+    Changing those lists doesn't change the table."""
+
+    def __init__(self) -> None:
+        self.columns: list[MutableSequence[Any] | _DictColumn] = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[RowType]:
+        if not self.columns:
+            return iter([[] for _ in range(self._length)])
+        return map(list, zip(*self.columns))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if not self.columns:
+                return [[] for _ in range(*index.indices(self._length))]
+            columns = [column[index] for column in self.columns]
+            return [list(row) for row in zip(*columns)]
+        if not -self._length <= index < self._length:
+            msg = "list index out of range"
+            raise IndexError(msg)
+        return [column[index] for column in self.columns]
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            removed = len(range(self._length)[index])
+        elif -self._length <= index < self._length:
+            removed = 1
+        else:
+            msg = "list assignment index out of range"
+            raise IndexError(msg)
+        for column in self.columns:
+            del column[index]
+        self._length -= removed
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _ColumnStore):
+            return self.columns == other.columns and self._length == other._length
+        return NotImplemented
+
+    def append(self, row: Sequence[Any]) -> None:
+        if not self._length:
+            self.columns = [_pack_column([value]) for value in row]
+            self._length = 1
+            return
+        columns = self.columns
+        for index, value in enumerate(row):
+            column = columns[index]
+            if isinstance(column, array):
+                if _TYPECODES.get(type(value)) == column.typecode:
+                    try:
+                        column.append(value)
+                        continue
+                    except OverflowError:
+                        pass
+                column = columns[index] = column.tolist()
+            elif isinstance(column, _DictColumn):
+                try:
+                    column.append(value)
+                    continue
+                except (TypeError, OverflowError):
+                    column = columns[index] = column.tolist()
+            column.append(value)
+        self._length += 1
+
+    def extend(self, rows: Sequence[Sequence[Any]]) -> None:
+        if not rows:
+            return
+        if not self._length:
+            self.columns = [_pack_column(values) for values in zip(*rows)]
+            self._length = len(rows)
+            return
+        columns = self.columns
+        for index, values in enumerate(zip(*rows)):
+            column = columns[index]
+            if isinstance(column, array):
+                packed = _pack_column(values)
+                if isinstance(packed, array) and packed.typecode == column.typecode:
+                    column.extend(packed)
+                    continue
+                column = columns[index] = column.tolist()
+            elif isinstance(column, _DictColumn):
+                try:
+                    column.extend(values)
+                    continue
+                except (TypeError, OverflowError):
+                    column = columns[index] = column.tolist()
+            column.extend(values)
+        self._length += len(rows)
+
+    def compress(self, keep: Sequence[bool]) -> None:
+        """Keep only the rows for which keep is true, like itertools.compress"""
+        columns: list[MutableSequence[Any] | _DictColumn] = []
+        for column in self.columns:
+            if isinstance(column, array):
+                columns.append(array(column.typecode, compress(column, keep)))
+            elif isinstance(column, _DictColumn):
+                codes = array(column.codes.typecode, compress(column.codes, keep))
+                columns.append(_DictColumn(column.values, codes))
+            else:
+                columns.append(list(compress(column, keep)))
+        self.columns = columns
+        self._length = sum(keep)
+
+    def insert_column(self, index: int, values: Sequence[Any]) -> None:
+        if not self._length:
+            # Like appending to the rows of an empty table, this makes new rows
+            self.columns = []
+            self._length = len(values)
+        self.columns.insert(index, _pack_column(values))
+
+    def del_column(self, index: int) -> None:
+        if self._length:
+            del self.columns[index]
+        else:
+            # An empty table may have no columns yet; they're made with its rows
+            self.columns = []
+
+
+def _row_size(row: Sequence[Any]) -> int:
+    """Roughly how many bytes a row takes up in memory"""
+    return sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+
+
+class _SpillStore:
+    """Rows kept in a list until they take up more than budget bytes (roughly,
+    going by sys.getsizeof), with the rest pickled to a temporary file, for
+    storage="disk".
+
+    The data file is only ever appended to.  A second file holds the start and
+    end offset of every row in it, and both are memory-mapped for reading, so
+    any row can be read without reading those before it.  Replacing a row on
+    disk appends the new one and points its index entry at it, while rewrite()
+    replaces every row at once, writing new files in a single pass.
+
+    It stands in for the list of row lists otherwise used.  Rows read from disk
+    are new lists, so changing them doesn't change the table: assign them back
+    instead.  Reading rows and appending them can be done from several threads
+    at once, as the files are only remapped under a lock."""
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self._lock = threading.RLock()
+        self._head: list[RowType] = []
+        self._head_size = 0
+        self._spilled = 0
+        self._data: Any = None
+        self._index: Any = None
+        self._data_end = 0
+        # Offsets of rows written since the index file was last written to
+        self._pending = array("q")
+        self._data_map: Any = None
+        self._index_map: Any = None
+        self._offsets: memoryview | None = None
+
+    def __len__(self) -> int:
+        return len(self._head) + self._spilled
+
+    def __iter__(self) -> Iterator[RowType]:
+        return self.iter_range(0, None)
+
+    def iter_range(self, start: int, end: int | None) -> Iterator[RowType]:
+        """Iterate over rows start to end (exclusive), reading no others"""
+        end = len(self) if end is None else min(end, len(self))
+        head = len(self._head)
+        if start < head:
+            yield from self._head[start : min(end, head)]
+        for first in range(max(start, head), end, _SPILL_READ_SIZE):
+            yield from self._read(
+                first - head, min(end, first + _SPILL_READ_SIZE) - head
+            )
+
+    @overload
+    def __getitem__(self, index: int) -> RowType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RowType]: ...
+
+    def __getitem__(self, index: int | slice) -> RowType | list[RowType]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return list(self.iter_range(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        index = self._check_index(index)
+        if index < len(self._head):
+            return self._head[index]
+        index -= len(self._head)
+        return self._read(index, index + 1)[0]
+
+    def __setitem__(self, index: int, row: Sequence[Any]) -> None:
+        index = self._check_index(index)
+        if index < len(self._head):
+            self._head_size += _row_size(row) - _row_size(self._head[index])
+            self._head[index] = cast(RowType, row)
+            return
+        self._flush()
+        start = self._data_end
+        self._write(row)
+        self._index.seek((index - len(self._head)) * 16)
+        self._index.write(array("q", [start, self._data_end]).tobytes())
+        self._index.seek(0, io.SEEK_END)
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                for position in reversed(range(start, stop, step)):
+                    del self[position]
+                return
+        else:
+            start = self._check_index(index)
+            stop = start + 1
+        head = len(self._head)
+        if stop > head and self._spilled:
+            # Shift the index entries after these ones down over them
+            first, last = max(start, head) - head, stop - head
+            self._flush()
+            self._unmap()
+            self._index.seek(last * 16)
+            rest = self._index.read()
+            self._index.seek(first * 16)
+            self._index.write(rest)
+            self._index.truncate()
+            self._spilled -= last - first
+        self._head_size -= sum(map(_row_size, self._head[start:stop]))
+        del self._head[start:stop]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _SpillStore):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __deepcopy__(self, memo: dict) -> _SpillStore:
+        import copy
+
+        new = _SpillStore(self.budget)
+        for row in self._head:
+            new.append(copy.deepcopy(row, memo))
+        # Rows read from disk are new objects already
+        new.extend(self.iter_range(len(self._head), None))
+        return new
+
+    def sort_rows(
+        self, rows: Iterable[RowType], key: Callable[[RowType], Any], reverse: bool
+    ) -> Iterator[RowType]:
+        """Sort rows like sorted(), in runs of about budget bytes spilled to disk
+        and merged back together, so they needn't all fit in memory at once"""
+        from operator import itemgetter
+
+        spilled = _SpillStore(0)
+        bounds = [0]
+        # Pairs of [key, row]
+        run: list[RowType] = []
+        size = 0
+        for row in rows:
+            # Call key once per row, as sorted() does
+            run.append([key(row), row])
+            size += _row_size(row)
+            if size > self.budget and len(run) >= _SPILL_READ_SIZE:
+                run.sort(key=itemgetter(0), reverse=reverse)
+                spilled.extend(run)
+                bounds.append(len(spilled))
+                run, size = [], 0
+        run.sort(key=itemgetter(0), reverse=reverse)
+        runs: list[Iterable[RowType]] = [
+            spilled.iter_range(start, end) for start, end in zip(bounds, bounds[1:])
+        ]
+        runs.append(run)
+        # Merging favours earlier runs on ties, so the sort stays stable
+        merged = heapq.merge(*runs, key=itemgetter(0), reverse=reverse)
+        return map(itemgetter(1), merged)
+
+    def rewrite(self, change: Callable[[RowType], RowType]) -> None:
+        """Replace every row with change(row), in order, writing the spilled ones
+        to new files in a single pass, so the space taken by rows replaced
+        before is freed too"""
+        with self._lock:
+            self._head = [change(row) for row in self._head]
+            self._head_size = sum(map(_row_size, self._head))
+            if self._data is None:
+                return
+            spilled = _SpillStore(0)
+            spilled.extend(map(change, self.iter_range(len(self._head), None)))
+            if spilled._data is None:
+                spilled._open()
+            self._unmap()
+            self._data.close()
+            self._index.close()
+            self._data, self._index = spilled._data, spilled._index
+            self._data_end = spilled._data_end
+            self._spilled = spilled._spilled
+            self._pending = spilled._pending
+
+    def append(self, row: RowType) -> None:
+        with self._lock:
+            self._append(row)
+
+    def extend(self, rows: Iterable[RowType]) -> None:
+        with self._lock:
+            for row in rows:
+                self._append(row)
+
+    def _append(self, row: RowType) -> None:
+        if self._data is None:
+            self._head_size += _row_size(row)
+            if self._head_size <= self.budget:
+                self._head.append(row)
+                return
+            self._open()
+        start = self._data_end
+        self._write(row)
+        self._pending.append(start)
+        self._pending.append(self._data_end)
+        self._spilled += 1
+        if len(self._pending) >= 2 * _SPILL_READ_SIZE:
+            self._index.write(self._pending.tobytes())
+            self._pending = array("q")
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "row index out of range"
+            raise IndexError(msg)
+        return index
+
+    def _open(self) -> None:
+        import tempfile
+
+        self._data = tempfile.TemporaryFile()
+        self._index = tempfile.TemporaryFile()
+
+    def _write(self, row: Sequence[Any]) -> None:
+        data = pickle.dumps(row, pickle.HIGHEST_PROTOCOL)
+        self._data.write(data)
+        self._data_end += len(data)
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._index.write(self._pending.tobytes())
+            self._pending = array("q")
+        self._data.flush()
+        self._index.flush()
+
+    def _unmap(self) -> None:
+        if self._offsets is not None:
+            self._offsets.release()
+            self._offsets = None
+        if self._index_map is not None:
+            self._index_map.close()
+            self._data_map.close()
+            self._index_map = self._data_map = None
+
+    def _read(self, first: int, last: int) -> list[RowType]:
+        """Read spilled rows first to last (exclusive) from disk"""
+        import mmap
+
+        with self._lock:
+            if (
+                self._pending
+                or self._data_map is None
+                or (
+                    len(self._data_map) != self._data_end
+                    or len(self._index_map) != self._spilled * 16
+                )
+            ):
+                self._flush()
+                self._unmap()
+                self._data_map = mmap.mmap(
+                    self._data.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self._index_map = mmap.mmap(
+                    self._index.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self._offsets = memoryview(self._index_map).cast("q")
+            assert self._offsets is not None
+            offsets = self._offsets[first * 2 : last * 2].tolist()
+            data = self._data_map
+            return [
+                pickle.loads(data[start:end])
+                for start, end in zip(offsets[::2], offsets[1::2])
+            ]
+
+
+# Operators that where() conditions can use, after the field name and "__"
+_COMPARISONS: Final[dict[str, Callable[[Any, Any], Any]]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+_WHERE_OPERATORS: Final = (*_COMPARISONS, "in")
+
+
+class _Condition(NamedTuple):
+    """One condition given to where(): the value of field compared with value
+    by operator, or for "in", looked up in value"""
+
+    field: str
+    operator: str
+    value: Any
+
+    def accepts(self, value: Any) -> bool:
+        """Whether value meets the condition.  A value that can't be compared
+        with doesn't."""
+        try:
+            if self.operator == "in":
+                return value in self.value
+            return bool(_COMPARISONS[self.operator](value, self.value))
+        except TypeError:
+            return False
+
+    def select(self, positions: Sequence[int], values: Sequence[Any]) -> list[int]:
+        """Return those of positions whose values, given in the same order, meet
+        the condition"""
+        if isinstance(values, _DictColumn):
+            # Test each distinct value once, then look up each row's result
+            accepted = [self.accepts(value) for value in values.values]
+            return list(compress(positions, map(accepted.__getitem__, values.codes)))
+        try:
+            if self.operator == "in":
+                return list(compress(positions, map(self.value.__contains__, values)))
+            comparison = _COMPARISONS[self.operator]
+            return list(
+                compress(positions, map(comparison, values, repeat(self.value)))
+            )
+        except TypeError:
+            # Some values can't be compared with, so go one at a time
+            return list(compress(positions, map(self.accepts, values)))
+
+
+def _column_values(
+    store: list[RowType] | _ColumnStore | _SpillStore,
+    index: int,
+    positions: Sequence[int],
+) -> Sequence[Any]:
+    """Return the values of one column of store at positions, straight from the
+    column with columnar storage"""
+    if not positions:
+        return []
+    every_row = positions == range(len(store))
+    if isinstance(store, _ColumnStore):
+        column = store.columns[index]
+        if every_row:
+            return column
+        if isinstance(positions, range) and positions.step == 1:
+            return column[positions.start : positions.stop]
+        if isinstance(column, _DictColumn):
+            codes = array(
+                column.codes.typecode, map(column.codes.__getitem__, positions)
+            )
+            return _DictColumn(column.values, codes)
+        return list(map(column.__getitem__, positions))
+    if every_row:
+        return [row[index] for row in store]
+    if isinstance(positions, range) and positions.step == 1:
+        start, stop = positions.start, positions.stop
+        if isinstance(store, _SpillStore):
+            return [row[index] for row in store.iter_range(start, stop)]
+        return [row[index] for row in store[start:stop]]
+    return [store[position][index] for position in positions]
+
+
+def _positions_between(
+    positions: Sequence[int], start: int, end: int | None
+) -> Sequence[int]:
+    """Return those of the ascending positions from start up to end"""
+    first = bisect_left(positions, start)
+    last = len(positions) if end is None else bisect_left(positions, end)
+    return positions[first:last]
+
+
+def _intersection(positions: Sequence[int], others: Sequence[int]) -> list[int]:
+    """Return those of the ascending positions that are also in others"""
+    wanted = set(others)
+    return [position for position in positions if position in wanted]
+
+
+class _HashIndex:
+    """The positions of the rows with each value of one field, for
+    create_index(kind="hash").  The values have to be hashable.
+
+    It indexes the first rowcount rows of the table, to be given the values of
+    the rows after those as they are added."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.positions: dict[Any, list[int]] = {}
+        self.rowcount = 0
+
+    def add(self, values: Sequence[Any]) -> None:
+        """Index the values of the next rows of the table"""
+        positions = self.positions
+        for position, value in enumerate(values, self.rowcount):
+            found = positions.get(value)
+            if found is None:
+                positions[value] = [position]
+            else:
+                found.append(position)
+        self.rowcount += len(values)
+
+    def remove(self, position: int) -> None:
+        """Forget the row at position, which the table has deleted, and move the
+        rows after it up one"""
+        if position >= self.rowcount:
+            return
+        emptied = []
+        for value, found in self.positions.items():
+            at = bisect_left(found, position)
+            if at < len(found) and found[at] == position:
+                del found[at]
+                if not found:
+                    emptied.append(value)
+            found[at:] = [later - 1 for later in found[at:]]
+        for value in emptied:
+            del self.positions[value]
+        self.rowcount -= 1
+
+    def find(
+        self, conditions: list[_Condition]
+    ) -> tuple[list[int] | None, list[_Condition]]:
+        """Return the ascending positions of the rows meeting the first of
+        conditions the index can answer, eq or in, and the other conditions.
+        Without one of those, the positions are None."""
+        for number, condition in enumerate(conditions):
+            if condition.operator in ("eq", "in"):
+                break
+        else:
+            return None, conditions
+        rest = conditions[:number] + conditions[number + 1 :]
+        values = (condition.value,) if condition.operator == "eq" else condition.value
+        found: set[int] = set()
+        for value in values:
+            try:
+                found.update(self.positions.get(value, ()))
+            except TypeError:
+                # Unhashable, so not equal to any value in the index
+                pass
+        return sorted(found), rest
+
+
+class _SortedIndex:
+    """The values of one field in order, with the position of the row each is
+    in, for create_index(kind="sorted").  The values have to be comparable with
+    one another.
+
+    It indexes the first rowcount rows of the table, to be given the values of
+    the rows after those as they are added."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.keys: list[Any] = []
+        self.positions = array("q")
+        self.rowcount = 0
+
+    def add(self, values: Sequence[Any]) -> None:
+        """Index the values of the next rows of the table, keeping rows with equal
+        values in the order of their positions"""
+        first = self.rowcount
+        if len(values) <= _INDEX_INSERT_LIMIT:
+            keys, positions = self.keys, self.positions
+            for position, value in enumerate(values, first):
+                at = bisect_right(keys, value)
+                keys.insert(at, value)
+                positions.insert(at, position)
+        else:
+            keys = self.keys + list(values)
+            positions = self.positions + array("q", range(first, first + len(values)))
+            # The sort is stable, so equal values stay in order of position
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self.keys = [keys[number] for number in order]
+            self.positions = array("q", map(positions.__getitem__, order))
+        self.rowcount += len(values)
+
+    def remove(self, position: int) -> None:
+        """Forget the row at position, which the table has deleted, and move the
+        rows after it up one"""
+        if position >= self.rowcount:
+            return
+        at = self.positions.index(position)
+        del self.keys[at]
+        del self.positions[at]
+        self.positions = array(
+            "q", [later - (later > position) for later in self.positions]
+        )
+        self.rowcount -= 1
+
+    def find(
+        self, conditions: list[_Condition]
+    ) -> tuple[list[int] | None, list[_Condition]]:
+        """Return the ascending positions of the rows meeting all of conditions
+        that compare with a value, or else the first in, and the other
+        conditions.  Without one of those, the positions are None."""
+        keys = self.keys
+        low, high = 0, len(keys)
+        rest = []
+        found = False
+        try:
+            for condition in conditions:
+                operator, value = condition.operator, condition.value
+                if operator in ("eq", "ge", "gt"):
+                    bisect = bisect_left if operator != "gt" else bisect_right
+                    low = max(low, bisect(keys, value))
+                if operator in ("eq", "le", "lt"):
+                    bisect = bisect_right if operator != "lt" else bisect_left
+                    high = min(high, bisect(keys, value))
+                if operator in ("eq", "ge", "gt", "le", "lt"):
+                    found = True
+                else:
+                    rest.append(condition)
+        except TypeError:
+            # Not comparable with the values in the index, so equal to none
+            return [], []
+        if found:
+            return sorted(self.positions[low:high]), rest
+        for number, condition in enumerate(rest):
+            if condition.operator == "in":
+                break
+        else:
+            return None, rest
+        positions: set[int] = set()
+        for value in condition.value:
+            try:
+                low, high = bisect_left(keys, value), bisect_right(keys, value)
+            except TypeError:
+                continue
+            positions.update(self.positions[low:high])
+        return sorted(positions), rest[:number] + rest[number + 1 :]
+
+    def ordered(self, start: int, end: int | None, reverse: bool) -> Sequence[int]:
+        """Return the positions of the rows from start to end in order of their
+        values, as sorted() would put them, reading no further than end"""
+        if not reverse:
+            return self.positions[start:end]
+        # Go through the values from the highest, keeping rows with equal values
+        # in order of their positions
+        keys, positions = self.keys, self.positions
+        descending: list[int] = []
+        high = len(keys)
+        while high and (end is None or len(descending) < end):
+            low = bisect_left(keys, keys[high - 1], 0, high)
+            descending += positions[low:high]
+            high = low
+        return descending[start:end]
+
+
 class PrettyTable:
     _xhtml: bool
     _align: dict[str, AlignType]
     _valign: dict[str, VAlignType]
     _min_width: dict[str, int]
     _max_width: dict[str, int]
+    _fixed_width: dict[str, int]
+    _width_sample: int | None
     _min_table_width: int | None
     _max_table_width: int | None
     _fields: Sequence[str | None] | None
@@ -209,9 +1335,25 @@ class PrettyTable:
     _escape_data: bool
     _style: TableStyle | None
     orgmode: bool
-    _widths: list[int]
-    _hrule: str
     _break_on_hyphens: bool
+    _width_cache_size: int
+    _width_cache_scope: WidthCacheScopeType
+    _width_cache: WidthCache | None
+    _render_cache: bool
+    _format_workers: int
+    _format_pool: FormatPoolType
+    _format_chunk_size: int
+    _rendered: _RenderedTable | None
+    _sort_order: _SortOrder | None
+    _where: list[_Condition]
+    _where_positions: array | None
+    _indexes: dict[str, _HashIndex | _SortedIndex]
+    _version: int
+    _storage: StorageType
+    _stored_rows: list[RowType] | _ColumnStore | _SpillStore
+    _memory_budget: int
+    _sources: list[_RowSource]
+    _virtual_index: IndexNumberingType | None
 
     def __init__(self, field_names: Sequence[str] | None = None, **kwargs) -> None:
         """Return a new PrettyTable instance
@@ -219,6 +1361,10 @@ class PrettyTable:
         Arguments:
 
         encoding - Unicode encoding scheme used to decode any encoded input
+        storage - keep the data as a list per row ("rows", the default), as a
+            sequence per field ("columnar"), or as a list per row that spills
+            to a temporary file once it outgrows memory_budget ("disk")
+        memory_budget - bytes of rows to keep in memory with storage="disk"
         title - optional table title
         field_names - list or tuple of field names
         fields - list or tuple of field names to include in displays
@@ -242,6 +1388,10 @@ class PrettyTable:
         max_table_width - maximum desired table width, in characters
         min_width - minimum desired field width, in characters
         max_width - maximum desired field width, in characters
+        fixed_width - field width, in characters, used whatever the width of the
+            data (longer values are wrapped)
+        width_sample - compute field widths from this many rows only, instead of
+            all of them (None)
         padding_width - number of spaces on either side of column data
             (only used if left and right paddings are None)
         left_padding_width - number of spaces on left hand side of column data
@@ -271,17 +1421,39 @@ class PrettyTable:
         reversesort - True or False to sort in descending or ascending order
         oldsortslice - Slice rows before sorting in the "old style"
         break_on_hyphens - Whether long lines are broken on hypens or not, default: True
+        width_cache_size - number of display widths of non-ASCII strings to cache
+            (0 disables caching)
+        width_cache_scope - keep the width cache for the life of the table ("table")
+            or start a new one for every render ("render")
+        render_cache - keep the last plain text rendering and reuse it, rendering
+            only the new rows after an append, and keep the sorted order of the
+            rows for printing them sorted again (True or False)
+        format_workers - number of workers formatting rows in parallel (0 or 1
+            formats them in the calling thread)
+        format_pool - kind of worker pool, "thread" or "process"
+        format_chunk_size - number of rows sent to a worker at a time
         """
         self.encoding = kwargs.get("encoding", "UTF-8")
+        self._storage = kwargs.get("storage", "rows")
+        self._validate_storage("storage", self._storage)
+        self._memory_budget = kwargs.get("memory_budget", _DEFAULT_MEMORY_BUDGET)
+        self._validate_nonnegative_int("memory_budget", self._memory_budget)
 
         # Data
         self._field_names: list[str] = []
-        self._rows: list[RowType] = []
+        # With a virtual index, the first field has no values in the rows
+        self._virtual_index = None
+        self._sources = []
+        self._pull_lock = _PullLock()
+        self._rows = self._new_row_store()
         self._dividers: list[bool] = []
+        self._where = []
+        self._indexes = {}
         self.align = {}
         self.valign = {}
         self.max_width = {}
         self.min_width = {}
+        self.fixed_width = {}
         self.int_format = {}
         self.float_format = {}
         self.custom_format = {}
@@ -333,18 +1505,24 @@ class PrettyTable:
             "valign",
             "max_width",
             "min_width",
+            "fixed_width",
+            "width_sample",
             "none_format",
             "escape_header",
             "escape_data",
             "break_on_hyphens",
+            "width_cache_size",
+            "width_cache_scope",
+            "render_cache",
+            "format_workers",
+            "format_pool",
+            "format_chunk_size",
         ]
 
         self._none_format: dict[str, str | None] = {}
         self._kwargs = {}
         if field_names:
             self.field_names = field_names
-        else:
-            self._widths: list[int] = []
 
         for option in self._options:
             if option in kwargs:
@@ -384,8 +1562,8 @@ class PrettyTable:
             self._reversesort = kwargs["reversesort"]
         else:
             self._reversesort = False
-        self._sort_key = kwargs["sort_key"] or (lambda x: x)
-        self._row_filter = kwargs["row_filter"] or (lambda x: True)
+        self._sort_key = kwargs["sort_key"] or _sort_by_field
+        self._row_filter = kwargs["row_filter"] or _accept_all_rows
 
         if kwargs["escape_data"] in (True, False):
             self._escape_data = kwargs["escape_data"]
@@ -435,6 +1613,22 @@ class PrettyTable:
             self._break_on_hyphens = kwargs["break_on_hyphens"]
         else:
             self._break_on_hyphens = True
+        if kwargs["width_cache_size"] is None:
+            self._width_cache_size = 4096
+        else:
+            self._width_cache_size = kwargs["width_cache_size"]
+        self._width_cache_scope = kwargs["width_cache_scope"] or "table"
+        self._width_sample = kwargs["width_sample"]
+        self._width_cache = None
+        self._fragments: dict[tuple[Any, ...], str] = {}
+        self._render_cache = kwargs["render_cache"] or False
+        self._rendered = None
+        self._sort_order = None
+        self._where_positions = None
+        self._version = 0
+        self._format_workers = kwargs["format_workers"] or 0
+        self._format_pool = kwargs["format_pool"] or "thread"
+        self._format_chunk_size = kwargs["format_chunk_size"] or 1000
 
     def _column_specific_args(self):
         # Column specific arguments, use property.setters
@@ -443,6 +1637,7 @@ class PrettyTable:
             "valign",
             "max_width",
             "min_width",
+            "fixed_width",
             "int_format",
             "float_format",
             "custom_format",
@@ -452,8 +1647,20 @@ class PrettyTable:
                 self, attr, (self._kwargs[attr] or {}) if attr in self._kwargs else {}
             )
 
-    def _justify(self, text: str, width: int, align: AlignType) -> str:
-        excess = width - _str_block_width(text)
+    def _justify(
+        self, text: str, width: int, align: AlignType, text_width: int | None = None
+    ) -> str:
+        if text_width is None:
+            text_width = _str_block_width(text)
+        if text_width == len(text):
+            # One column per character, so the str methods pad correctly
+            if align == "l":
+                return text.ljust(width)
+            elif align == "r":
+                return text.rjust(width)
+            else:
+                return text.center(width)
+        excess = width - text_width
         if align == "l":
             return text + excess * " "
         elif align == "r":
@@ -462,7 +1669,7 @@ class PrettyTable:
             if excess % 2:
                 # Uneven padding
                 # Put more space on right if text is of odd length...
-                if _str_block_width(text) % 2:
+                if text_width % 2:
                     return (excess // 2) * " " + text + (excess // 2 + 1) * " "
                 # and more space on left if text is of even length
                 else:
@@ -479,24 +1686,26 @@ class PrettyTable:
         elif name == "colcount":
             if self._field_names:
                 return len(self._field_names)
-            elif self._rows:
-                return len(self._rows[0])
+            elif self._has_rows():
+                return len(self._stored_rows[0])
             else:
                 return 0
         else:
             raise AttributeError(name)
 
     def __getitem__(self, index: int | slice) -> PrettyTable:
-        new = PrettyTable()
+        new = PrettyTable(storage=self._storage, memory_budget=self._memory_budget)
         new.field_names = self.field_names
+        new._virtual_index = self._virtual_index
+        new._where = self._where[:]
         for attr in self._options:
             setattr(new, "_" + attr, getattr(self, "_" + attr))
         setattr(new, "_align", getattr(self, "_align"))
         if isinstance(index, slice):
-            for row in self._rows[index]:
+            for row in self._read_rows(index):
                 new.add_row(row)
         elif isinstance(index, int):
-            new.add_row(self._rows[index])
+            new.add_row(self._read_rows(index))
         else:
             msg = f"Index {index} is invalid, must be an integer or slice"
             raise IndexError(msg)
@@ -538,13 +1747,18 @@ class PrettyTable:
             "end",
             "max_width",
             "min_width",
+            "fixed_width",
             "min_table_width",
             "max_table_width",
             "padding_width",
             "left_padding_width",
             "right_padding_width",
+            "width_cache_size",
+            "format_workers",
         ):
             self._validate_nonnegative_int(option, val)
+        elif option == "format_chunk_size":
+            self._validate_positive_int(option, val)
         elif option == "sortby":
             self._validate_field_name(option, val)
         elif option in ("sort_key", "row_filter"):
@@ -568,6 +1782,7 @@ class PrettyTable:
             "escape_header",
             "escape_data",
             "break_on_hyphens",
+            "render_cache",
         ):
             self._validate_true_or_false(option, val)
         elif option == "header_style":
@@ -596,6 +1811,12 @@ class PrettyTable:
             self._validate_single_char(option, val)
         elif option == "attributes":
             self._validate_attributes(option, val)
+        elif option == "width_cache_scope":
+            self._validate_width_cache_scope(option, val)
+        elif option == "width_sample":
+            self._validate_width_sample(option, val)
+        elif option == "format_pool":
+            self._validate_format_pool(option, val)
 
     def _validate_field_names(self, val):
         # Check for appropriate length
@@ -608,13 +1829,14 @@ class PrettyTable:
                     f"(actual) {len(val)}!={len(self._field_names)} (expected)"
                 )
                 raise ValueError(msg)
-        if self._rows:
+        if self._has_rows():
+            expected = len(self._stored_rows[0]) + self._index_width
             try:
-                assert len(val) == len(self._rows[0])
+                assert len(val) == expected
             except AssertionError:
                 msg = (
                     "Field name list has incorrect number of values, "
-                    f"(actual) {len(val)}!={len(self._rows[0])} (expected)"
+                    f"(actual) {len(val)}!={expected} (expected)"
                 )
                 raise ValueError(msg)
         # Check for uniqueness
@@ -660,6 +1882,13 @@ class PrettyTable:
             msg = f"Invalid value for {name}: {val}"
             raise ValueError(msg)
 
+    def _validate_positive_int(self, name, val):
+        try:
+            assert int(val) > 0
+        except AssertionError:
+            msg = f"Invalid value for {name}: {val}"
+            raise ValueError(msg)
+
     def _validate_true_or_false(self, name, val):
         try:
             assert val in (True, False)
@@ -745,12 +1974,84 @@ class PrettyTable:
             msg = "Attributes must be a dictionary of name/value pairs"
             raise TypeError(msg)
 
+    def _validate_width_sample(self, name, val):
+        if val is not None:
+            self._validate_nonnegative_int(name, val)
+
+    def _validate_index_numbering(self, name, val):
+        try:
+            assert val in ("original", "displayed")
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be original or displayed."
+            raise ValueError(msg)
+
+    def _validate_index_kind(self, name, val):
+        try:
+            assert val in ("hash", "sorted")
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be hash or sorted."
+            raise ValueError(msg)
+
+    def _validate_storage(self, name, val):
+        try:
+            assert val in ("rows", "columnar", "disk")
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be rows, columnar or disk."
+            raise ValueError(msg)
+
+    def _validate_format_pool(self, name, val):
+        try:
+            assert val in ("thread", "process")
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be thread or process."
+            raise ValueError(msg)
+
+    def _validate_width_cache_scope(self, name, val):
+        try:
+            assert val in ("table", "render")
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be table or render."
+            raise ValueError(msg)
+
     ##############################
     # ATTRIBUTE MANAGEMENT       #
     ##############################
     @property
     def rows(self) -> list[RowType]:
-        return self._rows[:]
+        if self._virtual_index is None:
+            return self._rows[:]
+        # New lists with the virtual index in front, to match field_names
+        return list(self._add_index(self._rows, 1))
+
+    @property
+    def _index_width(self) -> int:
+        """How many fields there are at the start with no values in the rows"""
+        return 0 if self._virtual_index is None else 1
+
+    @property
+    def _rows(self) -> list[RowType] | _ColumnStore | _SpillStore:
+        """All the rows, after reading in any lazy row sources"""
+        if self._sources:
+            self._pull_rows()
+        return self._stored_rows
+
+    @_rows.setter
+    def _rows(self, rows: list[RowType] | _ColumnStore | _SpillStore) -> None:
+        self._stored_rows = rows
+        self._sources = []
+
+    @property
+    def storage(self) -> StorageType:
+        """How the data is kept: a list per row ("rows"), a sequence per field
+        ("columnar") or a list per row spilling to disk ("disk"), as chosen when
+        the table was created"""
+        return self._storage
+
+    @property
+    def memory_budget(self) -> int:
+        """Bytes of rows kept in memory with storage="disk" before the rest go to
+        a temporary file, as chosen when the table was created"""
+        return self._memory_budget
 
     @property
     def dividers(self) -> list[bool]:
@@ -799,6 +2100,18 @@ class PrettyTable:
         if self._field_names:
             old_names = self._field_names[:]
         self._field_names = val
+        if self._where or self._indexes:
+            renamed = dict(zip(old_names or [], val))
+            self._where = [
+                condition._replace(field=renamed[condition.field])
+                for condition in self._where
+                if condition.field in renamed
+            ]
+            self._indexes = {
+                renamed[field]: index
+                for field, index in self._indexes.items()
+                if field in renamed
+            }
 
         self._column_specific_args()
 
@@ -900,6 +2213,40 @@ class PrettyTable:
             for field in self._field_names:
                 self._min_width[field] = val
 
+    @property
+    def fixed_width(self):
+        """Controls fixed width of fields, regardless of their data
+        Arguments:
+
+        fixed_width - fixed width integer"""
+        return self._fixed_width
+
+    @fixed_width.setter
+    def fixed_width(self, val) -> None:
+        if val is None or (isinstance(val, dict) and len(val) == 0):
+            self._fixed_width = {}
+        else:
+            self._validate_option("fixed_width", val)
+            for field in self._field_names:
+                self._fixed_width[field] = val
+
+    @property
+    def width_sample(self) -> int | None:
+        """Number of rows the field widths are computed from
+
+        Arguments:
+
+        width_sample - number of rows, or None to use all of them
+
+        Rows after the sample are laid out as they are printed, and values too
+        wide for their field are wrapped."""
+        return self._width_sample
+
+    @width_sample.setter
+    def width_sample(self, val: int | None) -> None:
+        self._validate_option("width_sample", val)
+        self._width_sample = val
+
     @property
     def min_table_width(self) -> int | None:
         return self._min_table_width
@@ -1503,6 +2850,98 @@ class PrettyTable:
         self._validate_option("break_on_hyphens", val)
         self._break_on_hyphens = val
 
+    @property
+    def width_cache_size(self) -> int:
+        """Number of display widths of non-ASCII strings to cache (0 disables it)"""
+        return self._width_cache_size
+
+    @width_cache_size.setter
+    def width_cache_size(self, val: int) -> None:
+        self._validate_option("width_cache_size", val)
+        self._width_cache_size = val
+
+    @property
+    def width_cache_scope(self) -> WidthCacheScopeType:
+        """Lifetime of the width cache: the whole table ("table") or one render
+        ("render")"""
+        return self._width_cache_scope
+
+    @width_cache_scope.setter
+    def width_cache_scope(self, val: WidthCacheScopeType) -> None:
+        self._validate_option("width_cache_scope", val)
+        self._width_cache_scope = val
+
+    @property
+    def render_cache(self) -> bool:
+        """Keep the last plain text rendering of the table and reuse it, and keep
+        the sorted order of the rows between renders
+
+        Arguments:
+
+        render_cache - True or False
+
+        Rows must only be changed through the table's methods while this is on,
+        as changes made to row lists in place are not noticed."""
+        return self._render_cache
+
+    @render_cache.setter
+    def render_cache(self, val: bool) -> None:
+        self._validate_option("render_cache", val)
+        self._render_cache = val
+        self._rendered = None
+
+    @property
+    def format_workers(self) -> int:
+        """Number of workers formatting rows in parallel
+
+        Arguments:
+
+        format_workers - number of workers, 0 or 1 to format rows in the calling
+            thread
+
+        Worth it when custom_format functions are slow, for tables with more rows
+        than format_chunk_size."""
+        return self._format_workers
+
+    @format_workers.setter
+    def format_workers(self, val: int) -> None:
+        self._validate_option("format_workers", val)
+        self._format_workers = val
+
+    @property
+    def format_pool(self) -> FormatPoolType:
+        """Kind of pool rows are formatted on
+
+        Arguments:
+
+        format_pool - "thread" (suits formatters that wait on I/O) or "process"
+            (suits CPU-bound formatters, which must then be picklable: no lambdas)"""
+        return self._format_pool
+
+    @format_pool.setter
+    def format_pool(self, val: FormatPoolType) -> None:
+        self._validate_option("format_pool", val)
+        self._format_pool = val
+
+    @property
+    def format_chunk_size(self) -> int:
+        """Number of rows sent to a formatting worker at a time
+
+        Arguments:
+
+        format_chunk_size - positive integer"""
+        return self._format_chunk_size
+
+    @format_chunk_size.setter
+    def format_chunk_size(self, val: int) -> None:
+        self._validate_option("format_chunk_size", val)
+        self._format_chunk_size = val
+
+    @property
+    def width_cache(self) -> WidthCache | None:
+        """The width cache used by the most recent render, for its statistics"""
+        return self._width_cache
+
     ##############################
     # OPTION MIXER               #
     ##############################
@@ -1638,34 +3077,166 @@ class PrettyTable:
     # DATA INPUT METHODS         #
     ##############################
 
-    def add_rows(self, rows: Iterable[RowType]) -> None:
+    def add_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        copy: bool = True,
+        validate: bool = True,
+        lazy: bool = False,
+    ) -> None:
         """Add rows to the table
 
         Arguments:
 
         rows - rows of data, should be an iterable of lists, each list with as many
-        elements as the table has fields"""
-        for row in rows:
-            self.add_row(row)
+        elements as the table has fields. Anything with a tolist() method that
+        returns such a list, like a 2-D memoryview or NumPy array, works too
+        copy - see add_row
+        validate - if False, don't check the number of values in each row. Only do
+        this for rows you know to have the right length
+        lazy - if True, don't read the rows now but as they are needed: printing
+        the first rows of the table only reads that many. Anything else that needs
+        all the rows, like sorting or counting them, reads them all in
+
+        With storage="disk", the rows are read and checked a batch at a time, so
+        the batches before one with a row of the wrong length are added all the
+        same."""
+        if lazy:
+            self._sources.append(_RowSource(iter(rows), copy, validate))
+            if not self._field_names:
+                self._pull_rows(1)
+            self._bump_version(append=True)
+            return
+        tolist = getattr(rows, "tolist", None)
+        if tolist is not None:
+            # The lists are made just for us, so there's no need to copy them
+            rows, copy = tolist(), False
+        if isinstance(self._rows, _SpillStore):
+            # Read them in a batch at a time rather than all into memory first
+            self._sources.append(_RowSource(iter(rows), copy, validate))
+            try:
+                self._pull_rows()
+            finally:
+                self._bump_version(append=True)
+            return
+        new_rows: list[RowType]
+        if copy and not isinstance(self._rows, _ColumnStore):
+            new_rows = list(map(list, rows))
+        elif isinstance(rows, list):
+            new_rows = cast(list[RowType], rows)
+        else:
+            new_rows = cast(list[RowType], list(rows))
+        if new_rows:
+            self._append_rows(new_rows, validate)
+            self._bump_version(append=True)
+
+    def _append_rows(self, rows: list[RowType], validate: bool) -> None:
+        if self._field_names:
+            expected = len(self._field_names) - self._index_width
+        else:
+            expected = len(rows[0])
+        if validate and set(map(len, rows)) != {expected}:
+            actual = next(len(row) for row in rows if len(row) != expected)
+            msg = (
+                "Row has incorrect number of values, "
+                f"(actual) {actual}!={expected} (expected)"
+            )
+            raise ValueError(msg)
+        if not self._field_names:
+            self.field_names = [f"Field {n + 1}" for n in range(0, expected)]
+        self._stored_rows.extend(rows)
+        self._dividers.extend([False] * len(rows))
+
+    def _pull_rows(self, count: int | None = None) -> None:
+        """Read rows in from the lazy row sources until the table has count rows,
+        or until they run out if count is None.
+
+        The sources stay in place until they run out, so other threads calling
+        this meanwhile wait for the rows rather than see none left to read."""
+        pull_lock = self._pull_lock
+        if pull_lock.owner == threading.get_ident():
+            return
+        with pull_lock.lock:
+            pull_lock.owner = threading.get_ident()
+            try:
+                sources = self._sources
+                while sources and (count is None or len(self._stored_rows) < count):
+                    source = sources[0]
+                    rows = islice(source.rows, _PULL_BATCH_SIZE)
+                    batch = cast(list[RowType], list(rows))
+                    if not batch:
+                        del sources[0]
+                        continue
+                    if source.copy and not isinstance(self._stored_rows, _ColumnStore):
+                        batch = list(map(list, batch))
+                    self._append_rows(batch, source.validate)
+            finally:
+                pull_lock.owner = None
+
+    def _has_rows(self) -> bool:
+        self._pull_rows(1)
+        return len(self._stored_rows) > 0
+
+    def _read_rows(self, index):
+        """Return self._rows[index], reading no further into lazy row sources than
+        a non-negative index needs"""
+        if isinstance(index, slice):
+            if (index.step or 1) > 0 and (index.start or 0) >= 0:
+                if index.stop is not None and index.stop >= 0:
+                    self._pull_rows(index.stop)
+                    return self._stored_rows[index]
+        elif index >= 0:
+            self._pull_rows(index + 1)
+            return self._stored_rows[index]
+        return self._rows[index]
+
+    def _iter_stored_rows(self) -> Iterable[RowType]:
+        """Return the rows to iterate over, reading from lazy row sources only as
+        the iteration gets to them"""
+        if not self._sources:
+            return self._stored_rows
+        return self._iter_pulled_rows()
+
+    def _iter_pulled_rows(self) -> Iterator[RowType]:
+        index = 0
+        while True:
+            if index >= len(self._stored_rows):
+                if not self._sources:
+                    return
+                self._pull_rows(index + 1)
+                continue
+            batch = self._stored_rows[index : index + _PULL_BATCH_SIZE]
+            index += len(batch)
+            yield from batch
 
-    def add_row(self, row: RowType, *, divider: bool = False) -> None:
+    def add_row(
+        self, row: Sequence[Any], *, divider: bool = False, copy: bool = True
+    ) -> None:
         """Add a row to the table
 
         Arguments:
 
         row - row of data, should be a list with as many elements as the table
-        has fields"""
+        has fields
+        copy - if False, store the list or tuple passed in as the row instead of a
+        copy of it. The table takes ownership of the row, so don't change it
+        afterwards"""
 
-        if self._field_names and len(row) != len(self._field_names):
+        expected = len(self._field_names) - self._index_width
+        if self._field_names and len(row) != expected:
             msg = (
                 "Row has incorrect number of values, "
-                f"(actual) {len(row)}!={len(self._field_names)} (expected)"
+                f"(actual) {len(row)}!={expected} (expected)"
             )
             raise ValueError(msg)
         if not self._field_names:
             self.field_names = [f"Field {n + 1}" for n in range(0, len(row))]
-        self._rows.append(list(row))
+        if self._sources:
+            self._pull_rows()
+        self._stored_rows.append(list(row) if copy else cast(RowType, row))
         self._dividers.append(divider)
+        self._bump_version(append=True)
 
     def del_row(self, row_index: int) -> None:
         """Delete a row from the table
@@ -1682,20 +3253,104 @@ class PrettyTable:
             raise IndexError(msg)
         del self._rows[row_index]
         del self._dividers[row_index]
+        position = row_index if row_index >= 0 else row_index + len(self._rows) + 1
+        virtual = self._field_names[0] if self._virtual_index is not None else None
+        for field, index in self._indexes.items():
+            if field == virtual:
+                # The rows after it are numbered one lower now
+                index.clear()
+            else:
+                index.remove(position)
+        self._bump_version(reindex=False)
 
-    def add_divider(self) -> None:
-        """Add a divider to the table"""
-        if len(self._dividers) >= 1:
-            self._dividers[-1] = True
+    def del_rows(self, indices: Iterable[int]) -> None:
+        """Delete rows from the table, in a single pass however many there are
 
-    def add_column(
-        self,
-        fieldname: str,
-        column: Sequence[Any],
-        align: AlignType = "c",
-        valign: VAlignType = "t",
-    ) -> None:
-        """Add a column to the table.
+        Arguments:
+
+        indices - The indices of the rows you want to delete.  Indexing starts at 0."""
+
+        keep = [True] * len(self._rows)
+        for row_index in indices:
+            if not -len(keep) <= row_index < len(keep):
+                msg = (
+                    f"Can't delete row at index {row_index}, "
+                    f"table only has {len(keep)} rows"
+                )
+                raise IndexError(msg)
+            keep[row_index] = False
+        self._keep_rows(keep)
+
+    def del_rows_where(self, predicate: Callable[[RowType], bool]) -> None:
+        """Delete the rows for which predicate returns True, in a single pass
+
+        Arguments:
+
+        predicate - a function which takes a row and returns a Boolean"""
+
+        rows = self._add_index(self._rows, 1)
+        self._keep_rows([not predicate(row) for row in rows])
+
+    def truncate(self, n: int) -> None:
+        """Delete all but the first n rows of the table.  Rows added with
+        add_rows(lazy=True) after those aren't read in at all.
+
+        Arguments:
+
+        n - The number of rows to keep."""
+
+        self._validate_nonnegative_int("n", n)
+        self._pull_rows(n)
+        self._sources = []
+        if n < len(self._stored_rows):
+            del self._stored_rows[n:]
+            del self._dividers[n:]
+            self._bump_version()
+
+    def keep_last(self, n: int) -> None:
+        """Delete all but the last n rows of the table
+
+        Arguments:
+
+        n - The number of rows to keep."""
+
+        self._validate_nonnegative_int("n", n)
+        excess = len(self._rows) - n
+        if excess > 0:
+            del self._rows[:excess]
+            del self._dividers[:excess]
+            self._bump_version()
+
+    def _keep_rows(self, keep: list[bool]) -> None:
+        """Keep only the rows (and their dividers) for which keep is true"""
+        if all(keep):
+            return
+        rows = self._rows
+        if isinstance(rows, _ColumnStore):
+            rows.compress(keep)
+        elif isinstance(rows, _SpillStore):
+            spilled = _SpillStore(rows.budget)
+            spilled.extend(compress(rows, keep))
+            self._rows = spilled
+        else:
+            self._rows = list(compress(rows, keep))
+        self._dividers = list(compress(self._dividers, keep))
+        self._bump_version()
+
+    def add_divider(self) -> None:
+        """Add a divider to the table"""
+        if len(self._dividers) >= 1:
+            self._dividers[-1] = True
+            self._bump_version(reindex=False)
+
+    def add_column(
+        self,
+        fieldname: str,
+        column: Sequence[Any],
+        align: AlignType = "c",
+        valign: VAlignType = "t",
+    ) -> None:
+        """Add a column to the table.
 
         Arguments:
 
@@ -1713,11 +3368,28 @@ class PrettyTable:
             self._field_names.append(fieldname)
             self._align[fieldname] = align
             self._valign[fieldname] = valign
-            for i in range(0, len(column)):
-                if len(self._rows) < i + 1:
-                    self._rows.append([])
-                    self._dividers.append(False)
-                self._rows[i].append(column[i])
+            if isinstance(self._rows, _ColumnStore):
+                if not self._rows:
+                    self._dividers = [False] * len(column)
+                self._rows.insert_column(len(self._rows.columns), column)
+            elif isinstance(self._rows, _SpillStore):
+                if self._rows:
+                    values = iter(column)
+                    self._rows.rewrite(lambda row: type(row)((*row, next(values))))
+                else:
+                    self._rows.extend([value] for value in column)
+                    self._dividers = [False] * len(column)
+            else:
+                for i in range(0, len(column)):
+                    if len(self._rows) < i + 1:
+                        self._rows.append([])
+                        self._dividers.append(False)
+                    row = self._rows[i]
+                    if isinstance(row, tuple):
+                        self._rows[i] = (*row, column[i])
+                    else:
+                        row.append(column[i])
+            self._bump_version(reindex=False)
         else:
             msg = (
                 f"Column length {len(column)} does not match number of rows "
@@ -1725,15 +3397,50 @@ class PrettyTable:
             )
             raise ValueError(msg)
 
-    def add_autoindex(self, fieldname: str = "Index") -> None:
+    def add_autoindex(
+        self,
+        fieldname: str = "Index",
+        *,
+        virtual: bool = False,
+        numbering: IndexNumberingType = "original",
+    ) -> None:
         """Add an auto-incrementing index column to the table.
         Arguments:
-        fieldname - name of the field to contain the new column of data"""
-        self._field_names.insert(0, fieldname)
+        fieldname - name of the field to contain the new column of data
+        virtual - if True, don't store the numbers in the rows but work them out
+        whenever the table is printed, so that they never go out of date
+        numbering - what a virtual index numbers rows by: their position in the
+        table ("original") or in the output, once sorted and filtered
+        ("displayed")
+
+        A virtual index is in the rows given by rows and passed to row_filter,
+        sort_key and del_rows_where, numbered by position in the table, just as a
+        stored one is.  Rows added afterwards leave it out."""
+        self._validate_index_numbering("numbering", numbering)
+        if virtual and self._virtual_index is not None:
+            msg = "Table already has a virtual index"
+            raise ValueError(msg)
+        if not virtual and numbering != "original":
+            msg = "Only a virtual index can be numbered by displayed position"
+            raise ValueError(msg)
+        # A virtual index is always the first field
+        self._field_names.insert(0 if virtual else self._index_width, fieldname)
         self._align[fieldname] = self._kwargs["align"] or "c"
         self._valign[fieldname] = self._kwargs["valign"] or "t"
-        for i, row in enumerate(self._rows):
-            row.insert(0, i + 1)
+        if virtual:
+            self._virtual_index = numbering
+        elif isinstance(self._rows, _ColumnStore):
+            self._rows.insert_column(0, range(1, len(self._rows) + 1))
+        elif isinstance(self._rows, _SpillStore):
+            numbers = count(1)
+            self._rows.rewrite(lambda row: type(row)((next(numbers), *row)))
+        else:
+            for i, row in enumerate(self._rows):
+                if isinstance(row, tuple):
+                    self._rows[i] = (i + 1, *row)
+                else:
+                    row.insert(0, i + 1)
+        self._bump_version(reindex=False)
 
     def del_column(self, fieldname: str) -> None:
         """Delete a column from the table
@@ -1751,25 +3458,238 @@ class PrettyTable:
             )
             raise ValueError(msg)
 
-        col_index = self._field_names.index(fieldname)
-        del self._field_names[col_index]
-        for row in self._rows:
-            del row[col_index]
+        col_index = self._field_names.index(fieldname) - self._index_width
+        del self._field_names[col_index + self._index_width]
+        self._where = [
+            condition for condition in self._where if condition.field != fieldname
+        ]
+        self._indexes.pop(fieldname, None)
+        if col_index < 0:
+            self._virtual_index = None
+        elif isinstance(self._rows, _ColumnStore):
+            self._rows.del_column(col_index)
+        elif isinstance(self._rows, _SpillStore):
+            self._rows.rewrite(
+                lambda row: type(row)((*row[:col_index], *row[col_index + 1 :]))
+            )
+        else:
+            for i, row in enumerate(self._rows):
+                if isinstance(row, tuple):
+                    self._rows[i] = row[:col_index] + row[col_index + 1 :]
+                else:
+                    del row[col_index]
+        self._bump_version(reindex=False)
 
     def clear_rows(self) -> None:
         """Delete all rows from the table but keep the current field names"""
 
-        self._rows = []
+        self._rows = self._new_row_store()
         self._dividers = []
+        self._bump_version()
+
+    def where(self, **conditions: Any) -> None:
+        """Print only the rows whose fields meet all of the given conditions, and
+        which row_filter also accepts.  Conditions are tested a column at a time,
+        so they are much faster than the same test in a row_filter.
+
+        Each keyword is a field name, optionally followed by "__" and one of the
+        operators eq (the default), ne, lt, le, gt, ge or in:
+
+            table.where(Population__gt=1_000_000, Area__le=2000)
+
+        Give field names that aren't keywords with **{"City name__in": names}.
+        A value that can't be compared with, such as None with lt, doesn't
+        match.  Calling where() again replaces the conditions, and where() with
+        none prints every row again.
+
+        Arguments:
+
+        conditions - field names and operators, with the values to compare to"""
+
+        where = []
+        for key, value in conditions.items():
+            field, operator = key, "eq"
+            head, _, tail = key.rpartition("__")
+            if key not in self._field_names and tail in _WHERE_OPERATORS:
+                field, operator = head, tail
+            if field not in self._field_names:
+                msg = f"Invalid field name: {field}"
+                raise ValueError(msg)
+            if operator == "in":
+                try:
+                    value = frozenset(value)
+                except TypeError:
+                    value = tuple(value)
+            where.append(_Condition(field, operator, value))
+        self._where = where
+        self._where_positions = None
+        self._sort_order = None
+        self._rendered = None
+
+    def _get_matching_positions(self) -> Sequence[int] | None:
+        """Return the positions of the rows that meet the where() conditions, or
+        None if there aren't any conditions.  They are kept until the table
+        changes."""
+        if not self._where:
+            return None
+        if self._where_positions is None:
+            self._where_positions = array("q", self._select(self._where))
+        return self._where_positions
+
+    def _select(self, conditions: list[_Condition]) -> Sequence[int]:
+        """Return the ascending positions of the rows meeting all of conditions,
+        found with the indexes on their fields where there are any and by testing
+        a column at a time otherwise"""
+        positions: Sequence[int] | None = None
+        remaining = []
+        for field in dict.fromkeys(condition.field for condition in conditions):
+            on_field = [
+                condition for condition in conditions if condition.field == field
+            ]
+            index = self._get_index(field)
+            if index is None:
+                remaining += on_field
+                continue
+            found, rest = index.find(on_field)
+            remaining += rest
+            if found is not None:
+                positions = (
+                    found if positions is None else _intersection(positions, found)
+                )
+        if positions is None:
+            positions = range(len(self._rows))
+        for condition in remaining:
+            values = self._field_values(condition.field, positions)
+            positions = condition.select(positions, values)
+        return positions
+
+    def _field_values(self, field: str, positions: Sequence[int]) -> Sequence[Any]:
+        """Return the values of field in the rows at positions"""
+        index = self._field_names.index(field) - self._index_width
+        if index < 0:
+            # The virtual index, numbering rows by position
+            return [position + 1 for position in positions]
+        return _column_values(self._rows, index, positions)
+
+    def _get_index(self, field: str) -> _HashIndex | _SortedIndex | None:
+        """Return the index on field, first indexing any rows added since it was
+        last used, or None if there isn't one.  An index that can't take the
+        values of those rows is dropped, and None returned, so that printing the
+        table and finding rows fall back to reading every row."""
+        index = self._indexes.get(field)
+        if index is not None and index.rowcount < len(self._rows):
+            added = range(index.rowcount, len(self._rows))
+            try:
+                index.add(self._field_values(field, added))
+            except TypeError:
+                del self._indexes[field]
+                return None
+        return index
+
+    def create_index(self, field: str, kind: IndexKindType = "hash") -> None:
+        """Index the rows by the value of a field, so that lookup(), range() and
+        where() can find rows without reading every one.  The index is kept up to
+        date as rows and columns are added, as columns are deleted, and as rows are
+        deleted one at a time by del_row(), in O(n) time for n rows.  After del_rows(),
+        del_rows_where(), truncate(), keep_last() or clear_rows() the whole table
+        is indexed again the next time it's used, which takes as long as creating
+        the index: O(n) time for a hash index and O(n log n) for a sorted one.
+        If rows added since have a value the index can't take, it is dropped then.
+
+        Arguments:
+
+        field - name of the field to index
+        kind - "hash", for finding equal values, or "sorted", which also finds
+            values in a range.  A hash index needs hashable values, a sorted
+            index values that can be compared with one another"""
+
+        self._validate_field_name("field", field)
+        self._validate_index_kind("kind", kind)
+        index = _HashIndex() if kind == "hash" else _SortedIndex()
+        index.add(self._field_values(field, range(len(self._rows))))
+        self._indexes[field] = index
+
+    def drop_index(self, field: str) -> None:
+        """Delete the index on a field, if there is one
+
+        Arguments:
+
+        field - name of the indexed field"""
+
+        self._indexes.pop(field, None)
+
+    def lookup(self, field: str, value: Any) -> list[int]:
+        """Return the indices of the rows in which field equals value, using the
+        index on field if there is one.  Indexing starts at 0.
+
+        Arguments:
+
+        field - name of the field to look in
+        value - the value to look for"""
+
+        self._validate_field_name("field", field)
+        return list(self._select([_Condition(field, "eq", value)]))
+
+    def range(self, field: str, low: Any = None, high: Any = None) -> list[int]:
+        """Return the indices of the rows in which field is at least low and less
+        than high, using the index on field if it is a sorted one.  Indexing
+        starts at 0.
+
+        Arguments:
+
+        field - name of the field to look in
+        low - the lowest value to find, or None for no lower limit
+        high - the value above the highest to find, or None for no upper limit"""
+
+        self._validate_field_name("field", field)
+        conditions = []
+        if low is not None:
+            conditions.append(_Condition(field, "ge", low))
+        if high is not None:
+            conditions.append(_Condition(field, "lt", high))
+        return list(self._select(conditions))
+
+    def _rows_at(self, positions: Iterable[int]) -> Iterator[RowType]:
+        """Yield the stored rows at positions, with the virtual index in front as
+        a new list if there is one"""
+        store = self._rows
+        if self._virtual_index is None:
+            return map(store.__getitem__, positions)
+        return ([position + 1, *store[position]] for position in positions)
 
     def clear(self) -> None:
         """Delete all rows and field names from the table, maintaining nothing but
         styling options"""
 
-        self._rows = []
+        self._rows = self._new_row_store()
         self._dividers = []
         self._field_names = []
-        self._widths = []
+        self._virtual_index = None
+        self._where = []
+        self._indexes = {}
+        self._bump_version()
+
+    def _new_row_store(self) -> list[RowType] | _ColumnStore | _SpillStore:
+        if self._storage == "columnar":
+            return _ColumnStore()
+        if self._storage == "disk":
+            return _SpillStore(self._memory_budget)
+        return []
+
+    def _bump_version(self, append: bool = False, reindex: bool = True) -> None:
+        """Record a change to the rows or columns of the table.
+
+        Anything but an append also drops the cached rendering, as that can only
+        be extended at the end, and the indexes, to be built again when next
+        used, unless reindex is False because they still hold."""
+        self._version += 1
+        self._sort_order = None
+        self._where_positions = None
+        if not append:
+            self._rendered = None
+            if reindex:
+                for index in self._indexes.values():
+                    index.clear()
 
     ##############################
     # MISC PUBLIC METHODS        #
@@ -1778,6 +3698,8 @@ class PrettyTable:
     def copy(self) -> Self:
         import copy
 
+        # Lazy row sources can't be copied, so read them in first
+        self._pull_rows()
         return copy.deepcopy(self)
 
     def get_formatted_string(self, out_format: str = "text", **kwargs) -> str:
@@ -1811,15 +3733,14 @@ class PrettyTable:
     ##############################
 
     def _format_value(self, field: str, value: Any) -> str:
-        if isinstance(value, int) and field in self._int_format:
-            return (f"%{self._int_format[field]}d") % value
-        elif isinstance(value, float) and field in self._float_format:
-            return (f"%{self._float_format[field]}f") % value
+        return _format_cell(field, value, self._get_cell_formats())
 
-        formatter = self._custom_format.get(field, (lambda f, v: str(v)))
-        return formatter(field, value)
+    def _get_cell_formats(self) -> _CellFormats:
+        return _CellFormats(
+            self._field_names, self._int_format, self._float_format, self._custom_format
+        )
 
-    def _compute_table_width(self, options) -> int:
+    def _compute_table_width(self, options, widths: list[int]) -> int:
         if options["vrules"] == VRuleStyle.FRAME:
             table_width = 2
         if options["vrules"] == VRuleStyle.ALL:
@@ -1831,30 +3752,55 @@ class PrettyTable:
             if not options["fields"] or (
                 options["fields"] and fieldname in options["fields"]
             ):
-                table_width += self._widths[index] + per_col_padding + 1
+                table_width += widths[index] + per_col_padding + 1
         return table_width
 
-    def _compute_widths(self, rows: list[list[str]], options: OptionsType) -> None:
+    def _compute_widths(
+        self,
+        rows: list[list[_CellLayout]],
+        ctx: _RenderContext,
+        any_rows: bool | None = None,
+    ) -> list[int]:
+        """Set the column widths for `rows` and return their natural widths."""
+        widths = self._get_natural_widths(rows, ctx.options, any_rows)
+        ctx.widths = self._fit_widths(list(widths), ctx.options)
+        return widths
+
+    def _get_natural_widths(
+        self,
+        rows: list[list[_CellLayout]],
+        options: OptionsType,
+        any_rows: bool | None = None,
+    ) -> list[int]:
+        """Return the column widths needed by the header and `rows`, before
+        the table-wide width limits are applied.
+
+        any_rows tells whether there are rows to print, when `rows` is only a
+        sample of them."""
         if options["header"] and options["use_header_width"]:
             widths = [_get_size(field)[0] for field in self._field_names]
         else:
             widths = len(self.field_names) * [0]
-
-        for row in rows:
-            for index, value in enumerate(row):
+        if any_rows is None:
+            any_rows = bool(rows)
+        fixed_width = options["fixed_width"] or {}
+        if isinstance(fixed_width, int):
+            fixed_width = dict.fromkeys(self._field_names, fixed_width)
+
+        if rows:
+            for index, column in enumerate(zip(*rows)):
                 fieldname = self.field_names[index]
-                if (
-                    value == "None"
-                    and (none_val := self.none_format.get(fieldname)) is not None
-                ):
-                    value = none_val
+                if fieldname in fixed_width:
+                    continue
                 if fieldname in self.max_width:
-                    widths[index] = max(
-                        widths[index],
-                        min(_get_size(value)[0], self.max_width[fieldname]),
-                    )
+                    max_width = self.max_width[fieldname]
+                    width = max(min(cell.width, max_width) for cell in column)
                 else:
-                    widths[index] = max(widths[index], _get_size(value)[0])
+                    width = max(cell.width for cell in column)
+                widths[index] = max(widths[index], width)
+
+        if any_rows:
+            for index, fieldname in enumerate(self.field_names):
                 if fieldname in self.min_width:
                     widths[index] = max(widths[index], self.min_width[fieldname])
 
@@ -1866,19 +3812,27 @@ class PrettyTable:
                         min_width = 3
                     widths[index] = max(min_width, widths[index])
 
-        self._widths = widths
+        for index, fieldname in enumerate(self.field_names):
+            if fieldname in fixed_width:
+                widths[index] = fixed_width[fieldname]
+
+        return widths
+
+    def _fit_widths(self, widths: list[int], options: OptionsType) -> list[int]:
+        """Scale natural column widths to the table-wide width limits."""
+        fitted = widths
 
         per_col_padding = sum(self._get_padding_widths(options))
         # Are we exceeding max_table_width?
         if self._max_table_width:
-            table_width = self._compute_table_width(options)
+            table_width = self._compute_table_width(options, widths)
             if table_width > self._max_table_width:
                 # Shrink widths in proportion
                 markup_chars = per_col_padding * len(widths) + len(widths) - 1
                 scale = (self._max_table_width - markup_chars) / (
                     table_width - markup_chars
                 )
-                self._widths = [max(1, int(w * scale)) for w in widths]
+                fitted = [max(1, int(w * scale)) for w in widths]
 
         # Are we under min_table_width or title width?
         if self._min_table_width or options["title"]:
@@ -1908,7 +3862,22 @@ class PrettyTable:
                 widths = [int(w * scale) for w in widths]
                 if sum(widths) < min_width:
                     widths[-1] += min_width - sum(widths)
-                self._widths = widths
+                fitted = widths
+
+        return fitted
+
+    def _get_width_cache(self, options: OptionsType) -> WidthCache | None:
+        size = options["width_cache_size"]
+        if not size:
+            return None
+        cache = self._width_cache
+        if (
+            options["width_cache_scope"] == "render"
+            or cache is None
+            or cache.maxsize != size
+        ):
+            cache = self._width_cache = WidthCache(size)
+        return cache
 
     def _get_padding_widths(self, options: OptionsType) -> tuple[int, int]:
         if options["left_padding_width"] is not None:
@@ -1929,28 +3898,234 @@ class PrettyTable:
 
         options - dictionary of option settings."""
 
+        sortby = options["sortby"]
+        if not sortby:
+            return list(self._iter_rows(options))
+
+        sortindex = self._field_names.index(sortby)
+        store = self._rows
+        index = self._get_index(sortby) if self._indexes else None
+        positions: Sequence[int]
+        if (
+            isinstance(index, _SortedIndex)
+            and options["sort_key"] is _sort_by_field
+            and options["row_filter"] is _accept_all_rows
+            and not options["oldsortslice"]
+            and not self._where
+        ):
+            # The index has the rows in order already
+            start, end = options["start"], options["end"]
+            positions = index.ordered(start, end, options["reversesort"])
+        elif isinstance(store, _SpillStore):
+            return self._get_spilled_rows(store, sortindex, options)
+        else:
+            positions = self._get_sort_order(sortindex, options).positions
+            # Slice if necessary
+            if not options["oldsortslice"]:
+                positions = positions[options["start"] : options["end"]]
+
+        rows = self._rows_at(positions)
+        return list(self._number_displayed(rows, options["start"] + 1))
+
+    def _get_sort_order(self, sortindex: int, options: OptionsType) -> _SortOrder:
+        """Sort the rows for printing, or rather their positions in the table, so
+        no row is copied.  With render_cache on, the order is kept until the table
+        next changes, and reused for as long as it is printed sorted the same way.
+        That is only done without a sort_key or row_filter, as those may give
+        different answers from one render to the next.
+
+        If only the first few rows will be printed, only those are sorted."""
+        sort_key, row_filter = options["sort_key"], options["row_filter"]
+        first, end, limit = 0, None, None
         if options["oldsortslice"]:
-            rows = self._rows[options["start"] : options["end"]]
+            first, end = options["start"], options["end"]
+        else:
+            limit = options["end"]
+        settings = (sortindex, options["reversesort"], first, end)
+        keep = (
+            options["render_cache"]
+            and sort_key is _sort_by_field
+            and row_filter is _accept_all_rows
+        )
+        cached = self._sort_order
+        if (
+            keep
+            and cached is not None
+            and cached.settings == settings
+            and (cached.limit is None or (limit is not None and limit <= cached.limit))
+        ):
+            return cached
+
+        store = self._rows
+        positions: Sequence[int] = range(len(store))[first:end]
+        matching = self._get_matching_positions()
+        if matching is not None:
+            positions = _positions_between(matching, first, end)
+        keys: Sequence[Any]
+        field = sortindex - self._index_width
+        if (
+            isinstance(store, _ColumnStore)
+            and store.columns
+            and field >= 0
+            and sort_key is _sort_by_field
+            and row_filter is _accept_all_rows
+        ):
+            # The values to sort by are all in one column already
+            keys = _column_values(store, field, positions)
+        else:
+            rows: Iterable[RowType]
+            if matching is None:
+                rows = self._add_index(store[first:end], first + 1)
+            else:
+                rows = self._rows_at(positions)
+            if row_filter is not _accept_all_rows:
+                kept = [
+                    (position, row)
+                    for position, row in zip(positions, rows)
+                    if row_filter(row)
+                ]
+                positions = [position for position, _ in kept]
+                rows = [row for _, row in kept]
+            if sort_key is _sort_by_field:
+                keys = [row[sortindex] for row in rows]
+            else:
+                # sort_key is given the value to sort by and then the whole row
+                keys = [sort_key([row[sortindex], *row]) for row in rows]
+
+        reverse = options["reversesort"]
+        order: list[int]
+        if limit is not None and limit * _PARTIAL_SORT_RATIO <= len(keys):
+            # Like sorted(...)[:limit], ties included
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            order = select(limit, range(len(keys)), key=keys.__getitem__)
         else:
-            rows = self._rows
+            order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+            limit = None
+        sort_order = _SortOrder(
+            settings, array("q", map(positions.__getitem__, order)), limit
+        )
+        if keep:
+            self._sort_order = sort_order
+        return sort_order
+
+    def _get_spilled_rows(
+        self, store: _SpillStore, sortindex: int, options: OptionsType
+    ) -> list[RowType]:
+        """Like _get_rows, sorting a table stored on disk a run at a time"""
+        rows: Iterable[RowType]
+        matching = self._get_matching_positions()
+        if matching is not None:
+            if options["oldsortslice"]:
+                matching = _positions_between(
+                    matching, options["start"], options["end"]
+                )
+            rows = self._rows_at(matching)
+        elif options["oldsortslice"]:
+            rows = store[options["start"] : options["end"]]
+            rows = self._add_index(rows, options["start"] + 1)
+        else:
+            rows = self._add_index(store, 1)
 
-        rows = [row for row in rows if options["row_filter"](row)]
+        rows = filter(options["row_filter"], rows)
 
+        # Decorate
+        decorated = ([row[sortindex], *row] for row in rows)
         # Sort
-        if options["sortby"]:
-            sortindex = self._field_names.index(options["sortby"])
-            # Decorate
-            rows = [[row[sortindex]] + row for row in rows]
-            # Sort
-            rows.sort(reverse=options["reversesort"], key=options["sort_key"])
-            # Undecorate
-            rows = [row[1:] for row in rows]
+        key, reverse = options["sort_key"], options["reversesort"]
+        end = options["end"]
+        ordered: Iterable[RowType]
+        if (
+            not options["oldsortslice"]
+            and end is not None
+            and end * _PARTIAL_SORT_RATIO <= len(store)
+        ):
+            # Only the first rows are needed, and they fit in memory
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            ordered = select(end, decorated, key=key)
+        else:
+            ordered = store.sort_rows(decorated, key, reverse)
 
         # Slice if necessary
         if not options["oldsortslice"]:
-            rows = rows[options["start"] : options["end"]]
+            ordered = islice(ordered, options["start"], options["end"])
+
+        # Undecorate
+        ordered = [row[1:] for row in ordered]
+        return list(self._number_displayed(ordered, options["start"] + 1))
+
+    def _iter_rows(self, options: OptionsType) -> Iterator[RowType]:
+        """Yield the rows to print like _get_rows, without building a list of
+        them unless they need sorting.
+
+        Arguments:
 
-        return rows
+        options - dictionary of option settings."""
+        start, end = options["start"], options["end"]
+        matching = self._get_matching_positions() if self._where else None
+        if options["sortby"]:
+            yield from self._get_rows(options)
+        elif matching is not None:
+            row_filter = options["row_filter"]
+            shown: Iterable[RowType]
+            if options["oldsortslice"]:
+                between = _positions_between(matching, start, end)
+                shown = filter(row_filter, self._rows_at(between))
+            elif row_filter is _accept_all_rows:
+                shown = self._rows_at(matching[start:end])
+            else:
+                shown = islice(filter(row_filter, self._rows_at(matching)), start, end)
+            yield from self._number_displayed(shown, start + 1)
+        elif (
+            isinstance(self._stored_rows, _SpillStore)
+            and options["row_filter"] is _accept_all_rows
+            and not self._sources
+        ):
+            # Read only the rows asked for, not every row before them
+            yield from self._add_index(
+                self._stored_rows.iter_range(start, end), start + 1
+            )
+        elif options["oldsortslice"]:
+            sliced = islice(self._iter_stored_rows(), start, end)
+            filtered = filter(options["row_filter"], self._add_index(sliced, start + 1))
+            yield from self._number_displayed(filtered, start + 1)
+        else:
+            indexed = self._add_index(self._iter_stored_rows(), 1)
+            filtered = filter(options["row_filter"], indexed)
+            yield from self._number_displayed(islice(filtered, start, end), start + 1)
+
+    def _add_index(self, rows: Iterable[RowType], first: int) -> Iterable[RowType]:
+        """Put the virtual index in front of each of rows, as new lists, numbering
+        them by position from first"""
+        if self._virtual_index is None:
+            return rows
+        return ([number, *row] for number, row in enumerate(rows, first))
+
+    def _number_displayed(
+        self, rows: Iterable[RowType], first: int
+    ) -> Iterable[RowType]:
+        """Renumber the virtual index of rows from first, now that they are
+        filtered, sorted and sliced, if it numbers them in display order"""
+        if self._virtual_index != "displayed":
+            return rows
+        return _renumbered(rows, first)
+
+    def _iter_layouts(
+        self,
+        rows: Iterable[RowType],
+        options: OptionsType,
+        cache: WidthCache | None,
+        pool: Executor | None = None,
+    ) -> Iterator[list[_CellLayout]]:
+        """Format and lay out rows a batch at a time, as they are consumed, all
+        on the same pool of workers if one is given."""
+        rows = iter(rows)
+        batch_size = _LAYOUT_BATCH_SIZE
+        if options["format_workers"] > 1:
+            # Give every worker a chunk of each batch
+            batch_size = options["format_chunk_size"] * options["format_workers"]
+        while batch := list(islice(rows, batch_size)):
+            formatted = self._format_rows(batch, options, pool)
+            yield from self._layout_rows(formatted, cache=cache)
 
     def _get_dividers(self, options: OptionsType) -> list[bool]:
         """Return only those dividers that should be printed, based on slicing.
@@ -1958,24 +4133,158 @@ class PrettyTable:
         Arguments:
 
         options - dictionary of option settings."""
+        if options["sortby"]:
+            return [False] * len(self._rows)
         if options["oldsortslice"]:
-            dividers = self._dividers[options["start"] : options["end"]]
-        else:
-            dividers = self._dividers
+            self._pull_rows(options["end"])
+            return self._dividers[options["start"] : options["end"]]
+        # Rows read from lazy sources as they are printed add to this same list
+        return self._dividers
 
-        if options["sortby"]:
-            dividers = [False for divider in dividers]
+    def _format_row(self, row: RowType) -> list[str]:
+        return _format_chunk(self._get_cell_formats(), [row])[0]
 
-        return dividers
+    def _format_rows(
+        self,
+        rows: Sequence[RowType],
+        options: OptionsType,
+        pool: Executor | None = None,
+    ) -> list[list[str]]:
+        """Format rows, in chunks on a pool of workers if options ask for it.
+
+        The chunks go to pool if one is given, else to a pool started for just
+        these rows. The formatted rows come back in the same order either way."""
+        formats = self._get_cell_formats()
+        if options["format_workers"] < 2:
+            return _format_chunk(formats, rows)
+        chunk_size = options["format_chunk_size"]
+        if len(rows) <= chunk_size:
+            return _format_chunk(formats, rows)
+        if pool is None:
+            with self._new_format_pool(options) as new_pool:
+                return self._format_rows(rows, options, new_pool)
+
+        chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        formatted: list[list[str]] = []
+        for chunk in pool.map(_format_chunk, [formats] * len(chunks), chunks):
+            formatted.extend(chunk)
+        return formatted
+
+    @staticmethod
+    def _new_format_pool(options: OptionsType) -> Executor:
+        """Start a pool of format_workers workers of the format_pool kind"""
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if options["format_pool"] == "process":
+            return ProcessPoolExecutor(max_workers=options["format_workers"])
+        return ThreadPoolExecutor(max_workers=options["format_workers"])
+
+    def _layout_rows(
+        self,
+        rows: list[list[str]],
+        measure: bool = True,
+        cache: WidthCache | None = None,
+        escape: bool = False,
+        none_format: bool = True,
+    ) -> list[list[_CellLayout]]:
+        """Split formatted rows into lines and measure them, once per render.
 
-    def _format_row(self, row: RowType) -> list[str]:
-        return [
-            self._format_value(field, value)
-            for (field, value) in zip(self._field_names, row)
+        Arguments:
+
+        rows - formatted rows, as returned by _format_rows
+        measure - compute display widths (not needed by markup exporters)
+        cache - width cache for strings that need the full wcwidth measurement
+        escape - HTML-escape the lines (for the HTML exporters, which don't
+            measure them)
+        none_format - replace lines reading "None" with the none_format of their
+            field (only the plain text table does)"""
+        columns = list(zip(*rows))
+        return self._layout_columns(columns, measure, cache, escape, none_format)
+
+    def _layout_columns(
+        self,
+        columns: Sequence[Sequence[str]],
+        measure: bool = True,
+        cache: WidthCache | None = None,
+        escape: bool = False,
+        none_format: bool = True,
+    ) -> list[list[_CellLayout]]:
+        """Like _layout_rows, for formatted cells given a column at a time."""
+        none_values = self._none_format if none_format else {}
+        laid_out = [
+            _layout_column(column, none_values.get(field), measure, cache, escape)
+            for field, column in zip(self._field_names, columns)
         ]
+        return [list(row) for row in zip(*laid_out)]
+
+    def _get_columns(self, options: OptionsType) -> list[Sequence[Any]] | None:
+        """Return the data to print a column at a time, straight from columnar
+        storage, or None when it has to go row by row: with row storage, and
+        when rows are sorted, filtered by row_filter or formatted by a pool."""
+        store = self._stored_rows
+        if (
+            not isinstance(store, _ColumnStore)
+            or options["sortby"]
+            or options["row_filter"] is not _accept_all_rows
+            or options["format_workers"] > 1
+        ):
+            return None
+        start, end = options["start"], options["end"]
+        matching = self._get_matching_positions()
+        if matching is not None:
+            if options["oldsortslice"]:
+                shown = _positions_between(matching, start, end)
+            else:
+                shown = matching[start:end]
+            columns = [
+                _column_values(store, index, shown)
+                for index in range(len(store.columns))
+            ]
+            if self._virtual_index == "original":
+                columns.insert(0, array("q", [position + 1 for position in shown]))
+            elif self._virtual_index == "displayed":
+                columns.insert(0, array("q", range(start + 1, start + len(shown) + 1)))
+            return columns
+        self._pull_rows(end)
+        columns = [column[start:end] for column in store.columns]
+        if self._virtual_index is not None:
+            # Numbered the same either way, as nothing is sorted or filtered out
+            shown = range(1, len(store) + 1)[start:end]
+            columns.insert(0, array("q", shown))
+        return columns
+
+    def _get_layouts(
+        self,
+        options: OptionsType,
+        measure: bool = True,
+        cache: WidthCache | None = None,
+        escape: bool = False,
+        none_format: bool = True,
+    ) -> list[list[_CellLayout]]:
+        """Get, format and lay out the rows to print.
+
+        Arguments:
+
+        options - dictionary of option settings
+        measure - compute display widths (not needed by markup exporters)
+        cache - width cache for strings that need the full wcwidth measurement
+        escape - HTML-escape the lines, see _layout_rows
+        none_format - show None as none_format says, see _layout_rows"""
+        columns = self._get_columns(options)
+        if columns is not None:
+            formats = self._get_cell_formats()
+            formatted = [
+                _format_column(field, column, formats)
+                for field, column in zip(self._field_names, columns)
+            ]
+            return self._layout_columns(formatted, measure, cache, escape, none_format)
+
+        # Get the rows we need to print, taking into account slicing, sorting, etc.
+        rows = self._get_rows(options)
 
-    def _format_rows(self, rows: list[RowType]) -> list[list[str]]:
-        return [self._format_row(row) for row in rows]
+        # Turn all data in all rows into Unicode, formatted as desired
+        formatted_rows = self._format_rows(rows, options)
+        return self._layout_rows(formatted_rows, measure, cache, escape, none_format)
 
     ##############################
     # PLAIN TEXT STRING METHODS  #
@@ -2029,86 +4338,380 @@ class PrettyTable:
         reversesort - True or False to sort in descending or ascending order
         row_filter - filter function applied on rows
         print empty - if True, stringify just the header for an empty table,
-            if False return an empty string"""
+            if False return an empty string
+        width_cache_size - number of display widths of non-ASCII strings to cache
+            (0 disables caching)
+        width_cache_scope - keep the width cache for the life of the table ("table")
+            or start a new one for every render ("render")"""
 
         options = self._get_options(kwargs)
+        return "\n".join(self._iter_chunks(options))
 
-        lines: list[str] = []
+    def iter_lines(self, **kwargs) -> Iterator[str]:
+        """Yield the lines of the string representation of the table one at a time.
+
+        Joining the lines with "\n" gives exactly the result of get_string(), but
+        the output is never assembled in memory as a whole.
+
+        Arguments are the same as for get_string()."""
+        options = self._get_options(kwargs)
+        for chunk in self._iter_chunks(options):
+            yield from chunk.split("\n")
+
+    def write_to(self, fp: SupportsWrite[str], **kwargs) -> None:
+        """Write the string representation of the table to a file-like object.
+
+        What is written is identical to get_string(), but each line is passed to
+        fp.write() as soon as it is rendered instead of building the whole string.
+
+        Arguments:
+
+        fp - text stream (or anything with a write method accepting str)
+
+        Other arguments are the same as for get_string()."""
+        options = self._get_options(kwargs)
+        write = fp.write
+        first = True
+        for chunk in self._iter_chunks(options):
+            if first:
+                first = False
+            else:
+                write("\n")
+            write(chunk)
+
+    def _iter_chunks(self, options: OptionsType) -> Iterator[str]:
+        """Yield the pieces of the plain text table, to be joined with newlines.
+
+        A piece may itself contain newlines (a header with its rules, a multi-line
+        row, a row followed by a rule)."""
 
         # Don't think too hard about an empty table
         # Is this the desired behaviour?  Maybe we should still print the header?
-        if self.rowcount == 0 and (not options["print_empty"] or not options["border"]):
-            return ""
+        if not self._has_rows() and (
+            not options["print_empty"] or not options["border"]
+        ):
+            return
 
-        # Get the rows we need to print, taking into account slicing, sorting, etc.
-        rows = self._get_rows(options)
+        if options["render_cache"]:
+            yield from self._get_rendered_chunks(options)
+            return
+
+        ctx = _RenderContext(options)
+        try:
+            layouts, dividers, _ = self._prepare_table(ctx)
+            chunks = self._iter_table_chunks(layouts, dividers, ctx)
+            yield from self._apply_orgmode(chunks)
+        finally:
+            ctx.close()
+
+    def _prepare_table(
+        self, ctx: _RenderContext
+    ) -> tuple[Iterable[list[_CellLayout]], list[bool], list[int]]:
+        """Lay out the rows to print and fill in the render context.
+
+        Returns the row layouts, the dividers and the natural column widths.
+        With a width sample, rows after the sample are only laid out as the
+        returned iterable is consumed."""
+        options = ctx.options
+        cache = self._get_width_cache(options)
         dividers = self._get_dividers(options)
+        layouts: Iterable[list[_CellLayout]]
 
-        # Turn all data in all rows into Unicode, formatted as desired
-        formatted_rows = self._format_rows(rows)
+        if options["width_sample"] is None:
+            layouts = self._get_layouts(options, cache=cache)
+
+            # Compute column widths
+            natural_widths = self._compute_widths(layouts, ctx)
+        else:
+            remaining = self._iter_rows(options)
+            sample = list(islice(remaining, options["width_sample"]))
+            # Peek at the next row if need be, to know whether there are any
+            first = [] if sample else list(islice(remaining, 1))
+            remaining = chain(first, remaining)
+            if options["format_workers"] > 1:
+                # One pool for the whole render, not one per batch of rows
+                ctx.format_pool = self._new_format_pool(options)
+            pool = ctx.format_pool
+            sample_layouts = self._layout_rows(
+                self._format_rows(sample, options, pool), cache=cache
+            )
+            any_rows = bool(sample or first)
+            natural_widths = self._compute_widths(sample_layouts, ctx, any_rows)
+            if any_rows:
+                # Later rows can't be wrapped to fit a column of width zero
+                ctx.widths = [max(1, width) for width in ctx.widths]
+            layouts = chain(
+                sample_layouts, self._iter_layouts(remaining, options, cache, pool)
+            )
+
+        ctx.style_key = self._get_fragment_key(ctx)
+        ctx.hrule = self._get_fragment(
+            ("hrule", ctx.style_key), lambda: self._stringify_hrule(ctx)
+        )
+        ctx.template = self._compile_row_template(ctx)
+        return layouts, dividers, natural_widths
+
+    def _apply_orgmode(self, chunks: Iterable[str]) -> Iterator[str]:
+        if "orgmode" in self.__dict__ and self.orgmode:
+            left_j_len = len(self.left_junction_char)
+            right_j_len = len(self.right_junction_char)
+            for chunk in chunks:
+                for line in chunk.split("\n"):
+                    yield "|" + line[left_j_len:-right_j_len] + "|"
+        else:
+            yield from chunks
+
+    def _iter_table_chunks(
+        self,
+        formatted_rows: Iterable[list[_CellLayout]],
+        dividers: list[bool],
+        ctx: _RenderContext,
+    ) -> Iterator[str]:
+        yield from self._iter_head_chunks(ctx)
+
+        # Add rows
+        bottom = self._get_bottom_hrule(ctx)
+        yield from self._iter_body_chunks(formatted_rows, dividers, ctx, bottom)
 
-        # Compute column widths
-        self._compute_widths(formatted_rows, options)
-        self._hrule = self._stringify_hrule(options)
+        # Add bottom of border
+        if ctx.options["border"] and ctx.options["hrules"] == HRuleStyle.FRAME:
+            yield bottom
 
+    def _iter_head_chunks(self, ctx: _RenderContext) -> Iterator[str]:
+        options = ctx.options
+        style_key = ctx.style_key
         # Add title
         title = options["title"] or self._title
         if title:
-            lines.append(self._stringify_title(title, options))
+            yield self._get_fragment(
+                ("title", title, style_key),
+                lambda: self._stringify_title(title, ctx),
+            )
 
         # Add header or top of border
         if options["header"]:
-            lines.append(self._stringify_header(options))
+            yield self._get_fragment(
+                ("header", style_key), lambda: self._stringify_header(ctx)
+            )
         elif options["border"] and options["hrules"] in (
             HRuleStyle.ALL,
             HRuleStyle.FRAME,
         ):
-            lines.append(self._stringify_hrule(options, where="top_"))
+            top = self._stringify_hrule(ctx, where="top_")
             if title and options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
                 left_j_len = len(self.left_junction_char)
                 right_j_len = len(self.right_junction_char)
-                lines[-1] = (
+                top = (
                     self.left_junction_char
-                    + lines[-1][left_j_len:-right_j_len]
+                    + top[left_j_len:-right_j_len]
                     + self.right_junction_char
                 )
+            yield top
 
-        # Add rows
-        for row, divider in zip(formatted_rows[:-1], dividers[:-1]):
-            lines.append(self._stringify_row(row, options, self._hrule))
-            if divider:
-                lines.append(self._stringify_hrule(options))
-        if formatted_rows:
-            lines.append(
-                self._stringify_row(
-                    formatted_rows[-1],
-                    options,
-                    self._stringify_hrule(options, where="bottom_"),
-                )
-            )
+    def _iter_body_chunks(
+        self,
+        formatted_rows: Iterable[list[_CellLayout]],
+        dividers: list[bool],
+        ctx: _RenderContext,
+        bottom: str,
+    ) -> Iterator[str]:
+        # Hold back one row, as the last one is followed by the bottom rule
+        previous = None
+        for index, row in enumerate(formatted_rows):
+            if previous is not None:
+                yield self._stringify_row(previous, ctx, ctx.hrule)
+                if dividers[index - 1]:
+                    yield ctx.hrule
+            previous = row
+        if previous is not None:
+            yield self._stringify_row(previous, ctx, bottom)
+
+    def _get_bottom_hrule(self, ctx: _RenderContext) -> str:
+        return self._get_fragment(
+            ("bottom_hrule", ctx.style_key),
+            lambda: self._stringify_hrule(ctx, where="bottom_"),
+        )
 
-        # Add bottom of border
+    def _get_rendered_chunks(self, options: OptionsType) -> list[str]:
+        """Return the pieces of the table from the cached rendering, bringing it
+        up to date first: by rendering just the rows appended since where
+        possible, or else the whole table."""
+        key = self._get_render_key(options)
+        rendered = self._rendered
+        if rendered is not None and rendered.key == key:
+            if rendered.version == self._version:
+                return rendered.chunks
+            extended = self._extend_rendered(rendered, options)
+            if extended is not None:
+                self._rendered = extended
+                return extended.chunks
+
+        version = self._version
+        ctx = _RenderContext(options)
+        try:
+            layouts, dividers, natural_widths = self._prepare_table(ctx)
+            layouts = list(layouts)
+        finally:
+            ctx.close()
+        head = list(self._iter_head_chunks(ctx))
+        bottom = self._get_bottom_hrule(ctx)
+        body = list(self._iter_body_chunks(layouts, dividers, ctx, bottom))
         if options["border"] and options["hrules"] == HRuleStyle.FRAME:
-            lines.append(self._stringify_hrule(options, where="bottom_"))
+            tail = [bottom]
+        else:
+            tail = []
+        self._rendered = rendered = _RenderedTable(
+            key,
+            version,
+            len(self._rows),
+            len(layouts),
+            layouts[-1] if layouts else None,
+            natural_widths,
+            ctx,
+            bottom,
+            head,
+            body,
+            tail,
+            list(self._apply_orgmode(head + body + tail)),
+        )
+        return rendered.chunks
+
+    def _extend_rendered(
+        self, rendered: _RenderedTable, options: OptionsType
+    ) -> _RenderedTable | None:
+        """Render the rows appended since `rendered` was made and splice them in
+        before the bottom border.
+
+        Returns None if that can't be done because the output is sorted or
+        sliced, or because a new row would change the column widths."""
+        if options["sortby"] or options["start"] or options["end"] is not None:
+            return None
+        if rendered.last_row is None or self._where:
+            return None
+
+        version = self._version
+        rows = self._rows[rendered.rowcount :]
+        rowcount = rendered.rowcount + len(rows)
+        indexed = self._add_index(rows, rendered.rowcount + 1)
+        rows = [row for row in indexed if options["row_filter"](row)]
+        rows = list(self._number_displayed(rows, rendered.shown + 1))
+        if not rows:
+            return _RenderedTable(
+                rendered.key,
+                version,
+                rowcount,
+                rendered.shown,
+                rendered.last_row,
+                rendered.natural_widths,
+                rendered.ctx,
+                rendered.bottom,
+                rendered.head,
+                rendered.body,
+                rendered.tail,
+                rendered.chunks,
+            )
 
-        if "orgmode" in self.__dict__ and self.orgmode:
-            left_j_len = len(self.left_junction_char)
-            right_j_len = len(self.right_junction_char)
-            lines = [
-                "|" + new_line[left_j_len:-right_j_len] + "|"
-                for old_line in lines
-                for new_line in old_line.split("\n")
-            ]
+        layouts = self._layout_rows(
+            self._format_rows(rows, options), cache=self._get_width_cache(options)
+        )
+        # Rows past the width sample don't count towards the widths
+        sample_size = options["width_sample"]
+        if sample_size is None or rendered.shown < sample_size:
+            natural_widths = self._get_natural_widths(layouts, options)
+            if any(
+                new > old for new, old in zip(natural_widths, rendered.natural_widths)
+            ):
+                return None
 
-        return "\n".join(lines)
+        ctx = rendered.ctx
+        dividers = self._get_dividers(options)
+        # The previous last row is no longer followed by the bottom border
+        body = rendered.body[:-1]
+        body.append(self._stringify_row(rendered.last_row, ctx, ctx.hrule))
+        if dividers[rendered.shown - 1]:
+            body.append(ctx.hrule)
+        body.extend(
+            self._iter_body_chunks(
+                layouts, dividers[rendered.shown :], ctx, rendered.bottom
+            )
+        )
+        return _RenderedTable(
+            rendered.key,
+            version,
+            rowcount,
+            rendered.shown + len(layouts),
+            layouts[-1],
+            rendered.natural_widths,
+            ctx,
+            rendered.bottom,
+            rendered.head,
+            body,
+            rendered.tail,
+            list(self._apply_orgmode(rendered.head + body + rendered.tail)),
+        )
+
+    def _get_render_key(self, options: OptionsType) -> tuple[Any, ...]:
+        """Return everything besides the rows that the plain text depends on.
+
+        Options are copied, so that changes made in place to per-column settings
+        such as align or custom_format are noticed too."""
+        snapshot = {
+            name: value.copy() if isinstance(value, (dict, list)) else value
+            for name, value in options.items()
+        }
+        return (
+            snapshot,
+            tuple(self._field_names),
+            self._title,
+            self._style,
+            self._horizontal_align_char,
+            "orgmode" in self.__dict__ and self.orgmode,
+        )
+
+    def _get_fragment_key(self, ctx: _RenderContext) -> tuple[Any, ...]:
+        """Return everything the title, header and horizontal rules depend on."""
+        options = ctx.options
+        fields = options["fields"]
+        return (
+            tuple(self._field_names),
+            tuple(ctx.widths),
+            tuple([self._align.get(field) for field in self._field_names]),
+            tuple(fields) if fields else None,
+            self._header_style,
+            self._horizontal_align_char,
+            self.left_junction_char,
+            self.right_junction_char,
+            *[options[option] for option in _FRAGMENT_OPTIONS],
+        )
+
+    def _get_fragment(self, key: tuple[Any, ...], build: Callable[[], str]) -> str:
+        """Return a memoized title, header or rule, building it on first use.
+
+        The key must contain everything the fragment depends on, so a change of
+        style or of column widths simply leads to a different key."""
+        fragments = self._fragments
+        try:
+            return fragments[key]
+        except KeyError:
+            pass
+        if len(fragments) >= _FRAGMENT_CACHE_SIZE:
+            fragments.clear()
+        fragment = fragments[key] = build()
+        return fragment
 
     def _stringify_hrule(
-        self, options: OptionsType, where: Literal["top_", "bottom_", ""] = ""
+        self,
+        ctx: _RenderContext,
+        where: Literal["top_", "bottom_", ""] = "",
+        vrules: VRuleStyle | None = None,
     ) -> str:
+        options = ctx.options
+        if vrules is None:
+            vrules = options["vrules"]
         if not options["border"] and not options["preserve_internal_border"]:
             return ""
         lpad, rpad = self._get_padding_widths(options)
-        if options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
+        if vrules in (VRuleStyle.ALL, VRuleStyle.FRAME):
             bits = [options[where + "left_junction_char"]]  # type: ignore[literal-required]
         else:
             bits = [options["horizontal_char"]]
@@ -2116,7 +4719,7 @@ class PrettyTable:
         if not self._field_names:
             bits.append(options[where + "right_junction_char"])  # type: ignore[literal-required]
             return "".join(bits)
-        for field, width in zip(self._field_names, self._widths):
+        for field, width in zip(self._field_names, ctx.widths):
             if options["fields"] and field not in options["fields"]:
                 continue
 
@@ -2130,11 +4733,11 @@ class PrettyTable:
                     line = line[:-2] + self._horizontal_align_char + " "
 
             bits.append(line)
-            if options["vrules"] == VRuleStyle.ALL:
+            if vrules == VRuleStyle.ALL:
                 bits.append(options[where + "junction_char"])  # type: ignore[literal-required]
             else:
                 bits.append(options["horizontal_char"])
-        if options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
+        if vrules in (VRuleStyle.ALL, VRuleStyle.FRAME):
             bits.pop()
             bits.append(options[where + "right_junction_char"])  # type: ignore[literal-required]
 
@@ -2143,16 +4746,14 @@ class PrettyTable:
 
         return "".join(bits)
 
-    def _stringify_title(self, title: str, options: OptionsType) -> str:
+    def _stringify_title(self, title: str, ctx: _RenderContext) -> str:
+        options = ctx.options
         lines: list[str] = []
         lpad, rpad = self._get_padding_widths(options)
         if options["border"]:
-            if options["vrules"] == VRuleStyle.ALL:
-                options["vrules"] = VRuleStyle.FRAME
-                lines.append(self._stringify_hrule(options, "top_"))
-                options["vrules"] = VRuleStyle.ALL
-            elif options["vrules"] == VRuleStyle.FRAME:
-                lines.append(self._stringify_hrule(options, "top_"))
+            if options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
+                # The title spans all columns, so its top rule has no junctions
+                lines.append(self._stringify_hrule(ctx, "top_", VRuleStyle.FRAME))
         bits: list[str] = []
         endpoint = (
             options["vertical_char"]
@@ -2163,19 +4764,20 @@ class PrettyTable:
         bits.append(endpoint)
         title = " " * lpad + title + " " * rpad
         lpad, rpad = self._get_padding_widths(options)
-        sum_widths = sum([n + lpad + rpad + 1 for n in self._widths])
+        sum_widths = sum([n + lpad + rpad + 1 for n in ctx.widths])
 
         bits.append(self._justify(title, sum_widths - 1, "c"))
         bits.append(endpoint)
         lines.append("".join(bits))
         return "\n".join(lines)
 
-    def _stringify_header(self, options: OptionsType) -> str:
+    def _stringify_header(self, ctx: _RenderContext) -> str:
+        options = ctx.options
         bits: list[str] = []
         lpad, rpad = self._get_padding_widths(options)
         if options["border"]:
             if options["hrules"] in (HRuleStyle.ALL, HRuleStyle.FRAME):
-                bits.append(self._stringify_hrule(options, "top_"))
+                bits.append(self._stringify_hrule(ctx, "top_"))
                 if options["title"] and options["vrules"] in (
                     VRuleStyle.ALL,
                     VRuleStyle.FRAME,
@@ -2198,7 +4800,7 @@ class PrettyTable:
                 bits.append(options["vertical_char"])
             else:
                 bits.append(" ")
-        for field, width in zip(self._field_names, self._widths):
+        for field, width in zip(self._field_names, ctx.widths):
             if options["fields"] and field not in options["fields"]:
                 continue
             if self._header_style == "cap":
@@ -2238,38 +4840,92 @@ class PrettyTable:
             "hrules"
         ] != HRuleStyle.NONE:
             bits.append("\n")
-            bits.append(self._hrule)
+            bits.append(ctx.hrule)
         return "".join(bits)
 
-    def _stringify_row(self, row: list[str], options: OptionsType, hrule: str) -> str:
+    def _compile_row_template(self, ctx: _RenderContext) -> _RowTemplate | None:
+        """Build the template used to render single-line rows, once the widths
+        are known.
+
+        This must produce exactly what _stringify_row does for such rows."""
+        options = ctx.options
+        columns = [
+            (index, width, self._align[field])
+            for index, (field, width) in enumerate(zip(self._field_names, ctx.widths))
+            if not options["fields"] or field in options["fields"]
+        ]
+        if not columns:
+            return None
+        lpad, rpad = self._get_padding_widths(options)
+
+        if options["border"]:
+            if options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
+                prefix = self.vertical_char
+            else:
+                prefix = " "
+        else:
+            prefix = ""
+        if options["border"] or options["preserve_internal_border"]:
+            if options["vrules"] == VRuleStyle.ALL:
+                separator = self.vertical_char
+            else:
+                separator = " "
+        else:
+            separator = ""
+        suffix = separator
+        if not options["border"] and options["preserve_internal_border"]:
+            suffix = " "
+        if options["border"] and options["vrules"] == VRuleStyle.FRAME:
+            suffix = options["vertical_char"]
+
+        def escape(text: str) -> str:
+            return text.replace("{", "{{").replace("}", "}}")
+
+        cell = " " * lpad + "{}" + " " * rpad
+        fmt = (
+            escape(prefix)
+            + escape(separator).join([cell] * len(columns))
+            + escape(suffix)
+        )
+        return _RowTemplate(fmt, columns, ctx.widths, self._justify)
+
+    def _stringify_row(
+        self,
+        row: list[_CellLayout],
+        ctx: _RenderContext,
+        hrule: str,
+    ) -> str:
         import textwrap
 
-        for index, field, value, width in zip(
-            range(0, len(row)), self._field_names, row, self._widths
-        ):
-            # Enforce max widths
-            lines = value.split("\n")
-            new_lines: list[str] = []
-            for line in lines:
-                if (
-                    line == "None"
-                    and (none_val := self.none_format.get(field)) is not None
-                ):
-                    line = none_val
-                if _str_block_width(line) > width:
-                    line = textwrap.fill(
-                        line, width, break_on_hyphens=options["break_on_hyphens"]
-                    )
-                new_lines.append(line)
-            lines = new_lines
-            value = "\n".join(lines)
-            row[index] = value
+        options = ctx.options
+        template = ctx.template
+        if template is not None and (line := template.render(row)) is not None:
+            if options["border"] and options["hrules"] == HRuleStyle.ALL:
+                return line + "\n" + hrule
+            return line
 
+        cells: list[tuple[list[str], list[int]]] = []
         row_height = 0
-        for c in row:
-            h = _get_size(c)[1]
-            if h > row_height:
-                row_height = h
+        for cell, width in zip(row, ctx.widths):
+            lines = cell.lines
+            line_widths = cell.widths
+            if cell.width > width:
+                # Enforce max widths
+                lines = []
+                line_widths = []
+                for line, line_width in zip(cell.lines, cell.widths):
+                    if line_width > width:
+                        for wrapped in textwrap.fill(
+                            line, width, break_on_hyphens=options["break_on_hyphens"]
+                        ).split("\n"):
+                            lines.append(wrapped)
+                            line_widths.append(_str_block_width(wrapped))
+                    else:
+                        lines.append(line)
+                        line_widths.append(line_width)
+            cells.append((lines, line_widths))
+            if len(lines) > row_height:
+                row_height = len(lines)
 
         bits: list[list[str]] = []
         lpad, rpad = self._get_padding_widths(options)
@@ -2281,29 +4937,30 @@ class PrettyTable:
                 else:
                     bits[y].append(" ")
 
-        for field, value, width in zip(self._field_names, row, self._widths):
+        for field, (lines, line_widths), width in zip(
+            self._field_names, cells, ctx.widths
+        ):
             valign = self._valign[field]
-            lines = value.split("\n")
             d_height = row_height - len(lines)
             if d_height:
                 if valign == "m":
-                    lines = (
-                        [""] * int(d_height / 2)
-                        + lines
-                        + [""] * (d_height - int(d_height / 2))
-                    )
+                    top = int(d_height / 2)
+                    lines = [""] * top + lines + [""] * (d_height - top)
+                    line_widths = [0] * top + line_widths + [0] * (d_height - top)
                 elif valign == "b":
                     lines = [""] * d_height + lines
+                    line_widths = [0] * d_height + line_widths
                 else:
                     lines = lines + [""] * d_height
+                    line_widths = line_widths + [0] * d_height
 
-            for y, line in enumerate(lines):
+            for y, (line, line_width) in enumerate(zip(lines, line_widths)):
                 if options["fields"] and field not in options["fields"]:
                     continue
 
                 bits[y].append(
                     " " * lpad
-                    + self._justify(line, width, self._align[field])
+                    + self._justify(line, width, self._align[field], line_width)
                     + " " * rpad
                 )
                 if options["border"] or options["preserve_internal_border"]:
@@ -2521,19 +5178,16 @@ class PrettyTable:
 
         # Data
         lines.append("    <tbody>")
-        rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        formatted_rows = self._get_layouts(
+            options, measure=False, escape=options["escape_data"], none_format=False
+        )
         for row in formatted_rows:
             lines.append("        <tr>")
-            for field, datum in zip(self._field_names, row):
+            for field, cell in zip(self._field_names, row):
                 if options["fields"] and field not in options["fields"]:
                     continue
-                if options["escape_data"]:
-                    datum = escape(datum)
-
-                lines.append(
-                    "            <td>{}</td>".format(datum.replace("\n", linebreak))
-                )
+                datum = linebreak.join(cell.lines)
+                lines.append(f"            <td>{datum}</td>")
             lines.append("        </tr>")
         lines.append("    </tbody>")
         lines.append("</table>")
@@ -2610,8 +5264,9 @@ class PrettyTable:
 
         # Data
         lines.append("    <tbody>")
-        rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        formatted_rows = self._get_layouts(
+            options, measure=False, escape=options["escape_data"], none_format=False
+        )
         aligns: list[str] = []
         valigns: list[str] = []
         for field in self._field_names:
@@ -2623,15 +5278,13 @@ class PrettyTable:
             )
         for row in formatted_rows:
             lines.append("        <tr>")
-            for field, datum, align, valign in zip(
+            for field, cell, align, valign in zip(
                 self._field_names, row, aligns, valigns
             ):
                 if options["fields"] and field not in options["fields"]:
                     continue
-                if options["escape_data"]:
-                    datum = escape(datum)
+                content = linebreak.join(cell.lines)
 
-                content = datum.replace("\n", linebreak)
                 lines.append(
                     f'            <td style="'
                     f"padding-left: {lpad}em; "
@@ -2704,7 +5357,7 @@ class PrettyTable:
 
         # Data
         rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        formatted_rows = self._format_rows(rows, options)
         for row in formatted_rows:
             wanted_data = [
                 d for f, d in zip(self._field_names, row) if f in wanted_fields
@@ -2758,7 +5411,7 @@ class PrettyTable:
 
         # Data
         rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        formatted_rows = self._format_rows(rows, options)
         rows = self._get_rows(options)
         for row in formatted_rows:
             wanted_data = [
@@ -2824,7 +5477,7 @@ class PrettyTable:
                 lines.append("! " + header_line)
 
         rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        formatted_rows = self._format_rows(rows, options)
         for row in formatted_rows:
             lines.append("|-")
             cells = []
@@ -2845,13 +5498,93 @@ class PrettyTable:
 ##############################
 
 
-@lru_cache
-def _str_block_width(val: str) -> int:
+def _str_block_width(val: str, cache: WidthCache | None = None) -> int:
+    if val.isascii() and val.isprintable():
+        # Plain ASCII without control characters or escape sequences
+        return len(val)
+    if cache is not None:
+        return cache.width(val)
+    return _wcswidth(val)
+
+
+def _str_block_widths(
+    vals: Sequence[str], cache: WidthCache | None = None
+) -> list[int]:
+    """Return the display width of each string in vals, e.g. a whole column.
+
+    When the strings are all plain printable ASCII (the common case for numbers
+    and identifiers) this is a single C-level pass over the data."""
+    joined = "".join(vals)
+    if joined.isascii() and joined.isprintable():
+        return list(map(len, vals))
+    return [_str_block_width(val, cache) for val in vals]
+
+
+def _wcswidth(val: str) -> int:
     import wcwidth  # type: ignore[import-untyped]
 
     return wcwidth.wcswidth(_re.sub("", val))
 
 
+class _WidthCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class WidthCache:
+    """Least-recently-used cache of display widths, with hit/miss statistics.
+
+    Plain ASCII strings are measured directly and never reach the cache, so it
+    only holds strings that need the full wcwidth measurement.
+
+    Arguments:
+
+    maxsize - maximum number of widths to keep"""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._widths: OrderedDict[str, int] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._widths)
+
+    def width(self, val: str) -> int:
+        """Return the display width of val, measuring it on a miss"""
+        widths = self._widths
+        try:
+            width = widths[val]
+        except KeyError:
+            self.misses += 1
+            width = _wcswidth(val)
+            if len(widths) >= self.maxsize:
+                try:
+                    widths.popitem(last=False)
+                except KeyError:
+                    pass
+            widths[val] = width
+        else:
+            self.hits += 1
+            try:
+                widths.move_to_end(val)
+            except KeyError:
+                pass
+        return width
+
+    def cache_info(self) -> _WidthCacheInfo:
+        """Report cache statistics, like functools.lru_cache does"""
+        return _WidthCacheInfo(self.hits, self.misses, self.maxsize, len(self._widths))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics"""
+        self._widths.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 ##############################
 # TABLE FACTORIES            #
 ##############################
@@ -2887,7 +5620,7 @@ def from_csv(fp, field_names: Sequence[str] | None = None, **kwargs) -> PrettyTa
         table.field_names = [x.strip() for x in next(reader)]
 
     for row in reader:
-        table.add_row([x.strip() for x in row])
+        table.add_row([x.strip() for x in row], copy=False)
 
     return table
 
@@ -2902,6 +5635,307 @@ def from_db_cursor(cursor: Cursor, **kwargs) -> PrettyTable | None:
     return None
 
 
+def _unbox_numpy_column(column) -> Sequence[Any]:
+    """Convert a 1-D NumPy array to an array of ints or floats where possible,
+    without making a Python object per value, else to a list."""
+    kind, size = column.dtype.kind, column.dtype.itemsize
+    if kind == "i" or (kind == "u" and size < 8):
+        ints = array("q")
+        ints.frombytes(column.astype("=i8").tobytes())
+        return ints
+    if kind == "f" and size <= 8:
+        if size < 8:
+            # Go through NumPy's shortest repr, so a float32 0.1 shows as 0.1
+            # and not as 0.10000000149011612
+            column = column.astype("U").astype("f8")
+        floats = array("d")
+        floats.frombytes(column.astype("=f8").tobytes())
+        return floats
+    return column.tolist()
+
+
+def from_numpy(
+    ndarray, field_names: Sequence[str] | None = None, **kwargs
+) -> PrettyTable:
+    """Make a table from a 2-D or a structured NumPy array.
+
+    The table uses columnar storage unless told otherwise, and keeps columns of
+    ints and floats packed, so large numeric arrays go in without boxing every
+    value.  Field names default to those of a structured array."""
+    if ndarray.dtype.names is not None and ndarray.ndim == 1:
+        columns = [ndarray[name] for name in ndarray.dtype.names]
+        if field_names is None:
+            field_names = ndarray.dtype.names
+    elif ndarray.ndim == 2:
+        columns = list(ndarray.T)
+    else:
+        msg = f"Can't make a table from a {ndarray.ndim}-D array"
+        raise ValueError(msg)
+    if field_names is None:
+        field_names = [f"Field {n + 1}" for n in range(len(columns))]
+    elif len(field_names) != len(columns):
+        msg = (
+            "Field name list has incorrect number of values, "
+            f"(actual) {len(field_names)}!={len(columns)} (expected)"
+        )
+        raise ValueError(msg)
+    return _from_columns(
+        field_names, [_unbox_numpy_column(column) for column in columns], kwargs
+    )
+
+
+def _from_columns(
+    field_names: Sequence[str], columns: list[Sequence[Any]], kwargs: dict[str, Any]
+) -> PrettyTable:
+    """Make a table, in columnar storage unless told otherwise, from columns"""
+    kwargs.setdefault("storage", "columnar")
+    table = PrettyTable(**kwargs)
+    for name, column in zip(field_names, columns):
+        table.add_column(name, column)
+    # The table had no fields when it applied these, so apply them to the columns
+    table._column_specific_args()
+    return table
+
+
+class _DtypeKind(IntEnum):
+    """Data types of the dataframe interchange protocol"""
+
+    INT = 0
+    UINT = 1
+    FLOAT = 2
+    BOOL = 20
+    STRING = 21
+    DATETIME = 22
+    CATEGORICAL = 23
+
+
+class _NullKind(IntEnum):
+    """How the dataframe interchange protocol marks missing values"""
+
+    NON_NULLABLE = 0
+    USE_NAN = 1
+    USE_SENTINEL = 2
+    USE_BITMASK = 3
+    USE_BYTEMASK = 4
+
+
+_DATETIME_UNITS: Final = {"s": 1, "m": 10**3, "u": 10**6, "n": 10**9}
+
+
+def _buffer_typecode(kind: int, bitwidth: int) -> str:
+    if kind == _DtypeKind.FLOAT and bitwidth in (32, 64):
+        return "f" if bitwidth == 32 else "d"
+    # Dates and times are kept as signed ints, booleans as bytes
+    typecodes = {
+        _DtypeKind.INT: "bhilq",
+        _DtypeKind.DATETIME: "bhilq",
+        _DtypeKind.UINT: "BHILQ",
+        _DtypeKind.BOOL: "BHILQ",
+    }.get(_DtypeKind(kind), "")
+    for typecode in typecodes:
+        if array(typecode).itemsize * 8 == bitwidth:
+            return typecode
+    msg = f"Can't read a buffer of {bitwidth}-bit values of kind {kind}"
+    raise ValueError(msg)
+
+
+def _read_buffer(buffer, dtype: tuple, offset: int, size: int) -> array:
+    """Copy size values, from the offset-th on, out of an interchange protocol
+    buffer into an array."""
+    import ctypes
+
+    kind, bitwidth, _, endianness = dtype
+    values = array(_buffer_typecode(kind, bitwidth))
+    itemsize = values.itemsize
+    values.frombytes(ctypes.string_at(buffer.ptr + offset * itemsize, size * itemsize))
+    if endianness in "<>" and (endianness == "<") != (sys.byteorder == "little"):
+        values.byteswap()
+    return values
+
+
+def _read_bits(buffer, offset: int, size: int) -> list[bool]:
+    import ctypes
+
+    data = ctypes.string_at(buffer.ptr, (offset + size + 7) // 8)
+    return [bool(data[i >> 3] >> (i & 7) & 1) for i in range(offset, offset + size)]
+
+
+def _shortest_floats(values: Iterable[float], fmt: str) -> array:
+    """Turn float16 ("e") or float32 ("f") values into the floats with the
+    shortest repr that round-trip through that format, as NumPy and pandas show
+    them: 0.1 rather than 0.10000000149011612."""
+    import struct
+
+    shortest = array("d")
+    start = 2 if fmt == "e" else 6
+    for value in values:
+        exact = struct.pack(fmt, value)
+        for digits in range(start, 18):
+            short = float(f"{value:.{digits}g}")
+            if struct.pack(fmt, short) == exact:
+                break
+        shortest.append(short)
+    return shortest
+
+
+def _to_datetimes(values: Iterable[Any], fmt: str) -> list[Any]:
+    """Convert interchange protocol dates ("tdD", "tdm") or timestamps
+    ("ts<unit>:<timezone>") to date or datetime objects."""
+    import datetime as dt
+
+    if fmt == "tdD":
+        epoch = dt.date(1970, 1, 1)
+        return [epoch + dt.timedelta(days=value) for value in values]
+    if fmt == "tdm":
+        epoch = dt.date(1970, 1, 1)
+        return [epoch + dt.timedelta(days=value // 86_400_000) for value in values]
+    if not fmt.startswith("ts") or fmt[2:3] not in _DATETIME_UNITS:
+        msg = f"Can't read datetime format {fmt!r}"
+        raise ValueError(msg)
+    per_second = _DATETIME_UNITS[fmt[2]]
+    zone = fmt[4:]
+    start = dt.datetime(1970, 1, 1)
+    if zone:
+        start = start.replace(tzinfo=dt.timezone.utc)
+    times = [
+        start + dt.timedelta(microseconds=value * 10**6 // per_second)
+        for value in values
+    ]
+    if zone and zone.upper() != "UTC":
+        tzinfo: dt.tzinfo
+        if zone[0] in "+-":
+            hours, _, minutes = zone[1:].partition(":")
+            offset = dt.timedelta(hours=int(hours), minutes=int(minutes or 0))
+            tzinfo = dt.timezone(-offset if zone[0] == "-" else offset)
+        else:
+            import zoneinfo
+
+            tzinfo = zoneinfo.ZoneInfo(zone)
+        times = [time.astimezone(tzinfo) for time in times]
+    return times
+
+
+def _interchange_nulls(column, raw: Sequence[Any]) -> list[bool] | None:
+    """Say which values of an interchange protocol column are missing, or
+    return None if none are.  NaN floats are left as they are."""
+    null_kind, sentinel = column.describe_null
+    if column.null_count == 0:
+        return None
+    if null_kind == _NullKind.USE_SENTINEL:
+        nulls = [value == sentinel for value in raw]
+    elif null_kind in (_NullKind.USE_BITMASK, _NullKind.USE_BYTEMASK):
+        validity, validity_dtype = column.get_buffers()["validity"]
+        offset, size = column.offset, column.size()
+        if null_kind == _NullKind.USE_BITMASK:
+            valid: Sequence[Any] = _read_bits(validity, offset, size)
+        else:
+            valid = _read_buffer(validity, validity_dtype, offset, size)
+        nulls = [bool(flag) == bool(sentinel) for flag in valid]
+    else:
+        return None
+    return nulls if any(nulls) else None
+
+
+def _interchange_column(column) -> Sequence[Any]:
+    """Read a column of the dataframe interchange protocol, a buffer at a time,
+    into an array of ints or floats where possible, else a list, with None for
+    missing values."""
+    kind, bitwidth, fmt, _ = column.dtype
+    offset, size = column.offset, column.size()
+    buffers = column.get_buffers()
+    data, data_dtype = buffers["data"]
+    raw: Sequence[Any]
+    if kind == _DtypeKind.STRING:
+        import ctypes
+
+        offsets_buffer, offsets_dtype = buffers["offsets"]
+        offsets = _read_buffer(offsets_buffer, offsets_dtype, offset, size + 1)
+        text = ctypes.string_at(data.ptr, offsets[-1]) if size else b""
+        bounds = zip(offsets, offsets[1:])
+        if text.isascii():
+            # Byte offsets are character offsets, so decode it all at once
+            whole = text.decode("ascii")
+            raw = [whole[start:end] for start, end in bounds]
+        else:
+            raw = [text[start:end].decode() for start, end in bounds]
+    elif kind == _DtypeKind.BOOL and bitwidth == 1:
+        raw = _read_bits(data, offset, size)
+    elif kind == _DtypeKind.FLOAT and bitwidth == 16:
+        import ctypes
+        import struct
+
+        halves = ctypes.string_at(data.ptr + offset * 2, size * 2)
+        raw = [value for (value,) in struct.iter_unpack("e", halves)]
+    else:
+        raw = _read_buffer(data, data_dtype, offset, size)
+
+    nulls = _interchange_nulls(column, raw)
+    values: Sequence[Any]
+    if kind == _DtypeKind.CATEGORICAL:
+        categories = _interchange_column(column.describe_categorical["categories"])
+        values = [
+            None if nulls and nulls[index] else categories[code]
+            for index, code in enumerate(raw)
+        ]
+        return values
+    if kind == _DtypeKind.DATETIME:
+        if nulls:
+            present = _to_datetimes((v for v, n in zip(raw, nulls) if not n), fmt)
+            found = iter(present)
+            return [None if null else next(found) for null in nulls]
+        return _to_datetimes(raw, fmt)
+    if kind == _DtypeKind.BOOL:
+        values = [bool(value) for value in raw]
+    elif kind == _DtypeKind.FLOAT:
+        if bitwidth < 64:
+            raw = _shortest_floats(raw, "f" if bitwidth == 32 else "e")
+        values = raw
+    elif kind in (_DtypeKind.INT, _DtypeKind.UINT):
+        try:
+            values = array("q", raw)
+        except OverflowError:
+            values = list(raw)
+    elif kind == _DtypeKind.STRING:
+        values = raw
+    else:
+        msg = f"Can't read interchange protocol columns of kind {kind}"
+        raise ValueError(msg)
+    if nulls:
+        values = [None if null else value for value, null in zip(values, nulls)]
+    return values
+
+
+def _join_chunks(parts: list[Sequence[Any]]) -> Sequence[Any]:
+    if len(parts) == 1:
+        return parts[0]
+    first = parts[0]
+    joined: MutableSequence[Any] = []
+    if isinstance(first, array) and all(
+        isinstance(part, array) and part.typecode == first.typecode for part in parts
+    ):
+        joined = first[:0]
+    for part in parts:
+        joined.extend(part)
+    return joined
+
+
+def from_dataframe(dataframe, **kwargs) -> PrettyTable:
+    """Make a table from any dataframe supporting the dataframe interchange
+    protocol (its __dataframe__ method), such as pandas, Polars or PyArrow ones.
+
+    Columns are read a buffer at a time, without going through the rows, into
+    a table in columnar storage unless told otherwise.  Missing values become
+    None."""
+    frame = dataframe.__dataframe__(allow_copy=True)
+    field_names = [str(name) for name in frame.column_names()]
+    chunks: list[list[Sequence[Any]]] = [[] for _ in field_names]
+    for chunk in frame.get_chunks():
+        for parts, column in zip(chunks, chunk.get_columns()):
+            parts.append(_interchange_column(column))
+    columns = [_join_chunks(parts) for parts in chunks]
+    return _from_columns(field_names, columns, kwargs)
+
+
 def from_json(json_string: str | bytes, **kwargs) -> PrettyTable:
     import json
 
@@ -2910,7 +5944,7 @@ def from_json(json_string: str | bytes, **kwargs) -> PrettyTable:
     table.field_names = objects[0]
     for obj in objects[1:]:
         row = [obj[key] for key in table.field_names]
-        table.add_row(row)
+        table.add_row(row, copy=False)
     return table
 
 
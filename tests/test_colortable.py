@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+
 import pytest
 from test_prettytable import CITY_DATA, CITY_DATA_HEADER
 
@@ -55,6 +57,13 @@ class TestColorTable:
 
         assert dict1 == dict2
 
+    def test_write_to(self, row_colortable: ColorTable) -> None:
+        fp = io.StringIO()
+        row_colortable.write_to(fp)
+        assert fp.getvalue() == row_colortable.get_string()
+        assert fp.getvalue().endswith(RESET_CODE)
+        assert "\n".join(row_colortable.iter_lines()) == row_colortable.get_string()
+
 
 class TestFormatCode:
     def test_basic(self) -> None:
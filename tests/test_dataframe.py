@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import datetime as dt
+from array import array
+
+import pytest
+from test_prettytable import CITY_DATA, CITY_DATA_HEADER
+
+from prettytable import PrettyTable, from_dataframe
+from prettytable.prettytable import _DictColumn
+
+pytestmark = pytest.mark.filterwarnings(
+    "ignore:The Dataframe Interchange Protocol is deprecated"
+)
+
+
+class TestPandasConstructor:
+    @pytest.fixture
+    def pd(self):
+        return pytest.importorskip("pandas")
+
+    def test_city_data(self, pd, city_data: PrettyTable) -> None:
+        frame = pd.DataFrame(CITY_DATA, columns=CITY_DATA_HEADER)
+        table = from_dataframe(frame)
+        assert table.field_names == CITY_DATA_HEADER
+        assert table.rows == city_data.rows
+        assert table.storage == "columnar"
+        assert [type(column) for column in table._rows.columns] == [
+            _DictColumn,
+            array,
+            array,
+            array,
+        ]
+        assert table.get_string() == city_data.get_string()
+
+    def test_missing_values(self, pd) -> None:
+        frame = pd.DataFrame(
+            {
+                "name": ["a", None, "c"],
+                "count": pd.array([1, None, 3], dtype="Int64"),
+                "kind": pd.Categorical(["x", None, "y"]),
+                "when": pd.to_datetime(
+                    ["2024-01-01 00:00:00", "2024-01-02 03:04:05", None]
+                ),
+                "ratio": [0.5, None, 2.0],
+            }
+        )
+        table = from_dataframe(frame, storage="rows")
+        assert table.rows[0] == ["a", 1, "x", dt.datetime(2024, 1, 1), 0.5]
+        assert table.rows[1][:3] == [None, None, None]
+        assert table.rows[1][3] == dt.datetime(2024, 1, 2, 3, 4, 5)
+        assert str(table.rows[1][4]) == "nan"
+        assert table.rows[2] == ["c", 3, "y", None, 2.0]
+
+    def test_value_types(self, pd) -> None:
+        np = pytest.importorskip("numpy")
+        frame = pd.DataFrame(
+            {
+                "small": np.array([1, -2], dtype="i1"),
+                "big": np.array([2**64 - 1, 0], dtype="u8"),
+                "single": np.array([0.1, 1 / 3], dtype="f4"),
+                "flag": [True, False],
+                "text": ["日本", "ascii"],
+            }
+        )
+        table = from_dataframe(frame)
+        assert table.rows == [
+            [1, 2**64 - 1, 0.1, True, "日本"],
+            [-2, 0, 0.33333334, False, "ascii"],
+        ]
+
+    def test_column_options(self, pd, city_data: PrettyTable) -> None:
+        frame = pd.DataFrame(CITY_DATA, columns=CITY_DATA_HEADER)
+        table = from_dataframe(frame, float_format=".2", int_format="09")
+        city_data.float_format = ".2"
+        city_data.int_format = "09"
+        assert table.float_format["Annual Rainfall"] == ".2"
+        assert table.int_format["Population"] == "09"
+        assert table.get_string() == city_data.get_string()
+
+
+class TestArrowConstructor:
+    @pytest.fixture
+    def pa(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_chunks_and_slices(self, pa) -> None:
+        part = pa.table(
+            {
+                "id": [1, None, 3],
+                "ok": [True, None, False],
+                "name": ["x", "yy", None],
+                "at": pa.array([0, None, 86_400_000_000], pa.timestamp("us", "UTC")),
+            }
+        )
+        table = from_dataframe(pa.concat_tables([part, part]).slice(1, 4))
+        utc = dt.timezone.utc
+        assert table.rows == [
+            [None, None, "yy", None],
+            [3, False, None, dt.datetime(1970, 1, 2, tzinfo=utc)],
+            [1, True, "x", dt.datetime(1970, 1, 1, tzinfo=utc)],
+            [None, None, "yy", None],
+        ]
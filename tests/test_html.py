@@ -581,5 +581,35 @@ class TestHtmlOutput:
         </tr>
     </tbody>
 </table>
+""".strip()
+        )
+
+    def test_html_ignores_none_format(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.none_format["Field 2"] = "N/A"
+        table.add_row(["value 1", None])
+        table.add_row([None, "value 2"])
+        result = table.get_html_string()
+        assert (
+            result.strip()
+            == """
+<table>
+    <thead>
+        <tr>
+            <th>Field 1</th>
+            <th>Field 2</th>
+        </tr>
+    </thead>
+    <tbody>
+        <tr>
+            <td>value 1</td>
+            <td>None</td>
+        </tr>
+        <tr>
+            <td>None</td>
+            <td>value 2</td>
+        </tr>
+    </tbody>
+</table>
 """.strip()
         )
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+from test_prettytable import CITY_DATA, CITY_DATA_HEADER
+
+from prettytable import PrettyTable, from_numpy
+
+np = pytest.importorskip("numpy")
+
+
+class TestNumpyConstructor:
+    def test_2d_array(self) -> None:
+        table = from_numpy(np.arange(6).reshape(3, 2), field_names=["a", "b"])
+        assert table.field_names == ["a", "b"]
+        assert table.rows == [[0, 1], [2, 3], [4, 5]]
+        assert table.storage == "columnar"
+        assert all(isinstance(column, array) for column in table._rows.columns)
+
+    def test_default_field_names(self) -> None:
+        table = from_numpy(np.zeros((2, 3)))
+        assert table.field_names == ["Field 1", "Field 2", "Field 3"]
+        assert table.rows == [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+    def test_structured_array(self, city_data: PrettyTable) -> None:
+        dtype = [
+            ("City name", "U16"),
+            ("Area", "i4"),
+            ("Population", "u4"),
+            ("Annual Rainfall", "f8"),
+        ]
+        records = np.array([tuple(row) for row in CITY_DATA], dtype=dtype)
+        table = from_numpy(records)
+        assert table.field_names == CITY_DATA_HEADER
+        assert table.rows == city_data.rows
+        for other in (city_data, table):
+            other.int_format["Population"] = "09"
+            other.float_format["Annual Rainfall"] = ".2"
+        assert table.get_string() == city_data.get_string()
+
+    def test_value_types(self) -> None:
+        records = np.array(
+            [(0.1, True, 2**64 - 1), (1 / 3, False, 1)],
+            dtype=[("f", "f4"), ("b", "?"), ("u", "u8")],
+        )
+        table = from_numpy(records)
+        assert table.rows == [[0.1, True, 2**64 - 1], [0.33333334, False, 1]]
+        assert [type(value) for value in table.rows[0]] == [float, bool, int]
+
+    def test_row_storage(self) -> None:
+        table = from_numpy(np.arange(4).reshape(2, 2), storage="rows", align="r")
+        assert table.storage == "rows"
+        assert table.rows == [[0, 1], [2, 3]]
+        assert table.align["Field 1"] == table.align["Field 2"] == "r"
+
+    def test_column_options(self) -> None:
+        table = from_numpy(
+            np.array([[1.5, 2.0]]),
+            field_names=["a", "b"],
+            float_format=".2",
+            max_width=6,
+        )
+        assert table.float_format == {"a": ".2", "b": ".2"}
+        assert table.max_width == {"a": 6, "b": 6}
+        assert "| 1.50 | 2.00 |" in table.get_string()
+
+    def test_array_not_shared(self) -> None:
+        values = np.arange(3).reshape(3, 1)
+        table = from_numpy(values)
+        values[0, 0] = 99
+        table.add_row([3])
+        assert table.rows == [[0], [1], [2], [3]]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            from_numpy(np.arange(3))
+        with pytest.raises(ValueError):
+            from_numpy(np.zeros((2, 2)), field_names=["a"])
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import io
 import sqlite3
+from array import array
+from collections.abc import Iterator
 from math import e, pi, sqrt
 from typing import Any
 
@@ -15,6 +18,7 @@ from prettytable import (
     RowType,
     TableStyle,
     VRuleStyle,
+    WidthCache,
     from_db_cursor,
 )
 
@@ -150,6 +154,22 @@ class TestNoneOption:
 +---------+------------+---------+
 |  Hello  | 0123456789 |  World  |
 +---------+------------+---------+
+""".strip()
+        )
+
+    def test_replace_none_multiline_cell(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.none_format["Field 2"] = "0123456789"
+        table.add_row(["Hello", "None\nWorld"])
+        assert (
+            table.get_string().strip()
+            == """
++---------+------------+
+| Field 1 |  Field 2   |
++---------+------------+
+|  Hello  | 0123456789 |
+|         |   World    |
++---------+------------+
 """.strip()
         )
 
@@ -277,6 +297,67 @@ class TestDelete:
         with pytest.raises(IndexError):
             city_data.del_row(10)
 
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_delete_rows(self, storage: str) -> None:
+        table = PrettyTable(CITY_DATA_HEADER, storage=storage, memory_budget=0)
+        for index, row in enumerate(CITY_DATA):
+            table.add_row(row, divider=index % 2 == 1)
+        table.del_rows([4, 0, -1, 4])
+        assert table.rows == [CITY_DATA[i] for i in (1, 2, 3, 5)]
+        assert table.dividers == [True, False, True, True]
+        table.del_rows_where(lambda row: row[1] > 2000)
+        assert table.rows == [CITY_DATA[i] for i in (2, 3, 5)]
+        assert table.dividers == [False, True, True]
+        table.del_rows([])
+        assert len(table.rows) == 3
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_column_changes_without_rows(self, storage: str) -> None:
+        table = PrettyTable(["a", "b", "c"], storage=storage, memory_budget=0)
+        table.del_column("c")
+        table.add_column("d", [])
+        table.del_column("a")
+        assert table.field_names == ["b", "d"]
+        assert table.rows == []
+        table.add_row([1, 2])
+        table.del_row(0)
+        table.del_column("b")
+        table.add_row([3])
+        assert table.rows == [[3]]
+        assert table.get_csv_string().split() == ["d", "3"]
+
+    def test_delete_rows_unavailable(self, city_data: PrettyTable) -> None:
+        with pytest.raises(IndexError):
+            city_data.del_rows([0, 7])
+        assert len(city_data.rows) == 7
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_truncate_and_keep_last(self, storage: str) -> None:
+        table = PrettyTable(CITY_DATA_HEADER, storage=storage, memory_budget=0)
+        table.add_rows(CITY_DATA)
+        table.keep_last(5)
+        assert table.rows == CITY_DATA[2:]
+        table.truncate(3)
+        assert table.rows == CITY_DATA[2:5]
+        table.truncate(10)
+        table.keep_last(10)
+        assert table.rows == CITY_DATA[2:5]
+        table.keep_last(0)
+        assert table.rows == []
+        assert table.dividers == []
+        with pytest.raises(ValueError):
+            table.truncate(-1)
+
+    def test_truncate_lazy(self) -> None:
+        from prettytable.prettytable import _PULL_BATCH_SIZE
+
+        table = PrettyTable(["Field 1"])
+        source = iter([[n] for n in range(1000)])
+        table.add_rows(source, lazy=True)
+        table.truncate(3)
+        assert table.rows == [[0], [1], [2]]
+        assert next(source) == [_PULL_BATCH_SIZE]
+
 
 class TestFieldNameLessTable:
     """Make sure that building and stringing a table with no fieldnames works fine"""
@@ -476,6 +557,38 @@ class TestBasic:
         table = PrettyTable(CITY_DATA_HEADER)
         table.add_rows(CITY_DATA)
         assert str(city_data) == str(table)
+        assert table.rows == city_data.rows
+        assert table.dividers == city_data.dividers
+        assert table.rows[0] is not CITY_DATA[0]
+
+    def test_add_rows_from_generator(self, city_data: PrettyTable) -> None:
+        table = PrettyTable(CITY_DATA_HEADER)
+        table.add_rows(tuple(row) for row in CITY_DATA)
+        assert str(city_data) == str(table)
+
+    def test_add_rows_from_buffer(self) -> None:
+        buffer = memoryview(array("q", range(6)).tobytes()).cast("q", [3, 2])
+        table = PrettyTable()
+        table.add_rows(buffer)
+        assert table.field_names == ["Field 1", "Field 2"]
+        assert table.rows == [[0, 1], [2, 3], [4, 5]]
+
+    def test_add_rows_bad_length(self) -> None:
+        table = PrettyTable(["a", "b"])
+        with pytest.raises(ValueError, match=r"\(actual\) 3!=2 \(expected\)"):
+            table.add_rows([[1, 2], [3, 4, 5]])
+        assert table.rows == []
+        table.add_rows([[1, 2], [3, 4, 5]], validate=False)
+        assert len(table.rows) == 2
+
+    def test_add_rows_bad_length_without_field_names(self) -> None:
+        table = PrettyTable()
+        with pytest.raises(ValueError, match=r"\(actual\) 1!=2 \(expected\)"):
+            table.add_rows([[1, 2], [3]])
+        assert table.field_names == []
+        assert table.rows == []
+        table.add_rows([[1, 2, 3]])
+        assert table.field_names == ["Field 1", "Field 2", "Field 3"]
 
     def _test_no_blank_lines(self, table: PrettyTable) -> None:
         string = table.get_string()
@@ -718,6 +831,248 @@ class TestRowFilter:
         assert self.EXPECTED_RESULT == table.get_string().strip()
 
 
+class TestWhere:
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_where(self, storage: str) -> None:
+        table = PrettyTable(CITY_DATA_HEADER, storage=storage)
+        table.add_rows(CITY_DATA)
+        table.where(Population__gt=999999)
+        assert table.get_string() == TestRowFilter.EXPECTED_RESULT
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar"])
+    def test_operators(self, storage: str) -> None:
+        table = PrettyTable(["City", "Area"], storage=storage)
+        table.add_rows([row[:2] for row in CITY_DATA])
+
+        def shown(**conditions) -> list[str]:
+            table.where(**conditions)
+            return [row[0] for row in table._get_rows(table._get_options({}))]
+
+        assert shown(City="Perth") == ["Perth"]
+        assert shown(City__eq="Perth", Area=5386) == ["Perth"]
+        assert shown(City__ne="Perth", Area__ge=2058) == ["Brisbane", "Sydney"]
+        assert shown(Area__lt=1357) == ["Adelaide", "Darwin"]
+        assert shown(Area__le=1357) == ["Adelaide", "Darwin", "Hobart"]
+        assert shown(Area__gt=1000, Area__lt=1500) == ["Adelaide", "Hobart"]
+        assert shown(City__in=["Hobart", "Darwin", "Cairns"]) == ["Darwin", "Hobart"]
+        assert shown(City__in=[]) == []
+        assert len(shown()) == 7
+
+    def test_field_names(self) -> None:
+        table = PrettyTable(["City name", "a__in", "Area"])
+        table.add_rows([["Darwin", 1, 112], ["Hobart", 2, 1357]])
+        table.where(**{"City name__in": {"Hobart"}})
+        assert table.get_csv_string().splitlines()[1:] == ["Hobart,2,1357"]
+        table.where(a__in=1)
+        assert table.get_csv_string().splitlines()[1:] == ["Darwin,1,112"]
+        with pytest.raises(ValueError, match="Invalid field name: Population"):
+            table.where(Population__gt=0)
+        with pytest.raises(ValueError, match="Invalid field name: Area__like"):
+            table.where(Area__like=0)
+
+        table.field_names = ["City", "Count", "Size"]
+        assert table.get_csv_string().splitlines()[1:] == ["Darwin,1,112"]
+        table.del_column("Count")
+        assert len(table.get_csv_string().splitlines()) == 3
+
+    def test_values_not_compared(self) -> None:
+        table = PrettyTable(["Key", "Value"], storage="columnar")
+        table.add_rows([["a", 1], [None, 2], ["b", None], ["c", [3]]])
+        table.where(Key__ge="b")
+        assert table.get_csv_string().split()[1:] == ["b,", "c,[3]"]
+        table.where(Value__lt=2)
+        assert table.get_csv_string().split()[1:] == ["a,1"]
+        table.where(Value__in=[1, [3]])
+        assert table.get_csv_string().split()[1:] == ["a,1", "c,[3]"]
+
+    def test_with_other_options(self, city_data: PrettyTable) -> None:
+        city_data.where(Area__gt=1300)
+        city_data.row_filter = lambda row: row[-1] < 1000
+        assert city_data.get_csv_string(sortby="Area").split("\r\n")[1:-1] == [
+            "Hobart,1357,205556,619.5",
+            "Melbourne,1566,3806092,646.9",
+            "Perth,5386,1554769,869.4",
+        ]
+        assert city_data.get_csv_string(start=1, end=2).split("\r\n")[1:-1] == [
+            "Melbourne,1566,3806092,646.9"
+        ]
+        city_data.add_autoindex("#", virtual=True)
+        city_data.where(**{"#__in": {2, 4}})
+        assert city_data.get_csv_string().splitlines()[1:] == [
+            "4,Hobart,1357,205556,619.5"
+        ]
+        # Slices keep the conditions, numbering their rows afresh
+        assert city_data[3:].get_csv_string().splitlines()[1:] == [
+            "4,Perth,5386,1554769,869.4"
+        ]
+
+    def test_table_changes(self) -> None:
+        table = PrettyTable(["Value"], render_cache=True)
+        table.add_rows([[1], [5], [2]])
+        table.where(Value__ge=2)
+        assert table.get_csv_string().split() == ["Value", "5", "2"]
+        table.add_row([3])
+        table.add_row([0])
+        assert table.get_string().count("|") == 2 * 4
+        table.del_row(1)
+        assert table.get_csv_string().split() == ["Value", "2", "3"]
+        table.where()
+        assert table.get_csv_string().split() == ["Value", "1", "2", "3", "0"]
+
+
+class TestIndexes:
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    @pytest.mark.parametrize("kind", ["hash", "sorted"])
+    def test_lookup(self, storage: str, kind: str) -> None:
+        table = PrettyTable(["Host", "Load"], storage=storage)
+        table.add_rows([["a", 3], ["b", 1], ["a", 2], ["c", 1]])
+        assert table.lookup("Host", "a") == [0, 2]
+        table.create_index("Host", kind)
+        table.create_index("Load", kind)
+        assert table.lookup("Host", "a") == [0, 2]
+        assert table.lookup("Host", "d") == []
+        assert table.lookup("Host", 1) == []
+        assert table.lookup("Load", 1) == [1, 3]
+        assert table.lookup("Load", 1.0) == [1, 3]
+
+        table.add_row(["d", 1])
+        table.add_rows([["a", 5]])
+        assert table.lookup("Load", 1) == [1, 3, 4]
+        assert table.lookup("Host", "a") == [0, 2, 5]
+        table.del_row(0)
+        assert table.lookup("Host", "a") == [1, 4]
+        table.del_rows_where(lambda row: row[1] == 1)
+        assert table.lookup("Host", "a") == [0, 1]
+        table.clear_rows()
+        assert table.lookup("Host", "a") == []
+        table.add_row(["a", 0])
+        assert table.lookup("Host", "a") == [0]
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar"])
+    def test_range(self, storage: str) -> None:
+        table = PrettyTable(CITY_DATA_HEADER, storage=storage)
+        table.add_rows(CITY_DATA)
+        expected = {
+            (1300, 2000): [3, 5],
+            (1300, None): [1, 3, 4, 5, 6],
+            (None, 1300): [0, 2],
+            (None, None): list(range(7)),
+            (2000, 1300): [],
+            (1357, 1358): [3],
+        }
+        for (low, high), indices in expected.items():
+            assert table.range("Area", low, high) == indices
+        table.create_index("Area", "sorted")
+        for (low, high), indices in expected.items():
+            assert table.range("Area", low, high) == indices
+        assert table.range("Area", "a") == []
+        assert table.range("City name", "C", "P") == [2, 3, 5]
+
+    def test_where(self, city_data: PrettyTable) -> None:
+        expected = city_data.get_string(row_filter=lambda row: 1300 < row[1] < 2100)
+        city_data.where(Area__gt=1300, Area__lt=2100)
+        assert city_data.get_string() == expected
+        city_data.create_index("Area", "sorted")
+        assert city_data._indexes["Area"].rowcount == 7
+        assert city_data.get_string() == expected
+        city_data.create_index("City name", "hash")
+        city_data.where(
+            Area__lt=3000, **{"City name__in": {"Perth", "Hobart", "Sydney", "Ayr"}}
+        )
+        assert city_data.get_csv_string().splitlines()[1:] == [
+            "Hobart,1357,205556,619.5",
+            "Sydney,2058,4336374,1214.8",
+        ]
+        city_data.where(**{"City name": "Perth", "Area__ne": 5386})
+        assert city_data.get_csv_string().splitlines()[1:] == []
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    @pytest.mark.parametrize("kind", ["hash", "sorted"])
+    def test_kept_up_to_date(self, storage: str, kind: str) -> None:
+        table = PrettyTable(["Host", "Load"], storage=storage)
+        table.add_rows([["a", 3], ["b", 1], ["a", 2], ["c", 1], ["a", 1]])
+        table.create_index("Host", kind)
+        table.create_index("Load", kind)
+        indexes = dict(table._indexes)
+        table.del_row(1)
+        table.del_row(-2)
+        table.add_divider()
+        table.add_column("Zone", ["x", "y", "z"])
+        table.del_column("Zone")
+        assert table._indexes == indexes
+        assert all(index.rowcount == 3 for index in indexes.values())
+        assert table.lookup("Host", "a") == [0, 1, 2]
+        assert table.lookup("Host", "b") == table.lookup("Host", "c") == []
+        assert table.lookup("Load", 1) == [2]
+        assert table.range("Load", 2) == [0, 1]
+
+        table.add_row(["d", 1])
+        table.del_row(0)
+        assert table.lookup("Host", "d") == [2]
+        assert table.lookup("Load", 1) == [1, 2]
+
+    def test_virtual_index_after_del_row(self) -> None:
+        table = PrettyTable(["a"])
+        table.add_rows([[1], [2], [3]])
+        table.add_autoindex("Index", virtual=True)
+        table.create_index("Index", "sorted")
+        table.create_index("a")
+        table.del_row(0)
+        assert table.lookup("Index", 1) == [0]
+        assert table.lookup("Index", 3) == []
+        assert table.lookup("a", 3) == [1]
+
+    def test_field_changes(self) -> None:
+        table = PrettyTable(["a", "b"])
+        table.add_rows([[1, "x"], [2, "y"]])
+        table.create_index("a")
+        table.create_index("b", "sorted")
+        table.field_names = ["A", "B"]
+        assert table.lookup("A", 2) == [1]
+        assert set(table._indexes) == {"A", "B"}
+        table.del_column("A")
+        assert set(table._indexes) == {"B"}
+        table.add_autoindex("Index", virtual=True)
+        table.create_index("Index", "sorted")
+        assert table.range("Index", 2) == [1]
+        table.drop_index("Index")
+        table.drop_index("Index")
+        assert set(table._indexes) == {"B"}
+        table.clear()
+        assert table._indexes == {}
+
+    def test_invalid(self) -> None:
+        table = PrettyTable(["a", "b"])
+        table.add_rows([[1, [2]], [None, [3]]])
+        with pytest.raises(ValueError, match="Invalid field name: c"):
+            table.create_index("c")
+        with pytest.raises(ValueError, match="Invalid field name: c"):
+            table.lookup("c", 1)
+        with pytest.raises(ValueError, match="Must be hash or sorted"):
+            table.create_index("a", "btree")
+        with pytest.raises(TypeError):
+            table.create_index("a", "sorted")
+        with pytest.raises(TypeError):
+            table.create_index("b", "hash")
+        assert table._indexes == {}
+
+        table.create_index("b", "sorted")
+        table.add_row([2, None])
+        assert table.lookup("b", [2]) == [0]
+        assert table._indexes == {}
+
+    def test_dropped_for_value_it_cant_take(self, city_data: PrettyTable) -> None:
+        city_data.create_index("Area", "sorted")
+        city_data.create_index("City name")
+        city_data.add_row([["Ayr"], -1, 8738, 0.0])
+        city_data.add_row(["Palmerston", "n/a", 0, 0.0])
+        city_data.where(Area__lt=0, **{"City name__ne": "Perth"})
+        assert city_data.get_csv_string().splitlines()[1:] == ["['Ayr'],-1,8738,0.0"]
+        assert city_data._indexes == {}
+        assert city_data.lookup("Area", "n/a") == [8]
+        assert city_data.lookup("City name", ["Ayr"]) == [7]
+
+
 @pytest.fixture(scope="function")
 def float_pt() -> PrettyTable:
     table = PrettyTable(["Constant", "Value"])
@@ -894,6 +1249,85 @@ def test_autoindex(city_data: PrettyTable) -> None:
     assert str(city_data) == str(table2)
 
 
+class TestVirtualIndex:
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_same_as_stored(self, storage: str) -> None:
+        stored = PrettyTable(CITY_DATA_HEADER)
+        stored.add_rows(CITY_DATA)
+        stored.add_autoindex("No")
+        table = PrettyTable(CITY_DATA_HEADER, storage=storage, memory_budget=0)
+        table.add_rows(CITY_DATA)
+        table.add_autoindex("No", virtual=True)
+        assert table.field_names == ["No", *CITY_DATA_HEADER]
+        assert table.rows == stored.rows
+        for kwargs in ({}, {"start": 2, "end": 5}, {"sortby": "Area"}):
+            assert table.get_string(**kwargs) == stored.get_string(**kwargs)
+            assert table.get_csv_string(**kwargs) == stored.get_csv_string(**kwargs)
+        assert table.get_html_string(fields=["No", "Area"]) == stored.get_html_string(
+            fields=["No", "Area"]
+        )
+
+    def test_stays_current(self, city_data: PrettyTable) -> None:
+        city_data.add_autoindex(virtual=True)
+        city_data.del_row(0)
+        city_data.add_row(["Canberra", 814, 456692, 616.4])
+        assert city_data.rows[-1] == [7, "Canberra", 814, 456692, 616.4]
+        numbers = city_data.get_csv_string().splitlines()[1:]
+        assert [line.split(",")[0] for line in numbers] == list("1234567")
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_delete_rows_where(self, storage: str) -> None:
+        table = PrettyTable(CITY_DATA_HEADER, storage=storage, memory_budget=0)
+        table.add_rows(CITY_DATA)
+        table.add_autoindex("No", virtual=True)
+        seen = []
+
+        def odd(row: list[Any]) -> bool:
+            seen.append(row)
+            return row[0] % 2 == 1
+
+        table.del_rows_where(odd)
+        assert seen == [[i, *row] for i, row in enumerate(CITY_DATA, 1)]
+        assert table.rows == [[i, *CITY_DATA[n]] for i, n in enumerate((1, 3, 5), 1)]
+
+    def test_displayed_numbering(self, city_data: PrettyTable) -> None:
+        city_data.add_autoindex(virtual=True, numbering="displayed")
+        lines = city_data.get_csv_string(
+            sortby="Annual Rainfall", reversesort=True, start=1, end=4
+        ).splitlines()
+        assert lines[1:] == [
+            "2,Sydney,2058,4336374,1214.8",
+            "3,Brisbane,5905,1857594,1146.4",
+            "4,Perth,5386,1554769,869.4",
+        ]
+        city_data.row_filter = lambda row: row[2] > 2000
+        lines = city_data.get_csv_string().splitlines()
+        assert [line.split(",")[:2] for line in lines[1:]] == [
+            ["1", "Brisbane"],
+            ["2", "Sydney"],
+            ["3", "Perth"],
+        ]
+
+    def test_delete(self, city_data: PrettyTable) -> None:
+        expected = city_data.get_string()
+        city_data.add_autoindex("No", virtual=True)
+        city_data.field_names = ["#", *CITY_DATA_HEADER]
+        city_data.del_column("#")
+        assert city_data.field_names == CITY_DATA_HEADER
+        assert city_data.get_string() == expected
+
+    def test_invalid(self, city_data: PrettyTable) -> None:
+        with pytest.raises(ValueError):
+            city_data.add_autoindex(virtual=True, numbering="sorted")
+        with pytest.raises(ValueError):
+            city_data.add_autoindex(numbering="displayed")
+        city_data.add_autoindex(virtual=True)
+        with pytest.raises(ValueError):
+            city_data.add_autoindex("Again", virtual=True)
+        with pytest.raises(ValueError):
+            city_data.add_row(["Canberra", 814, 456692, 616.4, 0])
+
+
 @pytest.fixture(scope="function")
 def unpadded_pt() -> PrettyTable:
     table = PrettyTable(header=False, padding_width=0)
@@ -1083,6 +1517,39 @@ class TestBreakOnHyphens:
 class TestWidth:
     colored = "\033[31mC\033[32mO\033[31mL\033[32mO\033[31mR\033[32mE\033[31mD\033[0m"
 
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["1295", "-600.5", "host-01.example", ""],
+            ["abc", colored, "日本語", "tab\there"],
+        ],
+    )
+    def test_block_widths(self, values: list[str]) -> None:
+        import wcwidth  # type: ignore[import-untyped]
+
+        from prettytable.prettytable import _re, _str_block_width, _str_block_widths
+
+        expected = [wcwidth.wcswidth(_re.sub("", value)) for value in values]
+        assert [_str_block_width(value) for value in values] == expected
+        assert _str_block_widths(values) == expected
+
+    def test_mixed_ascii_and_wide(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.add_row(["abc", "日本"])
+        table.add_row(["abcd", "x"])
+        table.align["Field 1"] = "l"
+        assert (
+            table.get_string().strip()
+            == """
++---------+---------+
+| Field 1 | Field 2 |
++---------+---------+
+| abc     |   日本  |
+| abcd    |    x    |
++---------+---------+
+""".strip()
+        )
+
     def test_color(self) -> None:
         table = PrettyTable(["Field 1", "Field 2"])
         table.add_row([self.colored, self.colored])
@@ -1459,6 +1926,776 @@ class TestWidth:
         )
 
 
+class TestRowTemplate:
+    def test_single_and_multi_line_rows(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"], vertical_char="{")
+        table.add_row(["value 1", "multi\nline"])
+        table.add_row(["value 2", "日本"])
+        table.add_row(["a much longer value", "x"])
+        table.max_width["Field 1"] = 10
+        assert (
+            table.get_string(hrules=HRuleStyle.ALL).strip()
+            == """
++------------+---------+
+{  Field 1   { Field 2 {
++------------+---------+
+{  value 1   {  multi  {
+{            {   line  {
++------------+---------+
+{  value 2   {   日本  {
++------------+---------+
+{   a much   {    x    {
+{   longer   {         {
+{   value    {         {
++------------+---------+
+""".strip()
+        )
+
+    def test_hidden_multi_line_field(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.add_row(["value 1", "multi\nline"])
+        table.add_row(["value 2", "single"])
+        assert (
+            table.get_string(fields=["Field 1"]).strip()
+            == """
++---------+
+| Field 1 |
++---------+
+| value 1 |
+|         |
+| value 2 |
++---------+
+""".strip()
+        )
+
+
+class TestFragmentCache:
+    def test_reused_across_renders(self, city_data: PrettyTable) -> None:
+        first = city_data.get_string(title="Cities")
+        fragments = dict(city_data._fragments)
+        assert city_data.get_string(title="Cities") == first
+        assert city_data._fragments == fragments
+
+    def test_style_change(self, city_data: PrettyTable) -> None:
+        city_data.get_string()
+        city_data.junction_char = "*"
+        city_data.horizontal_char = "="
+        assert city_data.get_string().splitlines()[0] == (
+            "*===========*======*============*=================*"
+        )
+        city_data.set_style(TableStyle.DEFAULT)
+        assert city_data.get_string().splitlines()[0] == (
+            "+-----------+------+------------+-----------------+"
+        )
+
+    def test_width_change(self, city_data: PrettyTable) -> None:
+        city_data.get_string()
+        city_data.add_row(["Alice Springs", 0, 0, 0.0])
+        lines = city_data.get_string().splitlines()
+        assert len({len(line) for line in lines}) == 1
+        assert lines[0] == "+---------------+------+------------+-----------------+"
+
+    def test_header_style_change(self, city_data: PrettyTable) -> None:
+        city_data.get_string()
+        city_data.header_style = "upper"
+        assert "CITY NAME" in city_data.get_string()
+
+
+class TestLazyRows:
+    @staticmethod
+    def counting(rows: list[list[Any]], read: list[int]) -> Iterator[list[Any]]:
+        for row in rows:
+            read[0] += 1
+            yield row
+
+    @pytest.fixture
+    def read(self) -> list[int]:
+        return [0]
+
+    @pytest.fixture
+    def lazy_city_data(self, read: list[int]) -> PrettyTable:
+        table = PrettyTable(CITY_DATA_HEADER)
+        table.add_rows(self.counting(CITY_DATA * 1000, read), lazy=True)
+        return table
+
+    def test_reads_only_printed_rows(
+        self, city_data: PrettyTable, lazy_city_data: PrettyTable, read: list[int]
+    ) -> None:
+        assert read[0] == 0
+        assert lazy_city_data.get_string(end=7) == city_data.get_string()
+        assert read[0] < 1000
+        assert lazy_city_data[2:4].get_string() == city_data[2:4].get_string()
+        assert lazy_city_data[3].get_string() == city_data[3].get_string()
+        assert read[0] < 1000
+
+    def test_reads_all_when_needed(
+        self, lazy_city_data: PrettyTable, read: list[int]
+    ) -> None:
+        lazy_city_data.get_string(sortby="Area", end=3)
+        assert read[0] == 7000
+        assert lazy_city_data.rowcount == 7000
+        assert len(lazy_city_data.dividers) == 7000
+
+    def test_same_output(self, city_data: PrettyTable, read: list[int]) -> None:
+        table = PrettyTable(CITY_DATA_HEADER)
+        table.add_rows(CITY_DATA[:2])
+        table.add_rows(self.counting(CITY_DATA[2:5], read), lazy=True)
+        table.add_rows(iter(CITY_DATA[5:]), lazy=True, copy=False)
+        for kwargs in (
+            {},
+            {"start": 1, "end": 4},
+            {"start": 1, "end": 4, "oldsortslice": True},
+            {"sortby": "Population"},
+            {"row_filter": lambda row: row[1] > 1500},
+        ):
+            assert table.get_string(**kwargs) == city_data.get_string(**kwargs)
+        assert table.get_json_string() == city_data.get_json_string()
+        assert table.rows == city_data.rows
+        table.add_row(["Canberra", 814, 456692, 616.4], divider=True)
+        assert table.rows[-1] == ["Canberra", 814, 456692, 616.4]
+        assert table.dividers == [False] * 7 + [True]
+
+    def test_field_names_from_first_row(self, read: list[int]) -> None:
+        table = PrettyTable()
+        table.add_rows(self.counting(CITY_DATA * 100, read), lazy=True)
+        assert table.field_names == ["Field 1", "Field 2", "Field 3", "Field 4"]
+        assert 0 < read[0] < 700
+        table.field_names = CITY_DATA_HEADER
+        assert read[0] < 700
+
+    def test_bad_row_raises_when_read(self) -> None:
+        table = PrettyTable(["a", "b"])
+        table.add_rows(iter([[1, 2], [3]]), lazy=True)
+        with pytest.raises(ValueError):
+            table.get_string()
+
+    def test_clear_and_copy(self, lazy_city_data: PrettyTable, read: list[int]) -> None:
+        assert lazy_city_data.copy().rowcount == 7000
+        lazy_city_data.clear_rows()
+        assert lazy_city_data.rowcount == 0
+
+
+class TestUncopiedRows:
+    @pytest.fixture
+    def tuple_city_data(self) -> PrettyTable:
+        table = PrettyTable(CITY_DATA_HEADER)
+        table.add_rows([tuple(row) for row in CITY_DATA], copy=False)
+        return table
+
+    def test_rows_not_copied(self) -> None:
+        row = ("Adelaide", 1295, 1158259, 600.5)
+        table = PrettyTable(CITY_DATA_HEADER)
+        table.add_row(row, copy=False)
+        table.add_row(row)
+        assert table._rows[0] is row
+        assert table._rows[1] == list(row)
+
+    def test_same_output(
+        self, city_data: PrettyTable, tuple_city_data: PrettyTable
+    ) -> None:
+        for kwargs in ({}, {"start": 2, "end": 5}, {"sortby": "Area"}):
+            assert tuple_city_data.get_string(**kwargs) == city_data.get_string(
+                **kwargs
+            )
+        assert tuple_city_data.get_csv_string() == city_data.get_csv_string()
+        assert tuple_city_data.get_json_string() == city_data.get_json_string()
+        assert tuple_city_data[1:3].get_string() == city_data[1:3].get_string()
+
+    def test_column_operations(
+        self, city_data: PrettyTable, tuple_city_data: PrettyTable
+    ) -> None:
+        original = tuple_city_data._rows[0]
+        for table in (city_data, tuple_city_data):
+            table.add_column("Rank", list(range(7, 0, -1)))
+            table.add_autoindex()
+            table.del_column("Area")
+        assert tuple_city_data.get_string() == city_data.get_string()
+        assert [list(row) for row in tuple_city_data.rows] == city_data.rows
+        assert original == tuple(CITY_DATA[0])
+
+    @pytest.mark.usefixtures("init_db")
+    def test_from_db_cursor_copies_rows(self, db_cursor) -> None:
+        db_cursor.execute("SELECT * FROM cities")
+        pt = from_db_cursor(db_cursor)
+        assert pt is not None
+        assert all(isinstance(row, list) for row in pt._rows)
+        assert pt.rows[: len(CITY_DATA)] == [list(row) for row in CITY_DATA]
+
+
+class TestColumnarStorage:
+    @pytest.fixture
+    def columnar_city_data(self) -> PrettyTable:
+        table = PrettyTable(CITY_DATA_HEADER, storage="columnar")
+        for row in CITY_DATA:
+            table.add_row(row)
+        return table
+
+    def test_same_output(
+        self, city_data: PrettyTable, columnar_city_data: PrettyTable
+    ) -> None:
+        for table in (city_data, columnar_city_data):
+            table.float_format["Annual Rainfall"] = ".2"
+            table.int_format["Population"] = "09"
+        for kwargs in ({}, {"start": 2, "end": 5}, {"sortby": "Area"}):
+            assert columnar_city_data.get_string(**kwargs) == city_data.get_string(
+                **kwargs
+            )
+            assert columnar_city_data.get_html_string(
+                **kwargs
+            ) == city_data.get_html_string(**kwargs)
+        assert columnar_city_data.get_csv_string() == city_data.get_csv_string()
+        assert columnar_city_data.rows == city_data.rows
+        assert columnar_city_data[1:3].get_string() == city_data[1:3].get_string()
+
+    def test_packed_columns(self, columnar_city_data: PrettyTable) -> None:
+        from prettytable.prettytable import _ColumnStore, _DictColumn
+
+        store = columnar_city_data._rows
+        assert isinstance(store, _ColumnStore)
+        assert [
+            column.typecode if isinstance(column, array) else None
+            for column in store.columns
+        ] == [None, "q", "q", "d"]
+        columnar_city_data.add_row(["Canberra", "814", 2**70, 616.4])
+        assert [type(column) for column in store.columns] == [
+            _DictColumn,
+            list,
+            list,
+            array,
+        ]
+        assert columnar_city_data.rows[-1] == ["Canberra", "814", 2**70, 616.4]
+
+    def test_column_operations(
+        self, city_data: PrettyTable, columnar_city_data: PrettyTable
+    ) -> None:
+        for table in (city_data, columnar_city_data):
+            table.add_column("Rank", list(range(7, 0, -1)))
+            table.add_autoindex()
+            table.del_column("Area")
+            table.del_row(2)
+        assert columnar_city_data.rows == city_data.rows
+        assert columnar_city_data.get_string() == city_data.get_string()
+
+    def test_add_rows(self, city_data: PrettyTable) -> None:
+        from prettytable.prettytable import _DictColumn
+
+        table = PrettyTable(CITY_DATA_HEADER, storage="columnar")
+        table.add_rows(CITY_DATA[:3])
+        table.add_rows(tuple(row) for row in CITY_DATA[3:])
+        assert table.rows == city_data.rows
+        assert table.get_string() == city_data.get_string()
+        store = table._rows
+        table.add_rows([["Canberra", 814, 456692, 616.4], ["Alice", 0, 0, 0]])
+        assert [type(column) for column in store.columns] == [
+            _DictColumn,
+            array,
+            array,
+            list,
+        ]
+        assert table.rows[-2:] == [["Canberra", 814, 456692, 616.4], ["Alice", 0, 0, 0]]
+
+    def test_dictionary_encoded(self) -> None:
+        from prettytable.prettytable import _MAX_DICT_SIZE, _DictColumn
+
+        rows = [["ok", "<eu>"], ["failed", None], ["ok", "<eu>"], ["ok", "us"]] * 50
+        expected = PrettyTable(["Status", "Region"])
+        expected.add_rows(rows)
+        table = PrettyTable(["Status", "Region"], storage="columnar")
+        table.add_rows(rows)
+        status, region = table._rows.columns
+        assert isinstance(status, _DictColumn)
+        assert status.values == ["ok", "failed"]
+        assert status.codes.tolist() == [0, 1, 0, 0] * 50
+        assert region.values == ["<eu>", None, "us"]
+
+        calls = []
+
+        def shout(field: str, value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        for other in (expected, table):
+            other.custom_format["Status"] = shout
+            other.none_format = "n/a"
+        assert table.get_string() == expected.get_string()
+        assert len(calls) == len(rows) + 2
+        assert table.get_html_string() == expected.get_html_string()
+        assert table.get_html_string(format=True) == expected.get_html_string(
+            format=True
+        )
+
+        table.add_row([3, "us"])
+        assert type(table._rows.columns[0]) is list
+        table.add_rows([["a", f"region {n}"] for n in range(_MAX_DICT_SIZE)])
+        assert type(table._rows.columns[1]) is list
+        assert table.rows[:4] == rows[:4]
+        assert table.rows[-1] == ["a", f"region {_MAX_DICT_SIZE - 1}"]
+
+    def test_dictionary_encoding_fails_cleanly(self) -> None:
+        from prettytable.prettytable import _MAX_DICT_SIZE, _DictColumn
+
+        column = _DictColumn.encode(["a", "b", "a"])
+        assert column is not None
+        with pytest.raises(TypeError):
+            column.extend(["c", 1])
+        with pytest.raises(OverflowError):
+            column.extend(str(n) for n in range(_MAX_DICT_SIZE))
+        assert column.values == ["a", "b"]
+        assert column._lookup == {"a": 0, "b": 1}
+        assert column.codes.tolist() == [0, 1, 0]
+        column.extend(["c", "a", "c"])
+        assert list(column) == ["a", "b", "a", "c", "a", "c"]
+        assert column.codes.tolist() == [0, 1, 0, 2, 0, 2]
+
+    def test_build_by_columns(self) -> None:
+        table = PrettyTable(storage="columnar")
+        table.add_column("Name", ["a", "b"])
+        table.add_column("Value", [1.5, 2.5])
+        assert table.rows == [["a", 1.5], ["b", 2.5]]
+        assert table.dividers == [False, False]
+        table.clear_rows()
+        assert table.storage == "columnar"
+        assert table.rows == []
+        table.add_row(["c", 3.5])
+        assert table.rows == [["c", 3.5]]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            PrettyTable(storage="rowwise")
+
+
+class TestDiskStorage:
+    @pytest.fixture
+    def disk_city_data(self) -> PrettyTable:
+        table = PrettyTable(CITY_DATA_HEADER, storage="disk", memory_budget=600)
+        for row in CITY_DATA:
+            table.add_row(row)
+        return table
+
+    def test_spills(self, disk_city_data: PrettyTable) -> None:
+        from prettytable.prettytable import _SpillStore
+
+        store = disk_city_data._rows
+        assert isinstance(store, _SpillStore)
+        assert 0 < len(store._head) < len(CITY_DATA)
+        assert len(store) == len(CITY_DATA)
+        assert disk_city_data.storage == "disk"
+        assert disk_city_data.memory_budget == 600
+
+    def test_same_output(
+        self, city_data: PrettyTable, disk_city_data: PrettyTable
+    ) -> None:
+        for kwargs in ({}, {"start": 2, "end": 5}, {"sortby": "Area"}):
+            assert disk_city_data.get_string(**kwargs) == city_data.get_string(**kwargs)
+            assert disk_city_data.get_csv_string(**kwargs) == city_data.get_csv_string(
+                **kwargs
+            )
+        assert disk_city_data.paginate(page_length=3) == city_data.paginate(
+            page_length=3
+        )
+        assert disk_city_data.rows == city_data.rows
+        assert disk_city_data[1:6].get_string() == city_data[1:6].get_string()
+        assert disk_city_data.copy().get_string() == city_data.get_string()
+
+    def test_sort_in_runs(self) -> None:
+        rows = [[i % 7, f"row {i}"] for i in range(3000)]
+        expected = PrettyTable(["Key", "Name"])
+        expected.add_rows(rows)
+        table = PrettyTable(["Key", "Name"], storage="disk", memory_budget=0)
+        table.add_rows(rows)
+        for kwargs in (
+            {"sortby": "Key", "sort_key": lambda row: row[0]},
+            {"sortby": "Key", "sort_key": lambda row: row[0], "reversesort": True},
+            {"sortby": "Name", "end": 10},
+            {"sortby": "Name", "start": 2990, "oldsortslice": True},
+        ):
+            assert table.get_string(**kwargs) == expected.get_string(**kwargs)
+
+    def test_column_operations(
+        self, city_data: PrettyTable, disk_city_data: PrettyTable
+    ) -> None:
+        for table in (city_data, disk_city_data):
+            table.add_column("Rank", list(range(7, 0, -1)))
+            table.add_autoindex()
+            table.del_column("Area")
+            table.del_row(5)
+            table.del_row(2)
+        assert disk_city_data.rows == city_data.rows
+        assert disk_city_data.get_string() == city_data.get_string()
+
+    def test_column_changes_rewrite_file(self) -> None:
+        import os
+
+        rows = [[i, f"row {i}"] for i in range(100)]
+        table = PrettyTable(["Key", "Name"], storage="disk", memory_budget=0)
+        table.add_rows(rows)
+        table.del_row(3)
+        store = table._rows
+        store._flush()
+        size = os.fstat(store._data.fileno()).st_size
+        for _ in range(3):
+            table.add_column("Twice", [row[0] * 2 for row in table.rows])
+            table.del_column("Twice")
+        store._flush()
+        assert os.fstat(store._data.fileno()).st_size <= size
+        table.add_autoindex()
+        assert table.rows == [[i, *row] for i, row in enumerate(rows[:3] + rows[4:], 1)]
+
+    def test_deleted_rows_free_budget(self) -> None:
+        from prettytable.prettytable import _row_size
+
+        rows = [[i, f"row {i}"] for i in range(10)]
+        budget = sum(map(_row_size, rows))
+        table = PrettyTable(["Key", "Name"], storage="disk", memory_budget=budget)
+        table.add_rows(rows)
+        table.del_row(0)
+        table.keep_last(5)
+        table.add_rows(rows[:5])
+        store = table._rows
+        assert len(store._head) == 10
+        assert store._head_size == budget
+        assert table.rows == rows[5:] + rows[:5]
+
+    def test_add_rows_in_batches(self) -> None:
+        from prettytable.prettytable import _PULL_BATCH_SIZE
+
+        rows = [[i] for i in range(_PULL_BATCH_SIZE + 10)]
+        table = PrettyTable(["Field 1"], storage="disk", memory_budget=0)
+        with pytest.raises(ValueError):
+            table.add_rows([*rows, [1, 2]])
+        assert table.rows == rows[:_PULL_BATCH_SIZE]
+        table.clear_rows()
+        assert table.rows == []
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            PrettyTable(storage="disk", memory_budget=-1)
+
+
+class TestWidthCache:
+    def test_cache_info(self) -> None:
+        cache = WidthCache(maxsize=2)
+        assert cache.width("日本") == 4
+        assert cache.width("日本") == 4
+        assert cache.width("한국") == 4
+        assert cache.width("\033[31mred\033[0m") == 3
+        assert cache.cache_info() == (1, 3, 2, 2)
+        cache.cache_clear()
+        assert cache.cache_info() == (0, 0, 2, 0)
+
+    def test_ascii_skips_cache(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.add_row(["abc", 123])
+        table.get_string()
+        assert table.width_cache is not None
+        assert table.width_cache.cache_info().misses == 0
+
+    def test_table_scope(self) -> None:
+        table = PrettyTable(["Field 1"])
+        table.add_rows([["日本"], ["日本"], ["한국"]])
+        table.get_string()
+        cache = table.width_cache
+        assert cache is not None
+        assert cache.cache_info() == (1, 2, 4096, 2)
+        table.get_string()
+        assert table.width_cache is cache
+        assert cache.cache_info() == (4, 2, 4096, 2)
+
+    def test_render_scope(self) -> None:
+        table = PrettyTable(["Field 1"], width_cache_scope="render")
+        table.add_rows([["日本"], ["日本"]])
+        table.get_string()
+        first = table.width_cache
+        table.get_string()
+        assert table.width_cache is not first
+        assert table.width_cache is not None
+        assert table.width_cache.cache_info() == (1, 1, 4096, 1)
+
+    def test_disabled(self) -> None:
+        table = PrettyTable(["Field 1"], width_cache_size=0)
+        table.add_row(["日本"])
+        expected = table.get_string(width_cache_size=10)
+        table.width_cache_scope = "render"
+        assert table.get_string() == expected
+
+    def test_invalid_scope(self) -> None:
+        with pytest.raises(ValueError):
+            PrettyTable(width_cache_scope="process")
+
+
+class TestRenderCache:
+    @staticmethod
+    def _fresh_string(table: PrettyTable, **kwargs) -> str:
+        return table.get_string(render_cache=False, **kwargs)
+
+    def test_version(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        versions = [table._version]
+        table.add_row([1, 2])
+        versions.append(table._version)
+        table.add_column("Field 3", [3])
+        versions.append(table._version)
+        table.del_row(0)
+        versions.append(table._version)
+        assert versions == sorted(set(versions))
+
+    def test_reused(self, city_data: PrettyTable) -> None:
+        city_data.render_cache = True
+        first = city_data.get_string()
+        assert city_data._rendered is not None
+        chunks = city_data._rendered.chunks
+        assert city_data.get_string() == first
+        assert city_data._rendered.chunks is chunks
+
+    @pytest.mark.parametrize("hrules", [HRuleStyle.FRAME, HRuleStyle.ALL])
+    def test_append_spliced(self, city_data: PrettyTable, hrules: HRuleStyle) -> None:
+        city_data.render_cache = True
+        city_data.hrules = hrules
+        city_data.get_string()
+        rendered = city_data._rendered
+        city_data.add_row(["Perth", 5386, 1554769, 869.4], divider=True)
+        city_data.add_row(["Darwin", 112, 120900, 1714.7])
+        assert city_data.get_string() == self._fresh_string(city_data)
+        assert rendered is not None
+        assert city_data._rendered is not None
+        assert city_data._rendered.head is rendered.head
+        assert city_data._rendered.shown == 9
+
+    def test_append_wider_row(self, city_data: PrettyTable) -> None:
+        city_data.render_cache = True
+        city_data.get_string()
+        city_data.add_row(["Alice Springs", 327, 25186, 282.8])
+        assert city_data.get_string() == self._fresh_string(city_data)
+        assert city_data._rendered is not None
+        assert city_data._rendered.shown == 8
+
+    def test_option_change(self, city_data: PrettyTable) -> None:
+        city_data.render_cache = True
+        city_data.get_string()
+        city_data.align["City name"] = "l"
+        assert city_data.get_string() == self._fresh_string(city_data)
+        city_data.border = False
+        assert city_data.get_string() == self._fresh_string(city_data)
+        assert city_data.get_string(fields=["City name"]) == self._fresh_string(
+            city_data, fields=["City name"]
+        )
+
+    def test_mutations(self, city_data: PrettyTable) -> None:
+        city_data.render_cache = True
+        city_data.get_string()
+        city_data.del_row(0)
+        assert city_data.get_string() == self._fresh_string(city_data)
+        city_data.add_divider()
+        city_data.add_row(["Perth", 5386, 1554769, 869.4])
+        assert city_data.get_string() == self._fresh_string(city_data)
+        city_data.del_column("Population")
+        assert city_data.get_string() == self._fresh_string(city_data)
+
+    def test_sorted(self, city_data: PrettyTable) -> None:
+        city_data.render_cache = True
+        city_data.sortby = "Area"
+        city_data.get_string()
+        city_data.add_row(["Perth", 5386, 1554769, 869.4])
+        assert city_data.get_string() == self._fresh_string(city_data)
+
+
+class TestWidthSample:
+    def test_whole_table(self, city_data: PrettyTable) -> None:
+        assert city_data.get_string(width_sample=7) == city_data.get_string()
+        assert city_data.get_string(
+            width_sample=3, sortby="Area", start=1, end=5
+        ) == city_data.get_string(sortby="Area", start=1, end=5)
+
+    def test_later_rows_wrapped(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"], width_sample=1)
+        table.add_rows([["a", 1], ["a much longer value", 2]])
+        assert (
+            table.get_string().strip()
+            == """
++---------+---------+
+| Field 1 | Field 2 |
++---------+---------+
+|    a    |    1    |
+|  a much |    2    |
+|  longer |         |
+|  value  |         |
++---------+---------+
+""".strip()
+        )
+
+    def test_rows_laid_out_lazily(self) -> None:
+        formatted: list[int] = []
+
+        def record(field: str, value: Any) -> str:
+            formatted.append(value)
+            return str(value)
+
+        table = PrettyTable(["Field 1"], width_sample=2)
+        table.custom_format["Field 1"] = record
+        table.add_rows([[i] for i in range(2000)])
+        lines = table.iter_lines()
+        for _ in range(6):
+            next(lines)
+        assert len(formatted) < 2000
+
+    def test_empty_sample(self) -> None:
+        table = PrettyTable(["Field 1"], header=False, width_sample=0)
+        table.add_row(["abc"])
+        assert table.get_string() == "+---+\n| a |\n| b |\n| c |\n+---+"
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            PrettyTable(width_sample=-1)
+
+
+class TestFixedWidth:
+    def test_fixed_width(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.add_rows([["a", "b"], ["much longer", "c"]])
+        table.fixed_width["Field 1"] = 5
+        assert (
+            table.get_string().strip()
+            == """
++-------+---------+
+| Field | Field 2 |
++-------+---------+
+|   a   |    b    |
+| much  |    c    |
+| longe |         |
+|   r   |         |
++-------+---------+
+""".strip()
+        )
+
+    def test_all_fields(self, city_data: PrettyTable) -> None:
+        city_data.fixed_width = 9
+        header = city_data.get_string().splitlines()[1]
+        assert header == ("| City name |    Area   | Populatio | Annual Ra |")
+        assert city_data.get_string(fixed_width=4).splitlines()[1] == (
+            "| City | Area | Popu | Annu |"
+        )
+
+
+class TestParallelFormatting:
+    @pytest.fixture
+    def table(self) -> PrettyTable:
+        table = PrettyTable(["Field 1", "Field 2", "Field 3"])
+        table.add_rows([[i, i / 3, f"row {i}"] for i in range(100)])
+        table.float_format["Field 2"] = ".2"
+        table.custom_format["Field 3"] = "<{1}>".format
+        return table
+
+    @staticmethod
+    def _render(table: PrettyTable, **kwargs: Any) -> list[str]:
+        return [
+            table.get_string(**kwargs),
+            table.get_html_string(**kwargs),
+            table.get_html_string(format=True, **kwargs),
+            table.get_latex_string(**kwargs),
+            table.get_mediawiki_string(**kwargs),
+        ]
+
+    @pytest.mark.parametrize("pool", ["thread", "process"])
+    def test_same_output(self, table: PrettyTable, pool: str) -> None:
+        expected = self._render(table)
+        assert (
+            self._render(table, format_workers=3, format_pool=pool, format_chunk_size=7)
+            == expected
+        )
+
+    def test_streamed(self, table: PrettyTable) -> None:
+        expected = table.get_string()
+        table.format_workers = 2
+        table.format_chunk_size = 10
+        assert "\n".join(table.iter_lines(width_sample=100)) == expected
+
+    def test_one_pool_per_render(
+        self, table: PrettyTable, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import concurrent.futures
+
+        pools = []
+
+        class Pool(concurrent.futures.ThreadPoolExecutor):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", Pool)
+        expected = table.get_string(width_sample=5)
+        lines = table.iter_lines(width_sample=5, format_workers=2, format_chunk_size=4)
+        assert "\n".join(lines) == expected
+        assert len(pools) == 1
+        assert pools[0]._shutdown
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            PrettyTable(format_pool="fiber")
+        with pytest.raises(ValueError):
+            PrettyTable(format_chunk_size=0)
+
+
+class TestConcurrentRendering:
+    def test_threads(self, city_data: PrettyTable) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        city_data.title = "Australian cities"
+        variants: list[dict[str, Any]] = [
+            {},
+            {"fields": ["City name", "Area"]},
+            {"max_table_width": 40},
+            {"vrules": VRuleStyle.FRAME, "hrules": HRuleStyle.ALL},
+        ]
+        expected = [city_data.get_string(**kwargs) for kwargs in variants]
+        html = city_data.get_html_string()
+
+        def render(i: int) -> tuple[str, str]:
+            kwargs = variants[i % len(variants)]
+            return city_data.get_string(**kwargs), city_data.get_html_string()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(render, range(200)))
+        for i, (text, html_text) in enumerate(results):
+            assert text == expected[i % len(variants)]
+            assert html_text == html
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    def test_lazy_rows(self, storage: str) -> None:
+        import sys
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def rows() -> Iterator[list[Any]]:
+            for i in range(3000):
+                if i % 100 == 0:
+                    # Let the other threads in while reading the rows
+                    time.sleep(0.0005)
+                yield [i, str(i)]
+
+        expected = PrettyTable(["a", "b"])
+        expected.add_rows(rows())
+        expected_text = expected.get_string(end=2000)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(5):
+                table = PrettyTable(["a", "b"], storage=storage, memory_budget=0)
+                table.add_rows(rows(), lazy=True)
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    texts = list(
+                        executor.map(lambda _: table.get_string(end=2000), range(4))
+                    )
+                assert texts == [expected_text] * 4
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_title_leaves_options_alone(self, city_data: PrettyTable) -> None:
+        city_data.title = "Australian cities"
+        options = city_data._get_options({})
+        next(city_data._iter_chunks(options))
+        assert options["vrules"] == VRuleStyle.ALL
+
+
 class TestFields:
     def test_fields_at_class_declaration(self) -> None:
         table = PrettyTable(
@@ -1563,6 +2800,54 @@ class TestGeneralOutput:
             helper_table.get_formatted_string("pdf")
 
 
+class TestStreaming:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"border": False},
+            {"header": False},
+            {"hrules": HRuleStyle.ALL},
+            {"title": "Cities", "sortby": "Area"},
+            {"start": 2, "end": 5},
+        ],
+    )
+    def test_iter_lines(self, city_data: PrettyTable, kwargs: dict[str, Any]) -> None:
+        lines = list(city_data.iter_lines(**kwargs))
+        assert "\n".join(lines) == city_data.get_string(**kwargs)
+        assert all("\n" not in line for line in lines)
+
+    def test_iter_lines_multiline_cells(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"])
+        table.add_row(["a\nb\nc", "d"])
+        table.add_row(["e", "f"], divider=True)
+        table.add_row(["g", "h\ni"])
+        lines = list(table.iter_lines(hrules=HRuleStyle.ALL))
+        assert lines == table.get_string(hrules=HRuleStyle.ALL).split("\n")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"border": False, "preserve_internal_border": True}, {"title": "T"}],
+    )
+    def test_write_to(self, city_data: PrettyTable, kwargs: dict[str, Any]) -> None:
+        fp = io.StringIO()
+        city_data.write_to(fp, **kwargs)
+        assert fp.getvalue() == city_data.get_string(**kwargs)
+
+    def test_write_to_orgmode(self, city_data: PrettyTable) -> None:
+        city_data.set_style(TableStyle.ORGMODE)
+        fp = io.StringIO()
+        city_data.write_to(fp)
+        assert fp.getvalue() == city_data.get_string()
+
+    def test_empty_table(self) -> None:
+        table = PrettyTable(["Field 1", "Field 2"], print_empty=False)
+        fp = io.StringIO()
+        table.write_to(fp)
+        assert fp.getvalue() == ""
+        assert list(table.iter_lines()) == []
+
+
 class TestDeprecations:
     @pytest.mark.parametrize(
         "module_name",
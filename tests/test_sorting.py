@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 from test_prettytable import CITY_DATA, CITY_DATA_HEADER
 
 from prettytable import PrettyTable
@@ -117,3 +118,135 @@ class TestSorting:
 +-----------+------+------------+-----------------+"""
             == table.get_string().strip()
         )
+
+    def test_sort_keeps_order_of_ties(self) -> None:
+        table = PrettyTable(["Key", "Value"])
+        table.add_rows([["b", 3], ["a", 2], ["b", 1], ["a", 4]])
+        assert table.get_string(sortby="Key").splitlines()[3:7] == [
+            "|  a  |   2   |",
+            "|  a  |   4   |",
+            "|  b  |   3   |",
+            "|  b  |   1   |",
+        ]
+        assert table.get_string(sortby="Key", reversesort=True).splitlines()[3:7] == [
+            "|  b  |   3   |",
+            "|  b  |   1   |",
+            "|  a  |   2   |",
+            "|  a  |   4   |",
+        ]
+
+    def test_sort_order_reused(self, city_data: PrettyTable) -> None:
+        city_data.sortby = "Area"
+        city_data.render_cache = True
+        first = city_data.get_string(start=0, end=3)
+        order = city_data._sort_order
+        assert order is not None
+        assert city_data.get_string(start=0, end=3) == first
+        city_data.get_string(start=3, end=6)
+        city_data.get_html_string()
+        assert city_data._sort_order is order
+
+        city_data.reversesort = True
+        city_data.get_string()
+        assert city_data._sort_order is not order
+        city_data.add_row(["Canberra", 814, 467000, 616.4])
+        assert city_data._sort_order is None
+        assert "Canberra" in city_data.get_string(start=6, end=7)
+        city_data.del_row(0)
+        assert city_data._sort_order is None
+
+    def test_sort_order_not_kept_with_callables(self) -> None:
+        table = PrettyTable(["a", "b"])
+        table.add_rows([[i, i % 3] for i in range(9)])
+        wanted = {0}
+        options = {"sortby": "a", "end": 3, "row_filter": lambda row: row[1] in wanted}
+        assert table.get_csv_string(**options).split()[1:] == ["0,0", "3,0", "6,0"]
+        wanted = {1}
+        assert table.get_csv_string(**options).split()[1:] == ["1,1", "4,1", "7,1"]
+
+        sign = 1
+        options = {"sortby": "a", "end": 2, "sort_key": lambda row: sign * row[0]}
+        assert table.get_csv_string(**options).split()[1:] == ["0,0", "1,1"]
+        sign = -1
+        assert table.get_csv_string(**options).split()[1:] == ["8,2", "7,1"]
+        assert table._sort_order is None
+
+    def test_sort_order_not_kept_by_default(self) -> None:
+        table = PrettyTable(["a"], sortby="a")
+        table.add_rows([[3], [1], [2]])
+        assert table.get_csv_string().split() == ["a", "1", "2", "3"]
+        assert table._sort_order is None
+        # Changes to the row lists in place aren't seen by the table
+        table.rows[0][0] = 0
+        assert table.get_csv_string().split() == ["a", "0", "1", "2"]
+
+    def test_sort_order_after_changes(self) -> None:
+        for storage in ("rows", "columnar"):
+            table = PrettyTable(["Foo"], storage=storage, sortby="Foo")
+            table.add_rows([[3], [1], [2]])
+            assert table.get_csv_string().split() == ["Foo", "1", "2", "3"]
+            table.del_rows_where(lambda row: row[0] == 2)
+            assert table.get_csv_string().split() == ["Foo", "1", "3"]
+            table.add_column("Bar", ["x", "y"])
+            assert table.get_csv_string().split() == ["Foo,Bar", "1,y", "3,x"]
+            table.add_autoindex(virtual=True)
+            assert table.get_csv_string().split() == ["Index,Foo,Bar", "2,1,y", "1,3,x"]
+            table.sortby = "Index"
+            table.reversesort = True
+            assert table.get_csv_string().split() == ["Index,Foo,Bar", "2,1,y", "1,3,x"]
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_top_rows(self, storage: str, reverse: bool) -> None:
+        # Few distinct values, so there are plenty of ties
+        rows = [[i % 7, i] for i in range(500)]
+        table = PrettyTable(["Key", "Order"], storage=storage)
+        table.add_rows(rows)
+        expected = sorted(rows, key=lambda row: row[0], reverse=reverse)
+        for start, end in [(0, 1), (0, 10), (3, 12), (0, 15)]:
+            options = table._get_options(
+                {"sortby": "Key", "reversesort": reverse, "start": start, "end": end}
+            )
+            assert table._get_rows(options) == expected[start:end]
+
+    def test_top_rows_order_reused(self) -> None:
+        table = PrettyTable(["Value"], sortby="Value", render_cache=True)
+        table.add_rows([[i] for i in range(1000, 0, -1)])
+        assert table.get_csv_string(end=3).split() == ["Value", "1", "2", "3"]
+        order = table._sort_order
+        assert order is not None
+        assert order.limit == 3
+        assert table.get_csv_string(start=1, end=2).split() == ["Value", "2"]
+        assert table._sort_order is order
+        assert table.get_csv_string(end=5).split()[-1] == "5"
+        assert table._sort_order.limit == 5
+        assert table.get_csv_string(end=100).split()[-1] == "100"
+        order = table._sort_order
+        assert order.limit is None
+        assert table.get_csv_string(start=500, end=501).split() == ["Value", "501"]
+        assert table._sort_order is order
+
+    @pytest.mark.parametrize("storage", ["rows", "columnar", "disk"])
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_sorted_by_index(self, storage: str, reverse: bool) -> None:
+        table = PrettyTable(
+            ["Player", "Score"], storage=storage, sortby="Score", reversesort=reverse
+        )
+        table.create_index("Score", "sorted")
+        scores = [5, 3, 5, 8, 1, 3, 8, 5]
+        rows = []
+        for player, score in enumerate(scores):
+            rows.append([player, score])
+            table.add_row([player, score])
+            expected = sorted(rows, key=lambda row: row[1], reverse=reverse)
+            assert table._get_rows(table._get_options({})) == expected
+            for start, end in [(0, 3), (2, 5)]:
+                options = table._get_options({"start": start, "end": end})
+                assert table._get_rows(options) == expected[start:end]
+        # Nothing was sorted
+        assert table._sort_order is None
+
+        table.del_row(0)
+        expected = sorted(rows[1:], key=lambda row: row[1], reverse=reverse)
+        assert table._get_rows(table._get_options({})) == expected
+        assert table._sort_order is None